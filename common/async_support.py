@@ -0,0 +1,59 @@
+"""
+异步支持 - ASGI 部署下的原生异步视图
+
+同步 APIView 在 ASGI 下每个请求都要切换到工作线程执行；
+AsyncAPIView 的处理方法为协程，直接在事件循环中执行，ORM 查询通过 Django 异步 ORM（acount、async for）完成。
+
+与 APIView 保持一致：
+- 处理方法返回 Result.success(...)，按 REST_FRAMEWORK 的默认渲染器输出（驼峰、日期格式一致）
+- 异常交给 REST_FRAMEWORK 配置的异常处理器（BusinessException → {code: 0, msg}）
+
+用法：
+
+    class AsyncEmpPageView(AsyncAPIView):
+        async def get(self, request):
+            pageResult = await EmpService.apage(params)
+            return Result.success(pageResult)
+"""
+
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+async def alist(queryset) -> list:
+    """异步读取查询集为列表"""
+    return [item async for item in queryset]
+
+
+class AsyncAPIView(View):
+    """原生异步视图基类（处理方法必须全部为 async def）"""
+    
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            response = await super().dispatch(request, *args, **kwargs)
+        except Exception as exc:
+            response = api_settings.EXCEPTION_HANDLER(exc, {'view': self, 'request': request})
+            if response is None:
+                raise
+        if isinstance(response, Response):
+            response = self.render(response)
+        return response
+    
+    def render(self, response: Response) -> HttpResponse:
+        """
+        渲染 DRF Response（在事件循环中直接渲染，
+        不返回可延迟渲染的响应，避免 Django 再切换到线程执行 render）
+        """
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        content = renderer.render(response.data, renderer.media_type,
+                                  {'view': self, 'request': self.request, 'response': response})
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        rendered = HttpResponse(content, status=response.status_code, content_type=content_type)
+        for name, value in response.items():
+            if name.lower() != 'content-type':
+                rendered[name] = value
+        return rendered
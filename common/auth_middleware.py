@@ -7,6 +7,7 @@
 """
 
 import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import JsonResponse
 from .jwt_utils import parse_jwt
 
@@ -20,11 +21,35 @@ class TokenAuthMiddleware:
     
     # 放行的 URL 路径（包含即放行）
     WHITELIST = ['/login', '/media/', '/static/']
+    # 允许通过查询参数 token 传递令牌的路径（EventSource 无法设置请求头）
+    QUERY_TOKEN_PATHS = ['/events/stream']
+    
+    # 同时支持同步（WSGI）和异步（ASGI）请求链，ASGI 下异步视图不因本中间件切换线程
+    sync_capable = True
+    async_capable = True
     
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
     
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.authenticate(request)
+        if response is not None:
+            return response
+        return self.get_response(request)
+    
+    async def __acall__(self, request):
+        response = self.authenticate(request)
+        if response is not None:
+            return response
+        return await self.get_response(request)
+    
+    def authenticate(self, request):
+        """校验令牌 - 通过时返回 None（放行），否则返回 401 响应"""
         # 1. 获取请求路径
         path = request.path
         
@@ -32,10 +57,12 @@ class TokenAuthMiddleware:
         for pattern in self.WHITELIST:
             if pattern in path:
                 logger.info(f"白名单请求，直接放行: {path}")
-                return self.get_response(request)
+                return None
         
         # 3. 获取请求头中的令牌（token）
         token = request.headers.get('token')
+        if not token and path in self.QUERY_TOKEN_PATHS:
+            token = request.GET.get('token')
         
         # 4. 判断令牌是否存在
         if not token:
@@ -56,4 +83,4 @@ class TokenAuthMiddleware:
         
         # 6. 放行
         logger.info(f"令牌合法，放行: {path}")
-        return self.get_response(request)
+        return None
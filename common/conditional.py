@@ -0,0 +1,119 @@
+"""
+条件请求装饰器 - GET 接口支持 ETag / Last-Modified，数据未变化时返回 304
+
+使用方法：在视图的 get 方法上添加 @conditional_get 装饰器，由 Service 提供数据版本
+
+    class DeptListView(APIView):
+        @conditional_get(lambda request: DeptService.getVersion())
+        def get(self, request):
+            ...
+
+ETag 只由请求路径、查询参数和 Service 返回的数据版本计算
+（通常为 MAX(update_time) + COUNT，一次聚合查询，不执行列表查询和序列化）。
+版本完全来自数据库，各进程、各节点对同一数据计算出相同的 ETag，不依赖进程内缓存。
+
+update_time 只精确到秒，同一秒内的多次修改版本不变：最近 UNSETTLED_SECONDS 秒内有修改时
+queryset_version / row_version 返回 None，不返回 ETag，避免同一秒内的后续修改被旧 ETag 的 304 掩盖
+
+版本函数返回 None 时（如数据不存在、最近刚修改）不做条件判断，直接执行视图；
+视图可从 request.data_version 读取已计算的数据版本（跳过时为 None），按版本缓存结果时不必再查询一次
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from functools import wraps
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+# 最近修改的时间窗口（秒）：update_time 精确到秒，另留 1 秒容忍多节点时钟误差
+UNSETTLED_SECONDS = 2
+
+
+def conditional_get(version_func):
+    """
+    条件请求装饰器
+
+    Args:
+        version_func: version_func(request, *args, **kwargs) -> str 或 (str, 最后修改时间)；返回 None 时跳过
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            # 1. 获取数据版本
+            version = version_func(request, *args, **kwargs)
+            last_modified = None
+            if isinstance(version, tuple):
+                version, last_modified = version
+            request.data_version = version
+            if version is None:
+                return func(self, request, *args, **kwargs)
+            source = f"{request.get_full_path()}|{version}"
+            etag = f'"{hashlib.md5(source.encode()).hexdigest()}"'
+
+            # 2. 版本未变化：直接返回 304（If-None-Match 优先于 If-Modified-Since）
+            if _not_modified(request, etag, last_modified):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                _set_headers(response, etag, last_modified)
+                return response
+
+            # 3. 执行视图，成功时附加验证头
+            response = func(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                _set_headers(response, etag, last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def queryset_version(*querysets):
+    """数据版本 - 每个查询集一次聚合查询：MAX(update_time) + COUNT；最近刚修改时返回 None"""
+    parts = []
+    for queryset in querysets:
+        result = queryset.order_by().aggregate(last=Max('update_time'), count=Count('id'))
+        if _unsettled(result['last']):
+            return None
+        last = result['last'].isoformat() if result['last'] else ''
+        parts.append(f"{last}/{result['count']}")
+    return ','.join(parts)
+
+
+def row_version(queryset):
+    """单行数据版本 - 返回 (版本, update_time)，数据不存在或最近刚修改时返回 None"""
+    row = queryset.values_list('id', 'update_time').first()
+    if row is None or _unsettled(row[1]):
+        return None
+    last = row[1].isoformat() if row[1] else ''
+    return f"{row[0]}/{last}", row[1]
+
+
+def _unsettled(last: datetime) -> bool:
+    """最近 UNSETTLED_SECONDS 秒内（或时钟误差导致晚于当前时间）有修改，同一秒内可能还有修改"""
+    if last is None:
+        return False
+    now = timezone.now() if timezone.is_aware(last) else datetime.now()
+    return last > now - timedelta(seconds=UNSETTLED_SECONDS)
+
+
+def _not_modified(request, etag: str, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+    if_modified_since = request.headers.get('If-Modified-Since')
+    if if_modified_since and last_modified is not None:
+        since = parse_http_date_safe(if_modified_since)
+        return since is not None and int(last_modified.timestamp()) <= since
+    return False
+
+
+def _set_headers(response, etag: str, last_modified: datetime) -> None:
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    # 浏览器每次使用缓存前都向服务端验证
+    response['Cache-Control'] = 'no-cache'
@@ -0,0 +1,47 @@
+"""
+事件流模块 - 服务端推送（SSE）的变更事件
+
+根据 settings.EVENT_STREAM['BACKEND'] 选择消息代理：
+- local：进程内分发，单进程部署；多进程 / 多节点部署时每个进程只能收到本进程产生的事件，
+  需实现共享的代理（如基于 Redis Pub/Sub，继承 BaseBroker）
+
+使用方法：
+
+    from common.events import publish
+    publish('change', {'resource': 'emp', 'action': 'update', 'ids': [1]})
+"""
+
+import threading
+from django.conf import settings
+from django.utils.module_loading import import_string
+from .base import BaseBroker, Event, Subscription
+from .local import LocalBroker
+
+# 后端别名 → 实现类路径
+BACKENDS = {
+    'local': 'common.events.local.LocalBroker',
+}
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> BaseBroker:
+    """获取消息代理（进程内单例）"""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = settings.EVENT_STREAM
+                backend = config.get('BACKEND', 'local')
+                broker_class = import_string(BACKENDS.get(backend, backend))
+                _broker = broker_class(config)
+    return _broker
+
+
+def publish(type: str, data: dict) -> None:
+    """发布事件（任意线程调用，不阻塞）"""
+    get_broker().publish(type, data)
+
+
+__all__ = ['BaseBroker', 'Event', 'Subscription', 'LocalBroker', 'get_broker', 'publish']
@@ -0,0 +1,75 @@
+"""
+消息代理基类 - 定义事件发布和订阅的统一接口
+
+事件 ID 为 "代号-序号"：代号标识事件来源（如进程启动时生成），序号单调递增；
+客户端断线重连时通过 Last-Event-ID 从历史事件续传，代号不一致或历史已不完整时收到 reset 事件，应重新拉取数据
+"""
+
+import asyncio
+from collections import namedtuple
+
+# 事件：id 事件 ID，type 事件类型，data 已编码的 JSON 字符串（每个事件只编码一次，分发给所有订阅者）
+Event = namedtuple('Event', ['id', 'type', 'data'])
+
+# 订阅者缓冲区溢出标记：订阅者消费过慢，结束本次连接，由客户端携带 Last-Event-ID 重连续传
+OVERFLOW = object()
+
+
+class Subscription:
+    """
+    订阅 - 每个 SSE 连接一个，持有有界缓冲区
+
+    在事件循环中创建和消费，发布方可能在其他线程，通过 call_soon_threadsafe 投递
+    """
+
+    def __init__(self, loop, buffer_size: int, types=None):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=buffer_size)
+        self.types = set(types) if types else None
+        # 订阅时需要补发的历史事件
+        self.backlog = []
+        # 是否需要通知客户端重新拉取数据（无法续传），值为当前最新事件 ID
+        self.reset = None
+        self.overflowed = False
+
+    def deliver(self, event: Event) -> None:
+        """投递事件（任意线程）"""
+        if self.types is None or event.type in self.types:
+            self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: Event) -> None:
+        if self.overflowed:
+            return
+        if self.queue.full():
+            # 丢弃积压的事件，通知消费方结束连接
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+            return
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float):
+        """等待下一个事件，超时返回 None"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class BaseBroker:
+    """消息代理基类"""
+
+    def __init__(self, options: dict):
+        self.options = options
+
+    def publish(self, type: str, data: dict) -> None:
+        """发布事件（任意线程调用，不阻塞）"""
+        raise NotImplementedError
+
+    def subscribe(self, last_event_id: str = None, types=None) -> Subscription:
+        """创建订阅（在事件循环中调用），last_event_id 为客户端最后收到的事件 ID"""
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        raise NotImplementedError
@@ -0,0 +1,63 @@
+"""
+进程内消息代理 - 发布的事件直接分发给本进程的订阅者
+
+保留最近 HISTORY_SIZE 个事件用于断线续传；事件 ID 代号在进程启动时生成，进程重启后客户端会收到 reset 事件
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from collections import deque
+from .base import BaseBroker, Event, Subscription
+
+
+class LocalBroker(BaseBroker):
+    """进程内消息代理"""
+
+    def __init__(self, options: dict):
+        super().__init__(options)
+        self.epoch = uuid.uuid4().hex[:8]
+        self.sequence = 0
+        self.history = deque(maxlen=options.get('HISTORY_SIZE', 1000))
+        self.subscribers = set()
+        self.lock = threading.Lock()
+
+    def publish(self, type: str, data: dict) -> None:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+        with self.lock:
+            self.sequence += 1
+            event = Event(f"{self.epoch}-{self.sequence}", type, payload)
+            self.history.append((self.sequence, event))
+            subscribers = list(self.subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except RuntimeError:
+                # 订阅者的事件循环已关闭
+                self.unsubscribe(subscription)
+
+    def subscribe(self, last_event_id: str = None, types=None) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self.options.get('BUFFER_SIZE', 100), types)
+        with self.lock:
+            if last_event_id:
+                since = self._parse_sequence(last_event_id)
+                oldest = self.history[0][0] if self.history else self.sequence + 1
+                if since is None or since > self.sequence or since < oldest - 1:
+                    subscription.reset = f"{self.epoch}-{self.sequence}"
+                else:
+                    subscription.backlog = [event for sequence, event in self.history if sequence > since
+                                            and (subscription.types is None or event.type in subscription.types)]
+            self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            self.subscribers.discard(subscription)
+
+    def _parse_sequence(self, event_id: str):
+        """解析事件 ID 中的序号，代号不是本进程时返回 None"""
+        epoch, _, sequence = event_id.partition('-')
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
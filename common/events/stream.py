@@ -0,0 +1,39 @@
+"""
+SSE 响应流 - 把订阅的事件编码为 text/event-stream
+
+    id: <事件 ID>
+    event: <事件类型>
+    data: <JSON>
+
+空闲时每 HEARTBEAT 秒发送注释行保持连接；连接持续 MAX_DURATION 秒后结束，由客户端自动重连（重新认证）
+"""
+
+import asyncio
+from .base import OVERFLOW
+
+
+async def sse_stream(broker, subscription, options: dict):
+    """异步生成器 - 逐条输出 SSE 消息，客户端断开或结束时取消订阅"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + options.get('MAX_DURATION', 3600)
+    heartbeat = options.get('HEARTBEAT', 15)
+    try:
+        yield f"retry: {options.get('RETRY', 3000)}\n\n"
+        if subscription.reset:
+            yield _format(subscription.reset, 'reset', '{}')
+        for event in subscription.backlog:
+            yield _format(*event)
+        while loop.time() < deadline:
+            event = await subscription.get(timeout=min(heartbeat, max(deadline - loop.time(), 0)))
+            if event is None:
+                yield ": ping\n\n"
+            elif event is OVERFLOW:
+                break
+            else:
+                yield _format(*event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _format(id: str, type: str, data: str) -> str:
+    return f"id: {id}\nevent: {type}\ndata: {data}\n\n"
@@ -0,0 +1,47 @@
+"""
+日期时间输出格式 - 与 DRF DateTimeField / DateField 的 to_representation 一致
+
+格式取自 REST_FRAMEWORK 的 DATETIME_FORMAT / DATE_FORMAT，
+供投影序列化器（management.serializers.projection）和 JSON 渲染器（common.renderers）共用
+"""
+
+ISO_8601 = 'iso-8601'
+
+
+def datetime_formatter(output_format):
+    """datetime 格式化函数（值非空时调用）"""
+    if output_format is None:
+        return identity
+    if output_format.lower() == ISO_8601:
+        def format_iso(value):
+            value = value.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return format_iso
+    if output_format == '%Y-%m-%d %H:%M:%S':
+        # 常用格式直接拼接，比 strftime 快；年份不足 4 位时 strftime 的输出与平台有关，交给 strftime
+        def format_fast(value):
+            if value.year < 1000:
+                return value.strftime(output_format)
+            return (f"{value.year}-{value.month:02d}-{value.day:02d} "
+                    f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}")
+        return format_fast
+    return lambda value: value.strftime(output_format)
+
+
+def date_formatter(output_format):
+    """date 格式化函数（值非空时调用）"""
+    if output_format is None:
+        return identity
+    if output_format.lower() == ISO_8601:
+        return lambda value: value.isoformat()
+    if output_format == '%Y-%m-%d':
+        def format_fast(value):
+            if value.year < 1000:
+                return value.strftime(output_format)
+            return f"{value.year}-{value.month:02d}-{value.day:02d}"
+        return format_fast
+    return lambda value: value.strftime(output_format)
+
+
+def identity(value):
+    return value
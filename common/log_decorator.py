@@ -7,6 +7,9 @@
         @log_operation
         def post(self, request):
             ...
+
+视图声明了 cache_tags 时，写操作成功后同时失效这些标签下的响应缓存（common.response_cache）
+日志保存后发布 log 事件（common.events），看板无需轮询日志列表
 """
 
 import json
@@ -14,6 +17,8 @@ import time
 import logging
 from datetime import datetime
 from functools import wraps
+from .events import publish
+from .response_cache import invalidate_tags
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +40,17 @@ def log_operation(func):
         # 2. 执行原方法
         result = func(self, request, *args, **kwargs)
         
-        # 3. 计算耗时
+        # 3. 失效相关的响应缓存
+        invalidate_tags(*getattr(self, 'cache_tags', ()))
+        
+        # 4. 计算耗时
         end_time = time.time()
         cost_time = int((end_time - start_time) * 1000)  # 转换为毫秒
         
-        # 4. 获取当前用户ID（从中间件注入的 request.emp_id）
+        # 5. 获取当前用户ID（从中间件注入的 request.emp_id）
         emp_id = getattr(request, 'emp_id', None)
         
-        # 5. 获取请求参数
+        # 6. 获取请求参数
         try:
             method_params = json.dumps(request.data, ensure_ascii=False, default=str)
             if len(method_params) > 2000:
@@ -50,7 +58,7 @@ def log_operation(func):
         except Exception:
             method_params = str(request.data)[:2000]
         
-        # 6. 获取返回值
+        # 7. 获取返回值
         try:
             return_value = json.dumps(result.data, ensure_ascii=False, default=str)
             if len(return_value) > 2000:
@@ -58,9 +66,9 @@ def log_operation(func):
         except Exception:
             return_value = str(result.data)[:2000] if hasattr(result, 'data') else ''
         
-        # 7. 构建日志对象并保存
+        # 8. 构建日志对象并保存，发布 log 事件
         try:
-            OperateLog.objects.create(
+            operate_log = OperateLog.objects.create(
                 operate_emp_id=emp_id,
                 operate_time=datetime.now(),
                 class_name=self.__class__.__name__,
@@ -70,6 +78,14 @@ def log_operation(func):
                 cost_time=cost_time
             )
             logger.info(f"记录操作日志：{self.__class__.__name__}.{request.method}, 耗时: {cost_time}ms")
+            publish('log', {
+                'id': operate_log.id,
+                'operateEmpId': emp_id,
+                'operateTime': operate_log.operate_time.strftime('%Y-%m-%d %H:%M:%S'),
+                'className': operate_log.class_name,
+                'methodName': operate_log.method_name,
+                'costTime': cost_time,
+            })
         except Exception as e:
             logger.error(f"记录操作日志失败：{e}")
         
@@ -0,0 +1,25 @@
+"""
+JSON 解析器 - 安装了 orjson 时使用 orjson 解析请求体（JSON_RENDERER['ENGINE']），否则与 DRF JSONParser 相同
+
+请求体的键名保持原样（驼峰），Service 按驼峰键读取（如 data.get('idCard')），不做下划线转换
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser as BaseJSONParser
+from .renderers import orjson
+
+
+class JSONParser(BaseJSONParser):
+    """JSON 解析器（REST_FRAMEWORK['DEFAULT_PARSER_CLASSES']）"""
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        # orjson 只接受 UTF-8（JSON 规范要求的编码），其他编码交给 DRF
+        if orjson is None or settings.JSON_RENDERER['ENGINE'] == 'json' or encoding.lower() not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        # 与 DRF 一致，NaN / Infinity 视为格式错误
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,135 @@
+"""
+驼峰 JSON 渲染器 - 替代 djangorestframework_camel_case.render.CamelCaseJSONRenderer
+
+原渲染器对每个响应的每个 dict 的每个键都执行一次正则替换（结果构造为 OrderedDict），再由标准库 json 编码。
+本渲染器：
+- 键名转换结果缓存在进程内的有界表中（JSON_RENDERER['KEY_CACHE_SIZE']），接口的字段名是有限集合，基本只转换一次
+- 转换键名的同时按 REST_FRAMEWORK 的 DATETIME_FORMAT / DATE_FORMAT 格式化 date / datetime，
+  不再交给编码器的 default 回调（原来输出为 ISO 8601）
+- 安装了 orjson 时使用 orjson 编码（JSON_RENDERER['ENGINE']），否则使用标准库 json；
+  两者输出一致（紧凑分隔符、中文不转义、转义 U+2028 / U+2029），只有极大 / 极小浮点数的指数写法不同（1e16 / 1e+16）
+- NaN / Infinity 与标准库一致：STRICT_JSON（默认）时报错，orjson 不会静默输出 null；非严格模式只使用标准库
+
+键名转换规则与原渲染器相同（user_name → userName，含数字：image_2x → image2x）
+"""
+
+import math
+import re
+from datetime import date, datetime
+from django.conf import settings
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+from .formats import date_formatter, datetime_formatter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CAMELIZE_PATTERN = re.compile(r"[a-z0-9]?_[a-z0-9]")
+
+# 与标准库 json 的报错信息一致
+NON_FINITE_MESSAGE = "Out of range float values are not JSON compliant"
+
+# 键名 → 驼峰键名
+_camel_keys = {}
+
+
+def camel_key(key: str) -> str:
+    """snake_case 键名转 camelCase（结果缓存）"""
+    camel = _camel_keys.get(key)
+    if camel is None:
+        camel = CAMELIZE_PATTERN.sub(_to_camel, key) if '_' in key else key
+        if len(_camel_keys) >= settings.JSON_RENDERER['KEY_CACHE_SIZE']:
+            _camel_keys.clear()
+        _camel_keys[key] = camel
+    return camel
+
+
+def _to_camel(match) -> str:
+    group = match.group()
+    if len(group) == 3:
+        return group[0] + group[2].upper()
+    return group[1].upper()
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """驼峰 JSON 渲染器（REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']）"""
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        data = _Converter(self.strict).convert(data)
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is None and self.use_orjson():
+            try:
+                content = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError as e:
+                # orjson 把 default 中的异常包装为 TypeError，还原为与标准库相同的 ValueError
+                if isinstance(e.__cause__, ValueError):
+                    raise e.__cause__ from None
+                raise
+            return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return super().render(data, accepted_media_type, renderer_context)
+    
+    def use_orjson(self) -> bool:
+        """
+        orjson 的输出固定为紧凑格式、不转义非 ASCII 字符、NaN 输出为 null，与配置不同时使用标准库
+        （非严格模式下标准库输出 NaN / Infinity）
+        """
+        engine = settings.JSON_RENDERER['ENGINE']
+        if engine == 'json' or orjson is None:
+            return False
+        return self.compact and not self.ensure_ascii and self.strict
+
+
+class _Converter:
+    """一次渲染的数据转换：键名转驼峰，date / datetime 按配置格式化，严格模式下 NaN / Infinity 报错"""
+    
+    def __init__(self, strict: bool = True):
+        self.format_datetime = datetime_formatter(api_settings.DATETIME_FORMAT)
+        self.format_date = date_formatter(api_settings.DATE_FORMAT)
+        self.strict = strict
+    
+    def convert(self, data):
+        kind = type(data)
+        if kind is str or kind is int or kind is bool or data is None:
+            return data
+        if kind is float:
+            if self.strict and not math.isfinite(data):
+                raise ValueError(NON_FINITE_MESSAGE)
+            return data
+        if isinstance(data, dict):
+            result = {}
+            for key, value in data.items():
+                if isinstance(key, Promise):
+                    key = force_str(key)
+                result[camel_key(key) if isinstance(key, str) else key] = self.convert(value)
+            return result
+        if kind is list or kind is tuple:
+            return [self.convert(item) for item in data]
+        if isinstance(data, datetime):
+            return self.format_datetime(data)
+        if isinstance(data, date):
+            return self.format_date(data)
+        if isinstance(data, Promise):
+            return force_str(data)
+        if isinstance(data, float):
+            # float 的子类（如 numpy.float64）
+            return self.convert(float(data))
+        if isinstance(data, (str, bytes)) or not hasattr(data, '__iter__') or hasattr(data, 'tolist'):
+            # 其他标量（Decimal、UUID、NumPy 数组等）交给编码器
+            return data
+        return [self.convert(item) for item in data]
+
+
+def _default(value):
+    """orjson 不支持的类型：与 DRF JSONEncoder 相同的转换（如 Decimal('NaN') 转为 NaN 时报错）"""
+    result = JSONEncoder().default(value)
+    if isinstance(result, float) and not math.isfinite(result):
+        raise ValueError(NON_FINITE_MESSAGE)
+    return result
+
@@ -0,0 +1,183 @@
+"""
+响应缓存装饰器 - 读多写少的 GET 接口缓存整个响应数据（stale-while-revalidate）
+
+使用方法：在视图的 get 方法上添加 @cache_response 装饰器，写操作视图声明 cache_tags
+
+    class DeptListView(APIView):
+        cache_tags = ('dept',)          # @log_operation 写操作成功后失效这些标签
+
+        @cache_response(ttl=60, tags=('dept',))
+        def get(self, request):
+            ...
+
+缓存策略：
+- 新鲜期（ttl 秒）内直接返回缓存
+- 过期后的 stale_ttl 秒内仍立即返回旧数据，同时由后台线程重新计算（同一 key 只刷新一次）；
+  后台线程不使用原请求和视图对象（响应返回后可能已被回收，且不是线程安全的），
+  而是按路径、查询参数、请求头和认证信息构造新的请求和视图实例（与 /batch 构造子请求的方式相同）
+- 标签失效：每个标签有一个版本号，缓存条目记录写入时的标签版本，
+  写操作提升版本号后，旧条目立即失效（不再作为旧数据返回），下次请求同步重新计算
+
+缓存存储使用 Django cache（settings.CACHES），多进程部署时应配置共享缓存（如 Redis）
+"""
+
+import io
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'response_cache'
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def cache_response(ttl: int = None, tags: tuple = (), stale_ttl: int = None):
+    """
+    响应缓存装饰器
+
+    Args:
+        ttl: 新鲜期（秒），默认 settings.RESPONSE_CACHE['TTL']
+        tags: 缓存标签，对应资源的写操作会使其失效
+        stale_ttl: 过期后仍可返回旧数据的时长（秒），默认 settings.RESPONSE_CACHE['STALE_TTL']
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            config = settings.RESPONSE_CACHE
+            if not config.get('ENABLED', True):
+                return func(self, request, *args, **kwargs)
+            fresh_ttl = config['TTL'] if ttl is None else ttl
+            stale_seconds = config['STALE_TTL'] if stale_ttl is None else stale_ttl
+
+            # 1. 读取缓存条目和当前标签版本
+            key = _cache_key(request)
+            versions = get_tag_versions(tags)
+            entry = cache.get(key)
+            now = time.time()
+            if entry is not None and entry['versions'] == versions:
+                # 2. 新鲜：直接返回；过期未超出 stale_ttl：返回旧数据并后台刷新
+                if now < entry['fresh_until']:
+                    return Response(entry['data'])
+                _refresh_in_background(key, func, type(self), _request_snapshot(request), args, kwargs,
+                                       tags, fresh_ttl, stale_seconds)
+                return Response(entry['data'])
+
+            # 3. 未命中或已被标签失效：同步计算
+            return _compute(key, func, self, request, args, kwargs, versions, fresh_ttl, stale_seconds)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_tags(*tags) -> None:
+    """提升标签版本号，使带有这些标签的缓存条目全部失效"""
+    if not tags:
+        return
+    cache.set_many({_tag_key(tag): uuid.uuid4().hex for tag in tags}, timeout=None)
+    logger.info(f"响应缓存失效：{', '.join(tags)}")
+
+
+def get_tag_versions(tags) -> dict:
+    """读取标签当前版本 - 没有版本号的标签视为初始版本"""
+    if not tags:
+        return {}
+    values = cache.get_many([_tag_key(tag) for tag in tags])
+    return {tag: values.get(_tag_key(tag)) for tag in tags}
+
+
+def _compute(key, func, view, request, args, kwargs, versions, fresh_ttl, stale_seconds):
+    """执行视图并写入缓存 - 只缓存成功的响应（HTTP 200 且 code 为 1）"""
+    response = func(view, request, *args, **kwargs)
+    data = getattr(response, 'data', None)
+    if response.status_code == 200 and isinstance(data, dict) and data.get('code') == 1:
+        entry = {'data': data, 'versions': versions, 'fresh_until': time.time() + fresh_ttl}
+        cache.set(key, entry, timeout=fresh_ttl + stale_seconds)
+    return response
+
+
+def _refresh_in_background(key, func, view_class, snapshot, args, kwargs, tags, fresh_ttl, stale_seconds):
+    """后台刷新过期条目 - 通过 cache.add 加锁，同一 key 同时只有一个刷新任务"""
+    lock_key = f"{key}:refreshing"
+    if not cache.add(lock_key, 1, timeout=max(fresh_ttl, 30)):
+        return
+
+    def refresh():
+        try:
+            # 计算前读取标签版本，计算期间发生的写操作会使本次结果失效
+            versions = get_tag_versions(tags)
+            view, request = _rebuild_request(view_class, snapshot, args, kwargs)
+            _compute(key, func, view, request, args, kwargs, versions, fresh_ttl, stale_seconds)
+        except Exception:
+            logger.exception(f"后台刷新响应缓存失败：{key}")
+        finally:
+            cache.delete(lock_key)
+            connections.close_all()
+
+    _get_executor().submit(refresh)
+
+
+def _request_snapshot(request) -> dict:
+    """后台刷新所需的请求信息：请求头（含路径、查询参数）和认证信息，不持有原请求对象"""
+    return {
+        'environ': {key: value for key, value in request.META.items() if key.isupper() and isinstance(value, str)},
+        'scheme': request.scheme,
+        'emp_id': getattr(request, 'emp_id', None),
+        'emp_username': getattr(request, 'emp_username', None),
+    }
+
+
+def _rebuild_request(view_class, snapshot: dict, args, kwargs) -> tuple:
+    """按快照构造新的 GET 请求和视图实例（与 APIView.dispatch 初始化视图的方式相同，认证信息沿用快照）"""
+    environ = dict(snapshot['environ'])
+    environ.update({
+        'REQUEST_METHOD': 'GET',
+        'CONTENT_LENGTH': '0',
+        'wsgi.input': io.BytesIO(b''),
+        'wsgi.url_scheme': snapshot['scheme'],
+    })
+    wsgi_request = WSGIRequest(environ)
+    wsgi_request.emp_id = snapshot['emp_id']
+    wsgi_request.emp_username = snapshot['emp_username']
+    view = view_class()
+    view.args, view.kwargs = args, kwargs
+    request = view.initialize_request(wsgi_request, *args, **kwargs)
+    view.request = request
+    view.headers = view.default_response_headers
+    view.format_kwarg = view.get_format_suffix(**kwargs)
+    return view, request
+
+
+def _cache_key(request) -> str:
+    """缓存 key：路径 + 排序后的查询参数"""
+    params = sorted((k, v) for k in request.query_params for v in request.query_params.getlist(k))
+    query = '&'.join(f"{k}={v}" for k, v in params)
+    return f"{KEY_PREFIX}:{request.path}?{query}"
+
+
+def _tag_key(tag: str) -> str:
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """延迟创建后台刷新线程池（进程内单例）"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.RESPONSE_CACHE.get('REFRESH_WORKERS', 2),
+                    thread_name_prefix='response-cache'
+                )
+    return _executor
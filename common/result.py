@@ -29,6 +29,12 @@ class Result:
             "data": data
         })
     
+    @staticmethod
+    def stream(rows, total: int = None):
+        """成功响应（列表数据，行数较多时流式输出，见 common.streaming）"""
+        from .streaming import stream_success
+        return stream_success(rows, total)
+    
     @staticmethod
     def error(msg: str):
         """失败响应"""
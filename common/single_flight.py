@@ -0,0 +1,169 @@
+"""
+请求合并（single-flight）- 并发的相同请求只执行一次，其余请求等待并共享结果
+
+使用方法：在视图的 get 方法上添加 @single_flight 装饰器（与 @cache_response 同用时放在内层）
+
+    class StudentCountView(APIView):
+        @cache_response(tags=('student',))
+        @single_flight
+        def get(self, request):
+            ...
+
+合并 key：路由 + 排序后的查询参数 + 权限范围（默认按是否登录区分）
+- 第一个请求（leader）执行视图，其余相同请求（waiter）等待 leader 完成后复用其响应数据和响应头
+- leader 抛出异常时，waiter 各自收到该异常的副本（__cause__ 为原异常，保留 leader 的堆栈）
+- 等待超过 SINGLE_FLIGHT_WAIT_TIMEOUT 秒时，waiter 放弃等待自行执行
+
+只在单个进程内合并；合并情况（执行次数、等待次数、当前等待数）通过 get_stats() 查看
+"""
+
+import copy
+import logging
+import threading
+from functools import wraps
+from django.conf import settings
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """一次进行中的执行"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """按 key 合并并发执行，并按名称统计合并情况"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        # 名称 → {'calls': 请求数, 'executions': 实际执行数, 'waiters': 累计等待数,
+        #          'waiting': 当前等待数, 'maxWaiters': 单次执行的最大等待数, 'timeouts': 等待超时数}
+        self._stats = {}
+
+    def do(self, key: str, fn, name: str = None, timeout: float = None):
+        """
+        执行 fn() - 相同 key 已有执行进行中时等待其结果
+
+        返回：(结果, 是否与其他请求共享)
+        """
+        name = name or key
+        with self._lock:
+            stats = self._stats_of(name)
+            stats['calls'] += 1
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+                stats['executions'] += 1
+            else:
+                call.waiters += 1
+                leader = False
+                stats['waiters'] += 1
+                stats['waiting'] += 1
+                stats['maxWaiters'] = max(stats['maxWaiters'], call.waiters)
+
+        # 1. waiter：等待 leader 完成，超时则自行执行
+        if not leader:
+            finished = call.done.wait(timeout)
+            with self._lock:
+                stats['waiting'] -= 1
+                if not finished:
+                    stats['timeouts'] += 1
+            if not finished:
+                logger.warning(f"等待合并请求超时，自行执行：{key}")
+                return fn(), False
+            if call.error is not None:
+                raise _copy_error(call.error) from call.error
+            return call.result, True
+
+        # 2. leader：执行并通知所有 waiter
+        try:
+            call.result = fn()
+            return call.result, False
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> dict:
+        """合并统计快照"""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _stats_of(self, name: str) -> dict:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = {'calls': 0, 'executions': 0, 'waiters': 0, 'waiting': 0, 'maxWaiters': 0, 'timeouts': 0}
+            self._stats[name] = stats
+        return stats
+
+
+# 视图请求合并组（进程内单例）
+_group = SingleFlight()
+
+
+def single_flight(func=None, *, scope=None):
+    """
+    视图请求合并装饰器
+
+    Args:
+        scope: 权限范围函数 scope(request) -> str，返回值不同的请求不会合并；
+               默认按是否登录区分（所有登录员工可见的数据相同）
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            # 1. 合并 key：路由 + 排序后的查询参数 + 权限范围
+            route = request.path
+            params = sorted((k, v) for k in request.query_params for v in request.query_params.getlist(k))
+            query = '&'.join(f"{k}={v}" for k, v in params)
+            scope_value = scope(request) if scope else _default_scope(request)
+            key = f"{route}?{query}#{scope_value}"
+
+            # 2. 合并执行，共享响应数据和响应头（Response 对象不能被多个请求共同渲染，按数据重建）
+            def run():
+                response = func(self, request, *args, **kwargs)
+                return response.status_code, getattr(response, 'data', None), dict(response.items()), response
+
+            (status, data, headers, response), shared = _group.do(
+                key, run, name=route, timeout=settings.SINGLE_FLIGHT_WAIT_TIMEOUT)
+            if not shared:
+                return response
+            return Response(data, status=status, headers=headers)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def get_stats() -> dict:
+    """视图请求合并统计 - 按路由汇总"""
+    return _group.stats()
+
+
+def _copy_error(error: Exception) -> Exception:
+    """
+    异常副本 - 每个 waiter 抛出自己的异常对象
+    （多个线程 raise 同一个异常对象会互相改写 __traceback__）；无法复制时包装为 RuntimeError
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return RuntimeError(f"合并请求执行失败：{error!r}")
+
+
+def _default_scope(request) -> str:
+    return 'staff' if getattr(request, 'emp_id', None) else 'anonymous'
@@ -0,0 +1,43 @@
+"""
+文件存储模块 - 可插拔存储后端
+
+根据 settings.STORAGE['BACKEND'] 选择实现：
+- local：本地磁盘（MEDIA_ROOT），单节点部署
+- s3：S3 兼容对象存储（AWS S3 / MinIO 等），多节点共享上传文件
+
+使用方法：
+
+    from common.storage import get_storage
+    url = get_storage().save('2025/12/xxx.png', file)
+"""
+
+import threading
+from django.conf import settings
+from django.utils.module_loading import import_string
+from .base import BaseStorage
+from .local import LocalStorage
+
+# 后端别名 → 实现类路径
+BACKENDS = {
+    'local': 'common.storage.local.LocalStorage',
+    's3': 'common.storage.s3.S3Storage',
+}
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage() -> BaseStorage:
+    """获取存储后端（进程内单例，S3 客户端及其连接池在进程内复用）"""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                config = settings.STORAGE
+                backend = config.get('BACKEND', 'local')
+                storage_class = import_string(BACKENDS.get(backend, backend))
+                _storage = storage_class(config.get(backend.upper(), {}))
+    return _storage
+
+
+__all__ = ['BaseStorage', 'LocalStorage', 'get_storage']
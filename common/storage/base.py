@@ -0,0 +1,47 @@
+"""
+存储后端基类 - 定义所有存储实现的统一接口
+
+key 为相对路径，例如 2025/12/xxx.png；url 为前端可直接访问的地址
+"""
+
+import os
+
+
+class BaseStorage:
+    """存储后端基类"""
+
+    # 访问 URL 前缀，url = base_url + key
+    base_url = ''
+
+    def save(self, key: str, fileobj) -> str:
+        """从文件对象流式保存，返回访问 URL"""
+        raise NotImplementedError
+
+    def save_file(self, key: str, path: str) -> str:
+        """保存本地文件（调用方保留源文件），返回访问 URL"""
+        raise NotImplementedError
+
+    def move_file(self, key: str, path: str) -> str:
+        """保存本地文件并删除源文件，返回访问 URL"""
+        url = self.save_file(key, path)
+        os.remove(path)
+        return url
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def local_path(self, key: str):
+        """本地文件路径，非本地存储返回 None"""
+        return None
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}{key}"
+
+    def key_from_url(self, url: str):
+        """从访问 URL 反解 key，不属于本存储的 URL 返回 None"""
+        if url and url.startswith(self.base_url):
+            return url[len(self.base_url):]
+        return None
@@ -0,0 +1,65 @@
+"""
+本地磁盘存储 - 文件保存在 MEDIA_ROOT 下，通过 MEDIA_URL 访问
+"""
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from django.conf import settings
+from .base import BaseStorage
+
+
+class LocalStorage(BaseStorage):
+    """本地磁盘存储"""
+
+    def __init__(self, options: dict = None):
+        options = options or {}
+        self.location = Path(options.get('LOCATION') or settings.MEDIA_ROOT)
+        self.base_url = options.get('BASE_URL') or settings.MEDIA_URL
+
+    def save(self, key: str, fileobj) -> str:
+        """分块写入临时文件后原子替换，文件存在即代表写入完整"""
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{uuid.uuid4().hex}.tmp")
+        chunks = fileobj.chunks() if hasattr(fileobj, 'chunks') else iter(lambda: fileobj.read(64 * 1024), b'')
+        with open(tmp_path, 'wb') as destination:
+            for chunk in chunks:
+                destination.write(chunk)
+        os.replace(tmp_path, target)
+        return self.url(key)
+
+    def save_file(self, key: str, path: str) -> str:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, target)
+        return self.url(key)
+
+    def move_file(self, key: str, path: str) -> str:
+        """移动本地文件到存储位置（同一文件系统时仅重命名，不复制数据）"""
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(path), str(target))
+        return self.url(key)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, key: str):
+        return self._path(key)
+
+    def _path(self, key: str) -> Path:
+        """key 转本地路径，禁止越出存储根目录"""
+        path = (self.location / key).resolve()
+        if not path.is_relative_to(self.location.resolve()):
+            raise ValueError(f"非法的存储路径：{key}")
+        return path
@@ -0,0 +1,94 @@
+"""
+流式 JSON 响应 - 大列表逐行编码、分块发送
+
+普通响应先构建完整的数据列表，再一次性 json.dumps，内存占用与行数成正比；
+流式响应逐行编码 {"code":1,"msg":"success","data":[...]}，每累计 BUFFER_SIZE 字节发送一次，
+配合 ProjectionSerializer.stream()（按块查询、键预先转为驼峰）内存占用与总行数无关。
+
+- 每行由 REST_FRAMEWORK 的默认渲染器渲染，输出与普通响应逐字节一致
+- 行数不超过 STREAMING_RESPONSE['THRESHOLD'] 时仍返回普通 Response（可被响应缓存、条件请求使用）
+- 响应头发送后出错只能中断连接（客户端收到不完整的 JSON），错误记录在日志中
+- ASGI 下逐块在线程中读取（与视图同一线程，数据库游标可用）；Django 默认会先把同步迭代器整个读入内存
+
+使用方法：
+
+    return Result.stream(EmpProjection(queryset).stream())                    # data 为列表
+    return Result.stream(EmpProjection(rows).stream(), total=total)           # data 为 {total, rows}
+"""
+
+import logging
+from itertools import chain, islice
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+
+def stream_success(rows, total: int = None):
+    """
+    成功响应（列表数据）- 行数较多时流式输出
+
+    Args:
+        rows: 行的可迭代对象，每行为键已转为驼峰的 dict
+        total: 分页总数，传入时 data 为 {"total": total, "rows": [...]}
+    """
+    config = settings.STREAMING_RESPONSE
+    rows = iter(rows)
+    head = list(islice(rows, config['THRESHOLD'] + 1))
+    if len(head) <= config['THRESHOLD']:
+        data = head if total is None else {'total': total, 'rows': head}
+        return Response({'code': 1, 'msg': 'success', 'data': data})
+    return _StreamingResponse(_encode(chain(head, rows), total, config['BUFFER_SIZE']),
+                              content_type=_content_type())
+
+
+class _StreamingResponse(StreamingHttpResponse):
+    """同步生成器的流式响应，ASGI 下逐块读取"""
+    
+    async def __aiter__(self):
+        chunks = iter(self.streaming_content)
+        read = sync_to_async(next, thread_sensitive=True)
+        while (chunk := await read(chunks, None)) is not None:
+            yield chunk
+
+
+def _encode(rows, total, buffer_size: int):
+    """逐行渲染，累计 buffer_size 字节后输出一块"""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    item_separator, key_separator = (b',', b':') if renderer.compact else (b', ', b': ')
+
+    # 1. 信封头
+    head = b'{"code"' + key_separator + b'1' + item_separator + b'"msg"' + key_separator + b'"success"'
+    head += item_separator + b'"data"' + key_separator
+    if total is not None:
+        head += b'{"total"' + key_separator + str(int(total)).encode() + item_separator + b'"rows"' + key_separator
+    buffer = [head + b'[']
+    size = 0
+
+    # 2. 逐行渲染（每行与普通响应中的对应部分一致）
+    try:
+        for index, row in enumerate(rows):
+            content = renderer.render(row)
+            buffer.append(item_separator + content if index else content)
+            size += len(content)
+            if size >= buffer_size:
+                yield b''.join(buffer)
+                buffer = []
+                size = 0
+    except Exception:
+        logger.exception("流式响应输出失败，连接已中断")
+        raise
+
+    # 3. 信封尾
+    buffer.append(b']}' if total is None else b']}}')
+    yield b''.join(buffer)
+
+
+def _content_type() -> str:
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]
+    if renderer.charset:
+        return f"{renderer.media_type}; charset={renderer.charset}"
+    return renderer.media_type
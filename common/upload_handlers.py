@@ -0,0 +1,52 @@
+"""
+文件上传处理器 - 边接收边落盘，接收过程中校验单文件大小和文件数量
+
+Django 默认的 MemoryFileUploadHandler 会把小文件整体读入内存，
+批量上传时改用本处理器：每个文件分块直接写入磁盘临时文件，
+一旦某个文件超过大小限制或文件数量超限立即中止解析，不再继续读取请求体。
+
+使用方法：在读取 request.FILES 之前替换处理器
+
+    request.upload_handlers = [LimitedTemporaryFileUploadHandler(request, max_file_size, max_files)]
+"""
+
+import logging
+from django.core.files.uploadhandler import TemporaryFileUploadHandler, StopUpload
+
+logger = logging.getLogger(__name__)
+
+
+class LimitedTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    限制单文件大小和文件数量的临时文件上传处理器
+
+    单文件超限时记录 rejected_file，文件数量超限时 too_many_files 为 True，并以 StopUpload 中止整个请求体的解析
+    """
+
+    def __init__(self, request=None, max_file_size=None, max_files=None):
+        super().__init__(request)
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+        self.rejected_file = None
+        self.too_many_files = False
+        self.received = 0
+        self.file_count = 0
+
+    def new_file(self, *args, **kwargs):
+        self.file_count += 1
+        if self.max_files and self.file_count > self.max_files:
+            self.too_many_files = True
+            logger.info(f"文件数量超出限制，中止上传：{self.max_files}")
+            raise StopUpload(connection_reset=True)
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.max_file_size and self.received > self.max_file_size:
+            self.rejected_file = self.file_name
+            logger.info(f"文件超出大小限制，中止上传：{self.file_name}")
+            # 删除已写入的临时文件，并停止读取剩余请求体
+            self.upload_interrupted()
+            raise StopUpload(connection_reset=True)
+        return super().receive_data_chunk(raw_data, start)
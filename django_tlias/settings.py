@@ -109,6 +109,127 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # 文件上传大小限制 - 对标 Java max-file-size: 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
+# 分片上传配置 - 大文件断点续传（init → PUT 分片 → complete）
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024               # 分片大小上限 5MB
+UPLOAD_CHUNK_MAX_FILE_SIZE = 2 * 1024 * 1024 * 1024  # 单文件上限 2GB
+UPLOAD_CHUNK_TEMP_DIR = BASE_DIR / 'upload_tmp'   # 未完成会话的临时目录（不对外提供访问）
+UPLOAD_CHUNK_SESSION_TTL = 24 * 60 * 60           # 会话超过 24 小时未更新即视为过期
+
+# 批量上传配置 - 单文件边接收边校验大小，超限立即中止
+UPLOAD_BATCH_MAX_FILES = 50
+UPLOAD_BATCH_MAX_FILE_SIZE = 10 * 1024 * 1024  # 单文件 10MB，与单文件上传一致
+UPLOAD_BATCH_WORKERS = 4                       # 并发保存线程数
+
+# 文件存储配置 - 可插拔存储后端（common.storage）
+# BACKEND：local 本地磁盘（MEDIA_ROOT）；s3 为 S3 兼容对象存储（AWS S3 / MinIO），多节点共享上传文件
+STORAGE = {
+    'BACKEND': 'local',
+    'ASYNC_UPLOAD': False,  # 远程存储时后台上传，请求不等待远程 PUT 完成
+    'ASYNC_WORKERS': 4,
+    'S3': {
+        'ENDPOINT_URL': 'http://localhost:9000',  # 本地 MinIO
+        'BUCKET': 'tlias',
+        'ACCESS_KEY': 'minioadmin',
+        'SECRET_KEY': 'minioadmin',
+        'REGION': 'us-east-1',
+        'PUBLIC_URL': 'http://localhost:9000/tlias',
+        'MAX_POOL_CONNECTIONS': 20,                 # 连接池大小
+        'MULTIPART_THRESHOLD': 8 * 1024 * 1024,     # 超过 8MB 分片上传
+        'MULTIPART_CHUNKSIZE': 8 * 1024 * 1024,
+        'MAX_CONCURRENCY': 4,                       # 单个文件的分片并发数
+    },
+}
+UPLOAD_STAGING_DIR = BASE_DIR / 'upload_staging'  # 远程存储上传前的本地暂存目录
+
+# 孤儿上传文件回收（python manage.py gc_uploads）
+UPLOAD_GC_GRACE_DAYS = 7  # 宽限期内的文件不回收（可能尚未保存到员工信息）
+UPLOAD_GC_QUARANTINE_DIR = BASE_DIR / 'upload_quarantine'  # --quarantine 时的隔离目录
+
+# 图片衍生图配置 - 上传后由后台线程池生成 WebP/JPEG 缩略图
+IMAGE_VARIANTS = {'thumb': 80, 'small': 240}  # 规格名 → 最长边像素
+IMAGE_VARIANT_QUALITY = 82
+IMAGE_VARIANT_WORKERS = 2
+IMAGE_VARIANT_MISS_TTL = 30  # 衍生图未登记的检查结果缓存秒数
+IMAGE_VARIANT_CACHE_ALIAS = 'default'  # 登记已生成衍生图的缓存（未登记时回退检查存储，多节点部署时共享缓存可减少检查）
+
+
+# 报表统计计数器对账间隔（秒）- 计数器由写操作增量维护，后台线程定期用 GROUP BY 对账修复漂移（0 表示不对账）
+REPORT_STATS_RECONCILE_INTERVAL = 300
+
+# 统计立方体（/report/cube）列式快照 - 本进程写操作后的下次查询重新加载，最长 5 分钟强制刷新（其他进程的写入）
+CUBE_SNAPSHOT_TTL = 300
+
+# 缓存配置 - 多进程部署时应改为共享缓存（如 Redis），响应缓存的标签失效才能跨进程生效
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# 响应缓存（common.response_cache）- GET 接口缓存，过期后先返回旧数据再后台刷新
+RESPONSE_CACHE = {
+    'ENABLED': True,
+    'TTL': 30,              # 默认新鲜期（秒），可在 @cache_response(ttl=...) 中按接口指定
+    'STALE_TTL': 300,       # 过期后仍可返回旧数据的时长（秒）
+    'REFRESH_WORKERS': 2,   # 后台刷新线程数
+}
+
+# 维度名称缓存（部门 / 班级 / 员工 ID → 名称）- L1 进程内 LRU + L2 Django cache
+DIMENSION_CACHE = {
+    'CACHE_ALIAS': 'default',       # L2 及版本号使用的缓存（多节点部署时应为共享缓存）
+    'L2_ENABLED': True,
+    'L2_TTL': 3600,                 # L2 条目过期时间（秒）
+    'L1_SIZE': 5000,                # 每个维度的 L1 最大条目数
+    'L1_TTL': 60,                   # L1 条目最长保留时间（秒），缓存不共享时其他进程最迟在此时间后看到变化
+    'VERSION_CHECK_INTERVAL': 5,    # 检查共享版本号的间隔（秒）
+}
+
+# 请求合并（common.single_flight）- 并发的相同 GET 请求只执行一次，等待超时（秒）后自行执行
+SINGLE_FLIGHT_WAIT_TIMEOUT = 30
+
+# 批量请求（POST /batch）- 单次最多子请求数，并发执行 GET 子请求的线程数
+BATCH_MAX_REQUESTS = 20
+BATCH_WORKERS = 4
+
+# 输入联想（GET /search/suggest）- 进程内前缀索引，拼音检索需安装 pypinyin
+SEARCH_SUGGEST = {
+    'LIMIT': 10,                    # 默认返回条数
+    'MAX_LIMIT': 50,                # 最大返回条数
+    'REBUILD_INTERVAL': 300,        # 索引定期重建间隔（秒），同步其他进程的写入
+}
+
+# 增量同步（GET /sync/{resource}）
+SYNC = {
+    'PAGE_SIZE': 100,               # 默认每页变更数
+    'MAX_PAGE_SIZE': 1000,          # 最大每页变更数
+    'OVERLAP_SECONDS': 5,           # 最后一页游标回退的秒数，覆盖提交晚于 update_time 的事务
+    'TOMBSTONE_RETENTION_DAYS': 30, # 删除记录保留天数（gc_sync_tombstones 清除），更早的游标需重新全量同步
+}
+
+# 事件流（GET /events/stream，SSE，需 ASGI 部署）
+EVENT_STREAM = {
+    'BACKEND': 'local',             # 消息代理：local 进程内分发（多进程部署需实现共享代理）
+    'BUFFER_SIZE': 100,             # 每个订阅者的缓冲事件数，消费过慢时断开由客户端重连续传
+    'HISTORY_SIZE': 1000,           # 保留的最近事件数，用于 Last-Event-ID 续传
+    'HEARTBEAT': 15,                # 空闲心跳间隔（秒）
+    'MAX_DURATION': 3600,           # 单个连接最长持续时间（秒），到期后客户端自动重连并重新认证
+    'RETRY': 3000,                  # 客户端重连间隔（毫秒）
+}
+
+# 流式响应（common.streaming）- 大列表按块查询、逐行输出 JSON，内存占用与总行数无关
+STREAMING_RESPONSE = {
+    'THRESHOLD': 1000,              # 行数超过该值时流式输出，否则为普通响应（可被响应缓存）
+    'CHUNK_SIZE': 2000,             # 每次从数据库读取的行数
+    'BUFFER_SIZE': 64 * 1024,       # 输出缓冲（字节），累计到该大小发送一次
+}
+
+# JSON 渲染器 / 解析器（common.renderers、common.parsers）
+JSON_RENDERER = {
+    'ENGINE': 'auto',               # auto：安装了 orjson 时使用 orjson，否则使用标准库 json；json：始终使用标准库
+    'KEY_CACHE_SIZE': 4096,         # 键名驼峰转换结果的缓存条数，超出后清空重建
+}
+
 
 # CORS 配置 - 允许前端开发服务器访问
 CORS_ALLOWED_ORIGINS = [
@@ -120,9 +241,15 @@ CORS_ALLOW_CREDENTIALS = True
 
 # Django REST Framework 配置
 REST_FRAMEWORK = {
-    # 全局驼峰命名渲染器 - 输出时 snake_case 转为 camelCase
+    # 全局驼峰命名渲染器 - 输出时 snake_case 转为 camelCase（键名转换结果缓存，见 JSON_RENDERER）
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+        'common.renderers.CamelCaseJSONRenderer',
+    ),
+    # 请求解析器 - JSON 使用 orjson 解析（未安装时同 DRF），表单 / 文件上传同 DRF 默认
+    'DEFAULT_PARSER_CLASSES': (
+        'common.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
     # 全局时间格式 - 对标 Java JacksonTimeConfig（yyyy-MM-dd HH:mm:ss）
     'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
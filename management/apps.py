@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ManagementConfig(AppConfig):
     name = 'management'
+
+    def ready(self):
+        # 注册 data_changed 信号的接收者（management/signals.py）
+        from .services import (report_stats_service, cube_service, report_service,  # noqa: F401
+                               dimension_cache_service, search_service, event_service)
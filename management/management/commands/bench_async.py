@@ -0,0 +1,148 @@
+"""
+同步 / 异步路径压测命令 - 相同并发下对比 /xxx 与 /async/xxx
+
+请求在进程内直接调用 Django 的 ASGI 应用（与 uvicorn 等 ASGI 服务器相同的调用方式，不经过网络），
+同步视图由 Django 切换到工作线程执行，异步视图在事件循环中执行。
+默认关闭响应缓存（异步路径没有响应缓存），两条路径每次都查询数据库。
+
+用法：
+    python manage.py bench_async                                    # 默认接口，并发 50，每个接口 1000 次
+    python manage.py bench_async --concurrency 200 --requests 5000
+    python manage.py bench_async --path "/students?pageSize=50" --path /report/studentViolationRank
+    python manage.py bench_async --response-cache                   # 同步路径保留响应缓存
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from common.jwt_utils import generate_jwt
+from management.models import Emp
+
+# 默认压测的接口（同步路径；异步路径为 /async + 同步路径）
+DEFAULT_PATHS = [
+    '/emps?page=1&pageSize=10',
+    '/students?page=1&pageSize=10',
+    '/clazzs?page=1&pageSize=10',
+    '/report/empGenderData',
+    '/report/studentViolationRank',
+]
+
+
+class Command(BaseCommand):
+    help = '相同并发下对比同步视图与异步视图（/async/...）的吞吐量和延迟'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', action='append', default=[], help='同步路径（含查询参数），可重复')
+        parser.add_argument('--concurrency', type=int, default=50, help='并发请求数')
+        parser.add_argument('--requests', type=int, default=1000, help='每条路径的请求总数')
+        parser.add_argument('--warmup', type=int, default=20, help='每条路径的预热请求数（不计入结果）')
+        parser.add_argument('--response-cache', action='store_true', help='同步路径保留响应缓存')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['requests'] < 1:
+            raise CommandError("并发数和请求数必须大于 0")
+        emp = Emp.objects.order_by('id').values('id', 'username').first()
+        if emp is None:
+            raise CommandError("员工表为空，无法生成令牌")
+        self.token = generate_jwt({'id': emp['id'], 'username': emp['username']})
+
+        config = settings.RESPONSE_CACHE
+        if not options['response_cache']:
+            config = {**config, 'ENABLED': False}
+        with override_settings(RESPONSE_CACHE=config):
+            asyncio.run(self._run(options['path'] or DEFAULT_PATHS, options))
+
+    async def _run(self, paths: list, options: dict) -> None:
+        app = ASGIHandler()
+        self.stdout.write(f"并发 {options['concurrency']}，每条路径 {options['requests']} 次请求")
+        width = max(len('/async' + path) for path in paths) + 2
+        self.stdout.write(f"{'路径':<{width}}{'吞吐(次/秒)':>12}{'P50(ms)':>10}{'P95(ms)':>10}{'P99(ms)':>10}")
+        for path in paths:
+            # 1. 两条路径的响应必须一致
+            sync_status, sync_body = await self._request(app, path)
+            async_status, async_body = await self._request(app, '/async' + path)
+            if sync_status != 200 or async_status != 200:
+                raise CommandError(f"请求失败：{path} → {sync_status}，/async{path} → {async_status}")
+            if json.loads(sync_body) != json.loads(async_body):
+                self.stdout.write(self.style.WARNING(f"响应不一致：{path}"))
+
+            # 2. 交替压测（先同步后异步），预热后计时
+            for target in (path, '/async' + path):
+                await self._load(app, target, options['warmup'], options['concurrency'])
+                elapsed, latencies = await self._load(app, target, options['requests'], options['concurrency'])
+                latencies.sort()
+                self.stdout.write(
+                    f"{target:<{width}}{len(latencies) / elapsed:>12.1f}"
+                    f"{self._percentile(latencies, 50):>10.2f}{self._percentile(latencies, 95):>10.2f}"
+                    f"{self._percentile(latencies, 99):>10.2f}"
+                )
+
+    async def _load(self, app, path: str, total: int, concurrency: int) -> tuple:
+        """并发发送 total 次请求，返回 (总耗时, 每次请求的延迟毫秒列表)"""
+        latencies = []
+        remaining = iter(range(total))
+
+        async def worker():
+            for _ in remaining:
+                begin = time.perf_counter()
+                status, _ = await self._request(app, path)
+                latencies.append((time.perf_counter() - begin) * 1000)
+                if status != 200:
+                    raise CommandError(f"请求失败：{path} → {status}")
+
+        begin = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+        return time.perf_counter() - begin, latencies
+
+    async def _request(self, app, path: str) -> tuple:
+        """按 ASGI 协议调用一次 GET 请求，返回 (状态码, 响应体)"""
+        url = urlsplit(path)
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': url.path,
+            'raw_path': url.path.encode(),
+            'query_string': url.query.encode(),
+            'root_path': '',
+            'headers': [(b'host', b'localhost'), (b'token', self.token.encode())],
+            'client': ('127.0.0.1', 0),
+            'server': ('localhost', 80),
+        }
+        disconnected = asyncio.Event()
+        received = False
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        response = {'status': None, 'body': []}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+            elif message['type'] == 'http.response.body':
+                response['body'].append(message.get('body', b''))
+
+        try:
+            await app(scope, receive, send)
+        finally:
+            disconnected.set()
+        return response['status'], b''.join(response['body'])
+
+    @staticmethod
+    def _percentile(values: list, percent: int) -> float:
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * percent / 100))]
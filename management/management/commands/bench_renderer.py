@@ -0,0 +1,92 @@
+"""
+JSON 渲染器压测命令 - 在 /students 分页上对比原驼峰渲染器与 common.renderers
+
+两项对比：
+- 只渲染：同一份 /students 分页数据分别由各渲染器渲染，输出必须逐字节一致
+- 视图调用：GET /students 直接调用视图（查询、序列化、渲染，不经过中间件）
+  APIView.renderer_classes 在导入时确定，修改配置不影响已有视图，因此通过 as_view(renderer_classes=...) 指定渲染器，
+  同时修改 DEFAULT_RENDERER_CLASSES（流式响应使用）
+
+用法：
+    python manage.py bench_renderer                                 # 每页 10 / 100 / 1000 行
+    python manage.py bench_renderer --page-size 500 --iterations 500
+"""
+
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+from common.renderers import orjson
+from management.serializers.student import StudentPageProjection
+from management.services.student_service import StudentService
+from management.views.student_views import StudentListView
+
+# 渲染器配置：名称 → (渲染器类, JSON_RENDERER['ENGINE'])
+RENDERERS = {
+    'djangorestframework_camel_case': ('djangorestframework_camel_case.render.CamelCaseJSONRenderer', 'json'),
+    'common.renderers + json': ('common.renderers.CamelCaseJSONRenderer', 'json'),
+    'common.renderers + orjson': ('common.renderers.CamelCaseJSONRenderer', 'auto'),
+}
+
+
+class Command(BaseCommand):
+    help = '在 /students 分页上对比原驼峰渲染器与 common.renderers 的渲染耗时'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, action='append', default=[], help='每页行数，可重复')
+        parser.add_argument('--iterations', type=int, default=200, help='每种配置的执行次数')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("执行次数必须大于 0")
+        renderers = dict(RENDERERS)
+        if orjson is None:
+            self.stdout.write(self.style.WARNING("未安装 orjson，跳过 orjson 对比"))
+            renderers.pop('common.renderers + orjson')
+        factory = RequestFactory()
+        iterations = options['iterations']
+
+        for page_size in options['page_size'] or [10, 100, 1000]:
+            # 1. 构造 /students 分页数据（与视图相同）
+            pageResult = StudentService.page({'page': 1, 'pageSize': page_size})
+            data = {'code': 1, 'msg': 'success', 'data': {
+                'total': pageResult['total'],
+                'rows': StudentPageProjection(pageResult['rows']).data,
+            }}
+            rows = len(data['data']['rows'])
+            self.stdout.write(f"\n/students?pageSize={page_size}（{rows} 行），每种配置 {iterations} 次")
+            self.stdout.write(f"{'渲染器':<32}{'只渲染(ms)':>12}{'视图调用(ms)':>14}{'渲染加速':>10}")
+
+            baseline = expected = None
+            for name, (renderer_class, engine) in renderers.items():
+                rest_framework = {**settings.REST_FRAMEWORK, 'DEFAULT_RENDERER_CLASSES': (renderer_class,)}
+                json_renderer = {**settings.JSON_RENDERER, 'ENGINE': engine}
+                renderer_class = import_string(renderer_class)
+                renderer = renderer_class()
+                view = StudentListView.as_view(renderer_classes=[renderer_class])
+                with override_settings(REST_FRAMEWORK=rest_framework, JSON_RENDERER=json_renderer):
+
+                    # 2. 只渲染
+                    content = renderer.render(data)
+                    if expected is None:
+                        expected = content
+                    elif content != expected:
+                        self.stdout.write(self.style.WARNING(f"{name} 的输出与原渲染器不一致"))
+                    begin = time.perf_counter()
+                    for _ in range(iterations):
+                        renderer.render(data)
+                    render_ms = (time.perf_counter() - begin) * 1000 / iterations
+
+                    # 3. 视图调用（大列表为流式响应，需读完响应体）
+                    begin = time.perf_counter()
+                    for _ in range(iterations):
+                        response = view(factory.get('/students', {'page': 1, 'pageSize': page_size}))
+                        if response.status_code != 200:
+                            raise CommandError(f"请求失败：{response.status_code}")
+                        b''.join(response.streaming_content) if response.streaming else response.render()
+                    request_ms = (time.perf_counter() - begin) * 1000 / iterations
+
+                baseline = baseline or render_ms
+                self.stdout.write(f"{name:<32}{render_ms:>12.3f}{request_ms:>14.3f}{baseline / render_ms:>9.1f}x")
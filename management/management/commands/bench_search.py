@@ -0,0 +1,54 @@
+"""
+输入联想压测命令 - 对比 /search/suggest 的前缀索引与原分页接口的 name 模糊查询
+
+两项对比（同一批关键字，不经过视图和中间件）：
+- 前缀索引：SearchService.suggest（索引已构建，只统计查询耗时；构建耗时单独输出）
+- 分页查询：EmpService.page（name 模糊查询 + COUNT），名称选择框原来的调用方式
+
+用法：
+    python manage.py bench_search                          # 默认关键字，每个关键字 1000 次
+    python manage.py bench_search --q 张 --q zs --iterations 5000
+"""
+
+import time
+from django.core.management.base import BaseCommand, CommandError
+from management.services.emp_service import EmpService
+from management.services.search_service import SearchService
+
+# 默认关键字：单字、姓名、拼音全拼、拼音首字母
+DEFAULT_KEYWORDS = ['张', '张三', 'zhang', 'zs']
+
+
+class Command(BaseCommand):
+    help = '对比输入联想的前缀索引与分页接口模糊查询的耗时'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--q', action='append', default=[], help='关键字，可重复')
+        parser.add_argument('--iterations', type=int, default=1000, help='每个关键字的执行次数')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("执行次数必须大于 0")
+        iterations = options['iterations']
+
+        # 1. 构建索引（首次查询的耗时）
+        SearchService._indexes.pop('emp', None)
+        begin = time.perf_counter()
+        SearchService.suggest({'q': DEFAULT_KEYWORDS[0], 'type': 'emp'})
+        self.stdout.write(f"构建员工索引：{(time.perf_counter() - begin) * 1000:.1f} ms")
+
+        # 2. 逐个关键字对比
+        self.stdout.write(f"{'关键字':<12}{'前缀索引(ms)':>14}{'分页查询(ms)':>14}{'加速':>10}")
+        for keyword in options['q'] or DEFAULT_KEYWORDS:
+            begin = time.perf_counter()
+            for _ in range(iterations):
+                SearchService.suggest({'q': keyword, 'type': 'emp'})
+            suggest_ms = (time.perf_counter() - begin) * 1000 / iterations
+
+            begin = time.perf_counter()
+            for _ in range(iterations):
+                pageResult = EmpService.page({'name': keyword, 'page': 1, 'pageSize': 10})
+                list(pageResult['rows'])
+            page_ms = (time.perf_counter() - begin) * 1000 / iterations
+
+            self.stdout.write(f"{keyword:<12}{suggest_ms:>14.4f}{page_ms:>14.3f}{page_ms / suggest_ms:>9.1f}x")
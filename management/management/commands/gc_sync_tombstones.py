@@ -0,0 +1,28 @@
+"""
+同步删除记录回收命令 - 清除超过保留期的 sync_tombstone
+
+删除记录只用于增量同步返回已删除的 ID，保留 SYNC['TOMBSTONE_RETENTION_DAYS'] 天；
+游标或水位线早于保留期的同步请求返回 resyncRequired，客户端重新全量同步
+（保留天数只通过配置修改，保证接口的判断与实际清除范围一致）
+
+用法：
+    python manage.py gc_sync_tombstones             # 清除超过保留期的删除记录
+    python manage.py gc_sync_tombstones --dry-run   # 只统计，不删除
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from management.services.sync_service import SyncService
+
+
+class Command(BaseCommand):
+    help = '清除超过保留期的同步删除记录'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='只统计，不删除')
+
+    def handle(self, *args, **options):
+        count = SyncService.purgeTombstones(dry_run=options['dry_run'])
+        action = '待清除' if options['dry_run'] else '已清除'
+        days = settings.SYNC['TOMBSTONE_RETENTION_DAYS']
+        self.stdout.write(self.style.SUCCESS(f"{action}：{count} 条 {days} 天前的删除记录"))
@@ -0,0 +1,127 @@
+"""
+孤儿上传文件回收命令 - 标记清除（mark-and-sweep）
+
+标记：流式读取 emp.image 中引用的 URL，压缩为 16 字节的 UUID 集合
+清除：用 os.scandir 逐月遍历 MEDIA_ROOT/YYYY/MM，删除（或隔离）
+      未被引用且超过宽限期的文件；衍生图（xxx_thumb.webp）跟随原图判断
+
+用法：
+    python manage.py gc_uploads --dry-run                 # 只统计，不删除
+    python manage.py gc_uploads --month 2025/12           # 只处理指定月份（可重复）
+    python manage.py gc_uploads --since 2025/06           # 处理 2025/06 及之后的月份
+    python manage.py gc_uploads --quarantine              # 移动到隔离目录而不是删除
+"""
+
+import os
+import re
+import shutil
+import time
+import uuid
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from common.storage import get_storage
+from management.models import Emp
+
+# 月份目录：YYYY/MM
+MONTH_PATTERN = re.compile(r'^\d{4}/\d{2}$')
+
+
+class Command(BaseCommand):
+    help = '回收未被引用的上传文件（孤儿文件）'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='只统计，不删除')
+        parser.add_argument('--grace-days', type=int, default=settings.UPLOAD_GC_GRACE_DAYS,
+                            help='宽限天数，修改时间在宽限期内的文件不回收')
+        parser.add_argument('--month', action='append', default=[], help='只处理指定月份 YYYY/MM，可重复')
+        parser.add_argument('--since', help='处理该月份（YYYY/MM）及之后的所有月份')
+        parser.add_argument('--quarantine', action='store_true',
+                            help='移动到 UPLOAD_GC_QUARANTINE_DIR 而不是直接删除')
+
+    def handle(self, *args, **options):
+        storage = get_storage()
+        if storage.local_path('') is None:
+            raise CommandError("孤儿文件回收只支持本地存储，对象存储请使用存储桶生命周期规则")
+        for month in options['month'] + ([options['since']] if options['since'] else []):
+            if not MONTH_PATTERN.match(month):
+                raise CommandError(f"月份格式错误：{month}，应为 YYYY/MM")
+
+        media_root = Path(settings.MEDIA_ROOT)
+        cutoff = time.time() - options['grace_days'] * 24 * 60 * 60
+        dry_run = options['dry_run']
+        quarantine_dir = Path(settings.UPLOAD_GC_QUARANTINE_DIR) if options['quarantine'] else None
+
+        # 1. 标记：收集被引用的文件
+        referenced = self._collect_referenced(storage)
+        self.stdout.write(f"被引用的文件：{len(referenced)} 个")
+
+        # 2. 清除：逐月遍历
+        total_count = total_size = 0
+        for month in self._iter_months(media_root, options['month'], options['since']):
+            count = size = scanned = 0
+            with os.scandir(media_root / month) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    scanned += 1
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime > cutoff or self._reference_id(entry.name) in referenced:
+                        continue
+                    count += 1
+                    size += stat.st_size
+                    if dry_run:
+                        continue
+                    if quarantine_dir is not None:
+                        target_dir = quarantine_dir / month
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        shutil.move(entry.path, target_dir / entry.name)
+                    else:
+                        os.remove(entry.path)
+            self.stdout.write(f"{month}：扫描 {scanned} 个，孤儿 {count} 个，{size / 1024 / 1024:.2f} MB")
+            total_count += count
+            total_size += size
+
+        action = '待回收' if dry_run else ('已隔离' if quarantine_dir else '已删除')
+        self.stdout.write(self.style.SUCCESS(f"{action}：{total_count} 个，{total_size / 1024 / 1024:.2f} MB"))
+
+    def _collect_referenced(self, storage) -> set:
+        """流式读取 emp.image，只保留文件标识（UUID 压缩为 16 字节）"""
+        referenced = set()
+        queryset = Emp.objects.exclude(image__isnull=True).exclude(image='').values_list('image', flat=True)
+        for url in queryset.iterator(chunk_size=2000):
+            # 兼容带域名的完整 URL：取 MEDIA_URL 之后的部分
+            index = url.find(storage.base_url)
+            if index < 0:
+                continue
+            key = url[index + len(storage.base_url):]
+            referenced.add(self._reference_id(os.path.basename(key)))
+        return referenced
+
+    @staticmethod
+    def _reference_id(file_name: str):
+        """
+        文件标识：UUID 文件名取 16 字节，衍生图（<uuid>_<规格>.<ext>）归属原图；
+        非 UUID 文件名保留原文件名（不含扩展名）
+        """
+        stem = os.path.splitext(file_name)[0]
+        try:
+            return uuid.UUID(stem.split('_', 1)[0]).bytes
+        except ValueError:
+            return stem
+
+    @staticmethod
+    def _iter_months(media_root: Path, months: list, since: str):
+        """按时间顺序列出待处理的月份目录"""
+        if months:
+            yield from (month for month in sorted(months) if (media_root / month).is_dir())
+            return
+        if not media_root.is_dir():
+            return
+        for year in sorted(entry.name for entry in os.scandir(media_root) if entry.is_dir()):
+            if not year.isdigit():
+                continue
+            for month in sorted(entry.name for entry in os.scandir(media_root / year) if entry.is_dir()):
+                month_path = f"{year}/{month}"
+                if MONTH_PATTERN.match(month_path) and (not since or month_path >= since):
+                    yield month_path
@@ -9,5 +9,6 @@ from .emp_log import EmpLog
 from .clazz import Clazz
 from .student import Student
 from .operate_log import OperateLog
+from .sync_tombstone import SyncTombstone
 
-__all__ = ['Dept', 'Emp', 'EmpExpr', 'EmpLog', 'Clazz', 'Student', 'OperateLog']
+__all__ = ['Dept', 'Emp', 'EmpExpr', 'EmpLog', 'Clazz', 'Student', 'OperateLog', 'SyncTombstone']
@@ -0,0 +1,22 @@
+"""
+同步删除记录实体类
+
+增量同步（/sync/{resource}）用于通知客户端已删除的数据，由各 Service 的删除方法在同一事务中写入
+"""
+
+from django.db import models
+
+
+class SyncTombstone(models.Model):
+    """同步删除记录表"""
+    resource = models.CharField(max_length=20, db_comment='资源（表名）')
+    row_id = models.IntegerField(db_comment='被删除数据的ID')
+    delete_time = models.DateTimeField(db_comment='删除时间')
+
+    class Meta:
+        managed = False
+        db_table = 'sync_tombstone'
+        db_table_comment = '同步删除记录表'
+
+    def __str__(self):
+        return f"{self.resource}#{self.row_id} @ {self.delete_time}"
@@ -2,9 +2,10 @@
 序列化器模块
 """
 
-from .dept import DeptSerializer
-from .emp import EmpSerializer, EmpExprSerializer, EmpDetailSerializer
-from .clazz import ClazzSerializer, ClazzPageSerializer
+from .dept import DeptSerializer, DeptProjection
+from .emp import EmpSerializer, EmpExprSerializer, EmpDetailSerializer, EmpProjection
+from .clazz import ClazzSerializer, ClazzPageSerializer, ClazzProjection, ClazzPageProjection
 
 __all__ = ['DeptSerializer', 'EmpSerializer', 'EmpExprSerializer', 'EmpDetailSerializer',
-           'ClazzSerializer', 'ClazzPageSerializer']
+           'ClazzSerializer', 'ClazzPageSerializer',
+           'DeptProjection', 'EmpProjection', 'ClazzProjection', 'ClazzPageProjection']
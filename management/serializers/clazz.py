@@ -3,11 +3,14 @@
 
 ClazzSerializer: 基础输出（分页列表用）
 ClazzPageSerializer: 分页查询输出（包含 masterName、status）
+ClazzProjection / ClazzPageProjection: 对应的列表快速输出路径（values_list）
 """
 
 from datetime import date
 from rest_framework import serializers
-from ..models import Clazz, Emp
+from ..models import Clazz
+from ..services.dimension_cache_service import DimensionCacheService
+from .projection import ProjectionSerializer
 
 
 class ClazzSerializer(serializers.ModelSerializer):
@@ -34,25 +37,56 @@ class ClazzPageSerializer(serializers.ModelSerializer):
     
     def get_masterName(self, obj):
         """获取班主任姓名"""
-        if obj.master_id:
-            try:
-                emp = Emp.objects.get(pk=obj.master_id)
-                return emp.name
-            except Emp.DoesNotExist:
-                return None
-        return None
+        return DimensionCacheService.getName('emp', obj.master_id)
     
     def get_status(self, obj):
-        """
-        计算班级状态 - 对标 Java 逻辑
-        未开班: 当前日期 < 开课日期
-        已开班: 开课日期 <= 当前日期 <= 结课日期
-        已结课: 当前日期 > 结课日期
-        """
-        today = date.today()
-        if obj.begin_date and today < obj.begin_date:
-            return "未开班"
-        elif obj.end_date and today > obj.end_date:
-            return "已结课"
-        else:
-            return "已开班"
+        """计算班级状态"""
+        return clazz_status(obj.begin_date, obj.end_date, date.today())
+
+
+
+class ClazzProjection(ProjectionSerializer):
+    """班级列表输出 - values_list 快速路径，输出与 ClazzSerializer 一致"""
+    
+    model = Clazz
+    fields = ClazzSerializer.Meta.fields
+
+
+class ClazzPageProjection(ProjectionSerializer):
+    """班级分页输出 - values_list 快速路径，输出与 ClazzPageSerializer 一致"""
+    
+    model = Clazz
+    fields = ClazzPageSerializer.Meta.fields
+    method_columns = {'masterName': ('master_id',), 'status': ('begin_date', 'end_date')}
+    
+    def prepare(self, rows):
+        """一次获取本页全部班主任姓名，当前日期只取一次"""
+        if 'masterName' in self.selected:
+            self.master_names = DimensionCacheService.getNames('emp', {row.master_id for row in rows})
+        self.today = date.today()
+    
+    async def aprepare(self, rows):
+        if 'masterName' in self.selected:
+            self.master_names = await DimensionCacheService.agetNames('emp', {row.master_id for row in rows})
+        self.today = date.today()
+    
+    def get_masterName(self, row):
+        return self.master_names.get(row.master_id)
+    
+    def get_status(self, row):
+        return clazz_status(row.begin_date, row.end_date, self.today)
+
+
+def clazz_status(begin_date, end_date, today) -> str:
+    """
+    计算班级状态 - 对标 Java 逻辑
+    未开班: 当前日期 < 开课日期
+    已开班: 开课日期 <= 当前日期 <= 结课日期
+    已结课: 当前日期 > 结课日期
+    """
+    if begin_date and today < begin_date:
+        return "未开班"
+    elif end_date and today > end_date:
+        return "已结课"
+    else:
+        return "已开班"
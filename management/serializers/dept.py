@@ -6,6 +6,7 @@
 
 from rest_framework import serializers
 from ..models import Dept
+from .projection import ProjectionSerializer
 
 
 class DeptSerializer(serializers.ModelSerializer):
@@ -14,3 +15,11 @@ class DeptSerializer(serializers.ModelSerializer):
     class Meta:
         model = Dept
         fields = ['id', 'name', 'create_time', 'update_time']
+
+
+
+class DeptProjection(ProjectionSerializer):
+    """部门列表输出 - values_list 快速路径，输出与 DeptSerializer 一致"""
+    
+    model = Dept
+    fields = DeptSerializer.Meta.fields
@@ -3,7 +3,11 @@
 """
 
 from rest_framework import serializers
-from ..models import Emp, Dept, EmpExpr
+from ..models import Emp, EmpExpr
+from ..services.image_service import ImageService
+from ..services.dimension_cache_service import DimensionCacheService
+from .projection import ProjectionSerializer
+from .sparse import SparseFieldsMixin
 
 
 class EmpExprSerializer(serializers.ModelSerializer):
@@ -14,26 +18,28 @@ class EmpExprSerializer(serializers.ModelSerializer):
         fields = ['id', 'begin', 'end', 'company', 'job']
 
 
-class EmpSerializer(serializers.ModelSerializer):
+class EmpSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """员工列表输出 DTO"""
     
     dept_name = serializers.SerializerMethodField()
+    image_thumb = serializers.SerializerMethodField()
     
     class Meta:
         model = Emp
         fields = ['id', 'username', 'name', 'gender', 'phone', 
-                  'job', 'salary', 'image', 'entry_date', 
+                  'job', 'salary', 'image', 'image_thumb', 'entry_date', 
                   'dept_id', 'dept_name', 'create_time', 'update_time']
     
     def get_dept_name(self, obj):
         """逻辑外键查询部门名称 - 对标 Java LEFT JOIN"""
-        if obj.dept_id:
-            dept = Dept.objects.filter(pk=obj.dept_id).first()
-            return dept.name if dept else None
-        return None
+        return DimensionCacheService.getName('dept', obj.dept_id)
+    
+    def get_image_thumb(self, obj):
+        """头像缩略图 URL - 缩略图未生成时回退为原图"""
+        return ImageService.getVariantUrl(obj.image)
 
 
-class EmpDetailSerializer(serializers.ModelSerializer):
+class EmpDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """员工详情输出 DTO - 包含工作经历"""
     
     expr_list = serializers.SerializerMethodField()
@@ -48,3 +54,27 @@ class EmpDetailSerializer(serializers.ModelSerializer):
         """获取工作经历列表"""
         expr_list = self.context.get('expr_list', [])
         return EmpExprSerializer(expr_list, many=True).data
+
+
+
+class EmpProjection(ProjectionSerializer):
+    """员工列表输出 - values_list 快速路径，输出与 EmpSerializer 一致"""
+    
+    model = Emp
+    fields = EmpSerializer.Meta.fields
+    method_columns = {'dept_name': ('dept_id',), 'image_thumb': ('image',)}
+    
+    def prepare(self, rows):
+        """一次获取本页全部部门名称（未请求 deptName 时不查询）"""
+        if 'dept_name' in self.selected:
+            self.dept_names = DimensionCacheService.getNames('dept', {row.dept_id for row in rows})
+    
+    async def aprepare(self, rows):
+        if 'dept_name' in self.selected:
+            self.dept_names = await DimensionCacheService.agetNames('dept', {row.dept_id for row in rows})
+    
+    def get_dept_name(self, row):
+        return self.dept_names.get(row.dept_id)
+    
+    def get_image_thumb(self, row):
+        return ImageService.getVariantUrl(row.image)
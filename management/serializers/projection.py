@@ -0,0 +1,253 @@
+"""
+投影序列化器 - 列表接口的快速输出路径
+
+ModelSerializer 需要为每行构建完整的模型实例，再逐字段执行 DRF 序列化；
+列表接口的行数多，这部分开销超过了 SQL 本身。
+
+ProjectionSerializer 只用 values_list 查询需要的列（命名元组行），
+按模型字段类型预先编译格式化函数（日期时间格式与 REST_FRAMEWORK 配置一致），
+输出与对应 ModelSerializer 完全相同的结构和值（字段顺序、空值、日期格式），渲染后的 JSON 逐字节一致。
+传入 fields（见 sparse.parse_fields）时只查询和输出请求的字段。
+
+使用方法：
+
+    class EmpListSerializer(ProjectionSerializer):
+        model = Emp
+        fields = EmpSerializer.Meta.fields
+        method_columns = {'dept_name': ('dept_id',)}
+
+        def prepare(self, rows):           # 可选：输出前批量加载计算字段需要的数据
+            self.dept_names = DimensionCacheService.getNames('dept', {row.dept_id for row in rows})
+
+        def get_dept_name(self, row):      # 与 SerializerMethodField 对应，row 为命名元组
+            return self.dept_names.get(row.dept_id)
+
+    EmpListSerializer(queryset).data
+    EmpListSerializer(queryset, fields=['id', 'name']).data
+    await EmpListSerializer(queryset).adata()      # 异步视图中使用
+"""
+
+from functools import reduce
+from operator import and_, or_
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models
+from django.db.models import F, Q
+from rest_framework.settings import api_settings
+from common.formats import date_formatter, datetime_formatter, identity
+from common.renderers import camel_key
+from .sparse import parse_fields
+
+# 每个类缓存的输出计划数量上限（不同 fields 组合各有一份）
+COMPILED_CACHE_SIZE = 256
+
+
+class ProjectionSerializer:
+    """基于 values_list 的列表输出序列化器"""
+    
+    # 模型
+    model = None
+    # 输出字段（与 ModelSerializer 的 Meta.fields 一致，顺序即输出顺序）
+    fields = []
+    # 计算字段 → 依赖的列，如 {'dept_name': ('dept_id',)}
+    method_columns = {}
+    
+    def __init__(self, queryset, fields: list = None):
+        self.queryset = queryset
+        # 本次输出的字段（按类声明顺序）
+        self.selected = list(self.fields) if fields is None else [name for name in self.fields if name in fields]
+    
+    @classmethod
+    def parse_fields(cls, value: str) -> list:
+        """解析 fields 参数，白名单为 fields"""
+        return parse_fields(value, cls.fields)
+    
+    @property
+    def data(self) -> list:
+        """输出字典列表"""
+        columns, plan = self._compile(tuple(self.selected))
+        rows = list(self.queryset.values_list(*columns, named=True))
+        self.prepare(rows)
+        return self._output(rows, plan)
+    
+    async def adata(self) -> list:
+        """输出字典列表（异步）- 通过异步 ORM 查询，ASGI 下不占用工作线程"""
+        columns, plan = self._compile(tuple(self.selected))
+        rows = [row async for row in self.queryset.values_list(*columns, named=True)]
+        await self.aprepare(rows)
+        return self._output(rows, plan)
+    
+    def stream(self, chunk_size: int = None):
+        """
+        逐行输出字典，键为驼峰（流式响应使用，见 Result.stream）
+        按键集分批查询（每批一条 LIMIT 查询），每批执行一次 prepare，内存占用与总行数无关
+        （MySQL 的 iterator() 会在客户端缓冲整个结果集，不能保证内存有界）
+        """
+        chunk_size = chunk_size or settings.STREAMING_RESPONSE['CHUNK_SIZE']
+        columns, plan = self._compile(tuple(self.selected))
+        camel_plan = self._camel_plan(tuple(self.selected))
+        for chunk in _keyset_batches(self.queryset, columns, chunk_size):
+            self.prepare(chunk)
+            yield from self._output(chunk, camel_plan)
+    
+    def prepare(self, rows: list) -> None:
+        """输出前的批量准备（子类按需覆盖），如一次查询计算字段需要的名称"""
+    
+    async def aprepare(self, rows: list) -> None:
+        """prepare 的异步版本（子类覆盖了 prepare 时按需覆盖），默认在线程中执行 prepare"""
+        if type(self).prepare is not ProjectionSerializer.prepare:
+            await sync_to_async(self.prepare)(rows)
+    
+    def _output(self, rows: list, plan: list) -> list:
+        result = []
+        for row in rows:
+            item = {}
+            for name, index, format, method in plan:
+                if method is not None:
+                    item[name] = method(self, row)
+                else:
+                    value = row[index]
+                    item[name] = None if value is None else format(value)
+            result.append(item)
+        return result
+    
+    @classmethod
+    def _camel_plan(cls, selected: tuple) -> list:
+        """输出计划的驼峰版本 - 字段名预先转换，逐行输出时不再转换"""
+        if '_camel_plans' not in cls.__dict__:
+            cls._camel_plans = {}
+        camel_plan = cls._camel_plans.get(selected)
+        if camel_plan is None:
+            _, plan = cls._compile(selected)
+            camel_plan = [(camel_key(name), index, format, method) for name, index, format, method in plan]
+            if len(cls._camel_plans) >= COMPILED_CACHE_SIZE:
+                cls._camel_plans.clear()
+            cls._camel_plans[selected] = camel_plan
+        return camel_plan
+    
+    @classmethod
+    def _compile(cls, selected: tuple):
+        """按字段类型编译输出计划（每个类、每种字段组合只编译一次）"""
+        if '_compiled' not in cls.__dict__:
+            cls._compiled = {}
+        compiled = cls._compiled.get(selected)
+        if compiled is not None:
+            return compiled
+        
+        model_fields = {field.name: field for field in cls.model._meta.concrete_fields}
+        columns = [name for name in selected if name in model_fields]
+        for name in selected:
+            columns += [column for column in cls.method_columns.get(name, ()) if column not in columns]
+        plan = []
+        for name in selected:
+            method = getattr(cls, f"get_{name}", None)
+            if method is not None:
+                plan.append((name, None, None, method))
+            else:
+                plan.append((name, columns.index(name), _formatter(model_fields[name]), None))
+        if len(cls._compiled) >= COMPILED_CACHE_SIZE:
+            cls._compiled.clear()
+        cls._compiled[selected] = (columns, plan)
+        return columns, plan
+
+
+def _keyset_batches(queryset, columns: list, chunk_size: int):
+    """
+    键集分页 - 按查询集的排序（末尾补 id 保证唯一）分批读取，每批从上一批最后一行之后开始：
+    WHERE (排序列) 在上一批最后一行之后 ORDER BY ... LIMIT chunk_size
+
+    输出顺序与原查询集一致；空值按最小值排序（MySQL、SQLite 的默认行为，其他数据库显式指定 NULLS FIRST / LAST）。
+    查询集带切片（分页）时，第一批从切片起点开始，总行数不超过切片长度
+    """
+    # 1. 解析排序（只支持模型字段名，其他排序表达式按原查询集一次读取）
+    keys = _ordering_keys(queryset)
+    if keys is None:
+        yield list(queryset.values_list(*columns, named=True))
+        return
+    if connections[queryset.db].features.nulls_order_largest:
+        ordering = [F(attname).desc(nulls_last=True) if descending else F(attname).asc(nulls_first=True)
+                    for attname, descending in keys]
+    else:
+        ordering = [f"-{attname}" if descending else attname for attname, descending in keys]
+    query_columns = columns + [attname for attname, _ in keys if attname not in columns]
+
+    # 2. 去掉切片，改为逐批 LIMIT
+    base = queryset.all()
+    low, high = base.query.low_mark, base.query.high_mark
+    base.query.clear_limits()
+    base = base.values_list(*query_columns, named=True).order_by(*ordering)
+    remaining = None if high is None else high - low
+
+    # 3. 逐批读取
+    last = None
+    while remaining is None or remaining > 0:
+        limit = chunk_size if remaining is None else min(chunk_size, remaining)
+        if last is None:
+            batch = list(base[low:low + limit])
+        else:
+            batch = list(base.filter(_after(keys, last))[:limit])
+        if not batch:
+            return
+        yield batch
+        if len(batch) < limit:
+            return
+        last = [getattr(batch[-1], attname) for attname, _ in keys]
+        if remaining is not None:
+            remaining -= len(batch)
+
+
+def _ordering_keys(queryset):
+    """排序键 - [(列名, 是否降序), ...]，末尾为 id；排序含表达式、关联字段或随机排序时返回 None"""
+    query = queryset.query
+    ordering = list(query.order_by) or (list(queryset.model._meta.ordering) if query.default_ordering else [])
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or item == '?':
+            return None
+        descending = item.startswith('-')
+        name = item.lstrip('-')
+        try:
+            field = queryset.model._meta.pk if name == 'pk' else queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many or field.one_to_many:
+            return None
+        keys.append((field.attname, descending))
+    pk = queryset.model._meta.pk.attname
+    if pk not in [attname for attname, _ in keys]:
+        keys.append((pk, keys[-1][1] if keys else False))
+    return keys
+
+
+def _after(keys: list, values: list) -> Q:
+    """键集条件 - 排序在 values 之后的行：前 i 列相等且第 i+1 列在其后（空值最小）"""
+    conditions = []
+    for index, (attname, descending) in enumerate(keys):
+        value = values[index]
+        if value is None:
+            # 降序时空值排在最后，该列没有更靠后的值
+            if descending:
+                continue
+            after = Q(**{f"{attname}__isnull": False})
+        elif descending:
+            after = Q(**{f"{attname}__lt": value}) | Q(**{f"{attname}__isnull": True})
+        else:
+            after = Q(**{f"{attname}__gt": value})
+        equal = [Q(**{f"{name}__isnull": True}) if values[i] is None else Q(**{name: values[i]})
+                 for i, (name, _) in enumerate(keys[:index])]
+        conditions.append(reduce(and_, equal, after))
+    return reduce(or_, conditions)
+
+
+def _formatter(field):
+    """字段格式化函数 - 与 DRF 对应字段的 to_representation 一致（值非空时调用）"""
+    if isinstance(field, models.DateTimeField):
+        return datetime_formatter(api_settings.DATETIME_FORMAT)
+    if isinstance(field, models.DateField):
+        return date_formatter(api_settings.DATE_FORMAT)
+    if isinstance(field, (models.IntegerField, models.AutoField)):
+        return int
+    if isinstance(field, (models.CharField, models.TextField)):
+        return str
+    return identity
@@ -0,0 +1,61 @@
+"""
+稀疏字段集 - 查询参数 fields 指定只返回部分字段
+
+    GET /emps?fields=id,name,deptName
+
+- 字段名使用输出字段名（驼峰，与响应一致），也接受下划线形式
+- 只允许序列化器声明的输出字段（白名单），不在白名单中的字段返回业务错误
+- 输出按序列化器声明的顺序，未请求的计算字段（如 deptName）不执行查询
+
+列表使用 ProjectionSerializer(queryset, fields)，只查询需要的列；
+详情使用 SparseFieldsMixin，配合 Service 中的 .only() 只读取需要的列
+"""
+
+from common.exceptions import BusinessException
+from common.renderers import camel_key
+
+
+def parse_fields(value: str, allowed) -> list:
+    """
+    解析 fields 参数
+
+    Args:
+        value: 逗号分隔的字段名，为空时返回 None（输出全部字段）
+        allowed: 允许的输出字段（序列化器字段名）
+
+    Returns:
+        请求的序列化器字段名列表，按 allowed 中的顺序
+    """
+    if not value:
+        return None
+    names = {}
+    for name in allowed:
+        names[name] = name
+        names[camel_key(name)] = name
+    requested = [item.strip() for item in value.split(',') if item.strip()]
+    if not requested:
+        return None
+    unknown = [item for item in requested if item not in names]
+    if unknown:
+        raise BusinessException(f"不支持的字段：{', '.join(unknown)}")
+    selected = {names[item] for item in requested}
+    return [name for name in allowed if name in selected]
+
+
+class SparseFieldsMixin:
+    """
+    ModelSerializer 稀疏字段支持 - 构造时传入 fields，移除未请求的字段
+
+        serializer = StudentSerializer(student, fields=['id', 'name'])
+    """
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+    
+    @classmethod
+    def parse_fields(cls, value: str) -> list:
+        """解析 fields 参数，白名单为 Meta.fields"""
+        return parse_fields(value, cls.Meta.fields)
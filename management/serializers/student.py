@@ -3,13 +3,17 @@
 
 StudentSerializer: 基础输出
 StudentPageSerializer: 分页查询输出（包含 clazzName）
+StudentPageProjection: 分页列表快速输出路径（values_list）
 """
 
 from rest_framework import serializers
-from ..models import Student, Clazz
+from ..models import Student
+from ..services.dimension_cache_service import DimensionCacheService
+from .projection import ProjectionSerializer
+from .sparse import SparseFieldsMixin
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """学生基础序列化器"""
     
     class Meta:
@@ -19,7 +23,7 @@ class StudentSerializer(serializers.ModelSerializer):
                   'violation_count', 'violation_score', 'create_time', 'update_time']
 
 
-class StudentPageSerializer(serializers.ModelSerializer):
+class StudentPageSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     学生分页查询序列化器 - 包含班级名称
     对标 Java Student 中的 clazzName 字段
@@ -34,10 +38,25 @@ class StudentPageSerializer(serializers.ModelSerializer):
     
     def get_clazzName(self, obj):
         """获取班级名称"""
-        if obj.clazz_id:
-            try:
-                clazz = Clazz.objects.get(pk=obj.clazz_id)
-                return clazz.name
-            except Clazz.DoesNotExist:
-                return None
-        return None
+        return DimensionCacheService.getName('clazz', obj.clazz_id)
+
+
+
+class StudentPageProjection(ProjectionSerializer):
+    """学生分页输出 - values_list 快速路径，输出与 StudentPageSerializer 一致"""
+    
+    model = Student
+    fields = StudentPageSerializer.Meta.fields
+    method_columns = {'clazzName': ('clazz_id',)}
+    
+    def prepare(self, rows):
+        """一次获取本页全部班级名称（未请求 clazzName 时不查询）"""
+        if 'clazzName' in self.selected:
+            self.clazz_names = DimensionCacheService.getNames('clazz', {row.clazz_id for row in rows})
+    
+    async def aprepare(self, rows):
+        if 'clazzName' in self.selected:
+            self.clazz_names = await DimensionCacheService.agetNames('clazz', {row.clazz_id for row in rows})
+    
+    def get_clazzName(self, row):
+        return self.clazz_names.get(row.clazz_id)
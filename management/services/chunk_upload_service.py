@@ -0,0 +1,318 @@
+"""
+分片上传服务层 - 大文件断点续传
+
+对标 Java: 分片上传（init → 上传分片 → 合并）方案
+
+流程：
+1. init：创建上传会话，返回 uploadId、分片大小、分片总数
+2. uploadChunk：按序上传第 N 个分片，请求体直接追加写入临时文件（不在内存中缓冲）
+3. status：查询已确认的偏移量，中断后从该偏移量续传
+4. complete：校验文件完整性，发布到存储后端并返回访问 URL（失败时保留会话，可重试）
+
+会话目录：UPLOAD_CHUNK_TEMP_DIR/<uploadId>/（meta.json + data.part）
+过期会话（超过 UPLOAD_CHUNK_SESSION_TTL 未更新）由 cleanExpired() 回收
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from django.conf import settings
+from common.exceptions import BusinessException
+from .upload_service import UploadService
+
+logger = logging.getLogger(__name__)
+
+# 读取请求体的缓冲块大小（64KB）
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class ChunkUploadService:
+
+    # 同一会话的分片写入串行化（进程内）
+    _locks = {}
+    _locks_guard = threading.Lock()
+    # 上次回收过期会话的时间戳
+    _last_clean_time = 0
+
+    @staticmethod
+    def init(data: dict) -> dict:
+        """
+        初始化分片上传会话
+
+        参数：fileName、fileSize、chunkSize（可选）、fileMd5（可选，合并时校验整个文件）
+        """
+        # 1. 校验参数
+        file_name = data.get('fileName')
+        file_size = ChunkUploadService._parse_int(data.get('fileSize'))
+        if not file_name or not file_size or file_size <= 0:
+            raise BusinessException("文件名或文件大小不合法")
+        if file_size > settings.UPLOAD_CHUNK_MAX_FILE_SIZE:
+            raise BusinessException("文件大小超出限制")
+        chunk_size = ChunkUploadService._parse_int(data.get('chunkSize')) or settings.UPLOAD_CHUNK_SIZE
+        if chunk_size <= 0 or chunk_size > settings.UPLOAD_CHUNK_SIZE:
+            chunk_size = settings.UPLOAD_CHUNK_SIZE
+
+        # 2. 顺带回收过期会话
+        ChunkUploadService.cleanExpired(throttle=True)
+
+        # 3. 创建会话目录和空的数据文件
+        upload_id = uuid.uuid4().hex
+        session_dir = ChunkUploadService._session_dir(upload_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        (session_dir / 'data.part').touch()
+        meta = {
+            'uploadId': upload_id,
+            'fileName': file_name,
+            'fileSize': file_size,
+            'fileMd5': (data.get('fileMd5') or '').lower() or None,
+            'chunkSize': chunk_size,
+            'offset': 0,
+            'createTime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        ChunkUploadService._save_meta(session_dir, meta)
+        logger.info(f"创建分片上传会话：{upload_id}, 文件：{file_name}, 大小：{file_size}")
+        return ChunkUploadService._to_status(meta)
+
+    @staticmethod
+    def status(upload_id: str) -> dict:
+        """查询上传进度 - 客户端据此从已确认的偏移量续传"""
+        session_dir = ChunkUploadService._session_dir(upload_id)
+        meta = ChunkUploadService._load_meta(session_dir)
+        return ChunkUploadService._to_status(meta)
+
+    @staticmethod
+    def uploadChunk(upload_id: str, index: int, stream, length: int, md5: str = None) -> dict:
+        """
+        上传第 index 个分片（从 0 开始）
+
+        业务规则：
+        1. 分片必须按序上传；重复上传已确认的分片直接返回当前进度（幂等）
+        2. 请求体按块读取并追加到 data.part，同时计算 MD5
+        3. 长度或校验和不匹配时，截断回写入前的偏移量，本分片作废
+        """
+        session_dir = ChunkUploadService._session_dir(upload_id)
+        try:
+            with ChunkUploadService._lock_for(session_dir):
+                return ChunkUploadService._write_chunk(session_dir, index, stream, length, md5)
+        finally:
+            # 会话不存在或已过期：不保留锁
+            if not session_dir.exists():
+                ChunkUploadService._release_lock(session_dir)
+
+    @staticmethod
+    def _write_chunk(session_dir: Path, index: int, stream, length: int, md5: str = None) -> dict:
+        """写入分片（调用方持有会话锁）"""
+        meta = ChunkUploadService._load_meta(session_dir)
+        chunk_size = meta['chunkSize']
+        offset = meta['offset']
+
+        # 1. 校验分片序号
+        expected_index = offset // chunk_size
+        if index < expected_index:
+            return ChunkUploadService._to_status(meta)
+        if index > expected_index or offset >= meta['fileSize']:
+            raise BusinessException(f"分片顺序错误，应上传分片：{expected_index}")
+
+        # 2. 校验分片长度
+        expected_length = min(chunk_size, meta['fileSize'] - offset)
+        if length != expected_length:
+            raise BusinessException(f"分片大小错误，应为：{expected_length}")
+
+        # 3. 从已确认的偏移量开始追加写入（丢弃上次中断残留的字节）
+        digest = hashlib.md5()
+        written = 0
+        data_path = session_dir / 'data.part'
+        with open(data_path, 'r+b') as destination:
+            destination.seek(offset)
+            destination.truncate()
+            while written < expected_length:
+                block = stream.read(min(READ_BLOCK_SIZE, expected_length - written))
+                if not block:
+                    break
+                destination.write(block)
+                digest.update(block)
+                written += len(block)
+
+            # 4. 校验长度和 MD5，不通过则截断回原偏移量
+            if written != expected_length or (md5 and digest.hexdigest() != md5.lower()):
+                destination.truncate(offset)
+                raise BusinessException(f"分片 {index} 校验失败，请重新上传")
+
+        # 5. 确认偏移量
+        meta['offset'] = offset + written
+        ChunkUploadService._save_meta(session_dir, meta)
+        return ChunkUploadService._to_status(meta)
+
+    @staticmethod
+    def complete(upload_id: str) -> str:
+        """
+        合并完成 - 校验文件完整性，发布到存储后端（YYYY/MM 目录），返回访问 URL
+
+        校验或发布失败时保留会话和已上传的数据：校验失败可取消后重新上传，发布失败可重新调用 complete
+        """
+        session_dir = ChunkUploadService._session_dir(upload_id)
+        try:
+            with ChunkUploadService._lock_for(session_dir):
+                meta = ChunkUploadService._load_meta(session_dir)
+                if meta['offset'] != meta['fileSize']:
+                    raise BusinessException("文件尚未上传完成")
+
+                # 1. 校验整个文件的 MD5（如果初始化时提供）
+                data_path = session_dir / 'data.part'
+                if meta.get('fileMd5'):
+                    digest = hashlib.md5()
+                    with open(data_path, 'rb') as source:
+                        for block in iter(lambda: source.read(READ_BLOCK_SIZE), b''):
+                            digest.update(block)
+                    if digest.hexdigest() != meta['fileMd5']:
+                        raise BusinessException("文件校验失败，与初始化时的 fileMd5 不一致")
+
+                # 2. 移出会话目录（异步上传时文件在会话删除后仍需保留）
+                staging_dir = Path(settings.UPLOAD_STAGING_DIR)
+                staging_dir.mkdir(parents=True, exist_ok=True)
+                staging_path = staging_dir / session_dir.name
+                shutil.move(str(data_path), str(staging_path))
+
+                # 3. 发布到存储后端（与 UploadService.upload 相同的目录和命名规则）
+                key = UploadService.generateKey(meta['fileName'])
+                try:
+                    url = UploadService.publishFile(staging_path, key)
+                except Exception:
+                    ChunkUploadService._restore(session_dir, meta, staging_path)
+                    raise
+                shutil.rmtree(session_dir, ignore_errors=True)
+        finally:
+            if not session_dir.exists():
+                ChunkUploadService._release_lock(session_dir)
+        logger.info(f"分片上传完成：{session_dir.name}, url：{url}")
+        return url
+
+    @staticmethod
+    def _restore(session_dir: Path, meta: dict, staging_path: Path) -> None:
+        """发布失败后恢复会话 - 暂存文件仍在时移回会话目录，已被删除时（如远程上传失败）从头续传"""
+        data_path = session_dir / 'data.part'
+        if staging_path.exists():
+            shutil.move(str(staging_path), str(data_path))
+            return
+        data_path.touch()
+        meta['offset'] = 0
+        ChunkUploadService._save_meta(session_dir, meta)
+        logger.warning(f"分片上传发布失败且暂存文件已删除，需从头上传：{meta['uploadId']}")
+
+    @staticmethod
+    def abort(upload_id: str) -> None:
+        """取消上传 - 删除会话及已上传的数据"""
+        session_dir = ChunkUploadService._session_dir(upload_id)
+        with ChunkUploadService._lock_for(session_dir):
+            shutil.rmtree(session_dir, ignore_errors=True)
+        ChunkUploadService._release_lock(session_dir)
+
+    @staticmethod
+    def cleanExpired(throttle: bool = False) -> int:
+        """
+        回收过期会话 - 超过 UPLOAD_CHUNK_SESSION_TTL 未更新的会话直接删除，同时释放会话锁
+
+        正在写入分片的会话（锁被占用）跳过，下次回收时再判断
+
+        throttle=True 时，距上次回收不足 1/10 TTL 则跳过（供 init 顺带调用）
+        返回：删除的会话数
+        """
+        ttl = settings.UPLOAD_CHUNK_SESSION_TTL
+        now = time.time()
+        if throttle and now - ChunkUploadService._last_clean_time < ttl / 10:
+            return 0
+        ChunkUploadService._last_clean_time = now
+
+        temp_dir = Path(settings.UPLOAD_CHUNK_TEMP_DIR)
+        if not temp_dir.is_dir():
+            return 0
+        count = 0
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                meta_path = os.path.join(entry.path, 'meta.json')
+                try:
+                    last_modified = os.stat(meta_path).st_mtime
+                except FileNotFoundError:
+                    last_modified = entry.stat().st_mtime
+                if now - last_modified <= ttl:
+                    continue
+                session_dir = Path(entry.path)
+                lock = ChunkUploadService._lock_for(session_dir)
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    shutil.rmtree(session_dir, ignore_errors=True)
+                finally:
+                    lock.release()
+                    ChunkUploadService._release_lock(session_dir)
+                count += 1
+        if count:
+            logger.info(f"回收过期分片上传会话：{count} 个")
+        return count
+
+    @staticmethod
+    def _session_dir(upload_id: str) -> Path:
+        """会话目录 - uploadId 必须是 UUID，防止路径穿越；统一为 32 位小写十六进制（目录名即会话锁的键）"""
+        try:
+            upload_id = uuid.UUID(str(upload_id)).hex
+        except ValueError:
+            raise BusinessException("上传会话不存在")
+        return Path(settings.UPLOAD_CHUNK_TEMP_DIR) / upload_id
+
+    @staticmethod
+    def _load_meta(session_dir: Path) -> dict:
+        try:
+            with open(session_dir / 'meta.json', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise BusinessException("上传会话不存在或已过期")
+
+    @staticmethod
+    def _save_meta(session_dir: Path, meta: dict) -> None:
+        """先写临时文件再原子替换，避免中断时留下半个 meta.json"""
+        tmp_path = session_dir / 'meta.json.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, session_dir / 'meta.json')
+
+    @staticmethod
+    def _to_status(meta: dict) -> dict:
+        chunk_size = meta['chunkSize']
+        return {
+            'uploadId': meta['uploadId'],
+            'chunkSize': chunk_size,
+            'totalChunks': (meta['fileSize'] + chunk_size - 1) // chunk_size,
+            'receivedChunks': (meta['offset'] + chunk_size - 1) // chunk_size,
+            'offset': meta['offset'],
+            'fileSize': meta['fileSize'],
+        }
+
+    @staticmethod
+    def _lock_for(session_dir: Path) -> threading.Lock:
+        """会话锁 - 按规范化后的会话目录名加锁，带横线、大写等不同写法的 uploadId 共用同一把锁"""
+        with ChunkUploadService._locks_guard:
+            return ChunkUploadService._locks.setdefault(session_dir.name, threading.Lock())
+
+    @staticmethod
+    def _release_lock(session_dir: Path) -> None:
+        with ChunkUploadService._locks_guard:
+            ChunkUploadService._locks.pop(session_dir.name, None)
+
+    @staticmethod
+    def _parse_int(value):
+        """将空字符串转为 None，否则转为整数"""
+        if value is None or value == '':
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise BusinessException(f"数字格式错误：{value}")
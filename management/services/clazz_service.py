@@ -5,8 +5,14 @@
 禁止：接收 request 对象、返回 Result、做序列化
 """
 
-from datetime import datetime
-from ..models import Clazz
+import asyncio
+from datetime import date, datetime
+from django.db import transaction
+from common.async_support import alist
+from common.conditional import queryset_version, row_version
+from ..models import Clazz, Emp
+from ..signals import notify_change, snapshot
+from .sync_service import SyncService
 
 
 class ClazzService:
@@ -18,6 +24,29 @@ class ClazzService:
         
         支持条件：name(模糊)、begin、end(结课时间范围)
         """
+        # 1. 查询条件
+        queryset, start, pageSize = ClazzService._pageQuery(params)
+        
+        # 2. 分页
+        total = queryset.count()
+        clazzList = queryset[start:start + pageSize]
+        
+        return {'total': total, 'rows': clazzList}
+    
+    @staticmethod
+    async def apage(params: dict, load_rows=None) -> dict:
+        """
+        分页条件查询（异步）- 总数和当前页两个查询并发执行
+        load_rows：读取当前页的协程函数（参数为当前页查询集），默认读取为模型实例列表
+        """
+        queryset, start, pageSize = ClazzService._pageQuery(params)
+        total, clazzList = await asyncio.gather(queryset.acount(),
+                                                (load_rows or alist)(queryset[start:start + pageSize]))
+        return {'total': total, 'rows': clazzList}
+    
+    @staticmethod
+    def _pageQuery(params: dict) -> tuple:
+        """分页查询条件 - 返回 (排序后的查询集, 起始行, 每页条数)"""
         # 1. 提取查询参数
         name = params.get('name')
         begin = params.get('begin')
@@ -36,12 +65,7 @@ class ClazzService:
         # 3. 排序
         queryset = queryset.order_by('-update_time')
         
-        # 4. 分页
-        total = queryset.count()
-        start = (page - 1) * pageSize
-        clazzList = queryset[start:start + pageSize]
-        
-        return {'total': total, 'rows': clazzList}
+        return queryset, (page - 1) * pageSize, pageSize
     
     @staticmethod
     def findAll():
@@ -50,13 +74,27 @@ class ClazzService:
         """
         return Clazz.objects.all().order_by('-update_time')
     
+    @staticmethod
+    def getVersion(id: int = None):
+        """
+        数据版本 - 用于条件请求（ETag）
+        分页列表包含班主任姓名和按当天日期计算的状态，员工表和日期的变化也会改变版本；
+        传入 id 时为单个班级的版本，班级不存在时返回 None
+        """
+        if id is not None:
+            return row_version(Clazz.objects.filter(pk=id))
+        version = queryset_version(Clazz.objects.all(), Emp.objects.all())
+        if version is None:
+            return None
+        return f"{version},{date.today().isoformat()}"
+    
     @staticmethod
     def save(data: dict) -> Clazz:
         """
         添加班级 - 对标 Java ClazzServiceImpl.save()
         """
         now = datetime.now()
-        return Clazz.objects.create(
+        clazz = Clazz.objects.create(
             name=data.get('name'),
             room=data.get('room') or None,
             begin_date=data.get('beginDate'),
@@ -66,6 +104,8 @@ class ClazzService:
             create_time=now,
             update_time=now
         )
+        notify_change(Clazz, 'create', after=snapshot(Clazz.objects.filter(pk=clazz.id)))
+        return clazz
     
     @staticmethod
     def _parse_int(value):
@@ -82,12 +122,14 @@ class ClazzService:
         return Clazz.objects.get(pk=id)
     
     @staticmethod
+    @transaction.atomic
     def update(data: dict) -> None:
         """
         修改班级 - 对标 Java ClazzServiceImpl.update()
         """
         clazz_id = data.get('id')
         now = datetime.now()
+        before = snapshot(Clazz.objects.select_for_update().filter(pk=clazz_id))
         Clazz.objects.filter(pk=clazz_id).update(
             name=data.get('name'),
             room=data.get('room') or None,
@@ -97,8 +139,10 @@ class ClazzService:
             subject=data.get('subject'),
             update_time=now
         )
+        notify_change(Clazz, 'update', before=before, after=snapshot(Clazz.objects.filter(pk=clazz_id)))
     
     @staticmethod
+    @transaction.atomic
     def delete(id: int) -> None:
         """
         删除班级 - 对标 Java ClazzServiceImpl.delete()
@@ -114,4 +158,7 @@ class ClazzService:
             raise BusinessException("班级下有学生，不能删除")
         
         # 2. 删除班级
+        before = snapshot(Clazz.objects.select_for_update().filter(pk=id))
         Clazz.objects.filter(pk=id).delete()
+        SyncService.recordDeletes(Clazz, [row['id'] for row in before])
+        notify_change(Clazz, 'delete', before=before)
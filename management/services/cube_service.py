@@ -0,0 +1,246 @@
+"""
+统计立方体服务层 - 任意维度组合的即席统计
+
+将 emp / student 的分类字段和数值字段加载为 NumPy 列式快照（进程内缓存），
+在快照上做向量化分组：计数、求和、均值、分位数、直方图，不再为每种统计写 GROUP BY。
+
+- 分组：各维度先 np.unique 编码，再 ravel_multi_index 合成组合键，一次 np.unique 得到分组
+- 计数/求和：np.bincount
+- 分位数：按 (分组, 数值) lexsort 后，按各组起止下标一次性插值
+- 直方图：全局统一分桶边界，(分组, 桶) 二维 bincount
+
+快照刷新：Service 写操作通过 data_changed 信号标记快照过期，下次查询时重新加载（本进程写后即读一致）；
+超过 CUBE_SNAPSHOT_TTL 秒的快照也会重新加载，兼顾多进程部署。
+快照本身就是查询结果的缓存，/report/cube 不再使用响应缓存（否则写操作后会把旧快照的结果按新标签版本缓存）。
+"""
+
+import logging
+import threading
+import time
+import numpy as np
+from django.conf import settings
+from django.dispatch import receiver
+from common.exceptions import BusinessException
+from ..models import Emp, Student
+from ..signals import data_changed
+
+logger = logging.getLogger(__name__)
+
+# 加载快照时每批转换的行数
+LOAD_BATCH_SIZE = 50000
+# 直方图最大桶数
+MAX_BINS = 100
+
+
+class CubeService:
+
+    # 资源配置：模型、分类维度、数值字段
+    RESOURCES = {
+        'emp': {
+            'model': Emp,
+            'dims': ['gender', 'job', 'dept_id'],
+            'measures': ['salary'],
+        },
+        'student': {
+            'model': Student,
+            'dims': ['gender', 'degree', 'clazz_id', 'is_college'],
+            'measures': ['violation_count', 'violation_score'],
+        },
+    }
+
+    # 资源名 → {'columns': {字段: ndarray}, 'size': 行数, 'load_time': 加载时间}
+    _snapshots = {}
+    # 已被写操作标记为过期的资源
+    _stale = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def query(params: dict) -> dict:
+        """
+        即席统计查询
+
+        参数：
+        - resource：emp（默认）/ student
+        - dims：分组维度，逗号分隔，如 dept_id,job；为空时统计全体
+        - field：数值字段（emp: salary；student: violation_count、violation_score），
+                 指定后返回 sum、mean、percentiles
+        - percentiles：分位数，逗号分隔，默认 25,50,90
+        - bins：直方图桶数，默认 0（不返回直方图）
+        """
+        # 1. 校验参数
+        resource = params.get('resource') or 'emp'
+        config = CubeService.RESOURCES.get(resource)
+        if config is None:
+            raise BusinessException(f"不支持的统计对象：{resource}")
+        dims = [dim for dim in (params.get('dims') or '').split(',') if dim]
+        for dim in dims:
+            if dim not in config['dims'] or dims.count(dim) > 1:
+                raise BusinessException(f"不支持的分组维度：{dim}")
+        field = params.get('field') or None
+        if field and field not in config['measures']:
+            raise BusinessException(f"不支持的统计字段：{field}")
+        try:
+            percentiles = [float(p) for p in (params.get('percentiles') or '25,50,90').split(',') if p]
+            bins = int(params.get('bins') or 0)
+        except ValueError:
+            raise BusinessException("分位数或桶数格式错误")
+        if any(p < 0 or p > 100 for p in percentiles) or bins < 0 or bins > MAX_BINS:
+            raise BusinessException("分位数应在 0~100 之间，桶数不超过 100")
+
+        # 2. 在快照上计算
+        snapshot = CubeService._get_snapshot(resource)
+        result = CubeService.aggregate(snapshot['columns'], snapshot['size'], dims, field, percentiles, bins)
+        result['total'] = snapshot['size']
+        return result
+
+    @staticmethod
+    def aggregate(columns: dict, size: int, dims: list, field: str = None,
+                  percentiles: list = (), bins: int = 0) -> dict:
+        """
+        向量化分组统计
+
+        分类字段空值编码为 -1（输出为 None），数值字段空值为 NaN（不参与数值统计）
+        """
+        # 1. 计算每行所属分组
+        if dims:
+            codes, sizes, uniques = [], [], []
+            for dim in dims:
+                unique, inverse = np.unique(columns[dim], return_inverse=True)
+                uniques.append(unique)
+                codes.append(inverse.ravel())
+                sizes.append(len(unique))
+            combined = np.ravel_multi_index(codes, sizes) if size else np.empty(0, dtype=np.int64)
+            group_ids, inverse = np.unique(combined, return_inverse=True)
+            inverse = inverse.ravel()
+            key_codes = np.unravel_index(group_ids, sizes) if len(group_ids) else [[]] * len(dims)
+            keys = [unique[code] for unique, code in zip(uniques, key_codes)]
+            group_count = len(group_ids)
+        else:
+            inverse = np.zeros(size, dtype=np.int64)
+            keys = []
+            group_count = 1 if size else 0
+
+        # 2. 计数
+        counts = np.bincount(inverse, minlength=group_count)
+        rows = []
+        for index in range(group_count):
+            rows.append({
+                'key': [None if key[index] < 0 else int(key[index]) for key in keys],
+                'count': int(counts[index]),
+            })
+        result = {'dims': dims, 'field': field, 'rows': rows}
+        if not field:
+            return result
+
+        # 3. 数值统计（忽略空值）
+        values = columns[field]
+        valid = ~np.isnan(values)
+        groups = inverse[valid]
+        values = values[valid]
+        value_counts = np.bincount(groups, minlength=group_count)
+        sums = np.bincount(groups, weights=values, minlength=group_count)
+        has_values = value_counts > 0
+        means = np.full(group_count, np.nan)
+        np.divide(sums, value_counts, out=means, where=has_values)
+
+        # 4. 分位数：组内排序后按下标线性插值（与 np.percentile 默认算法一致）
+        order = np.lexsort((values, groups))
+        sorted_values = values[order]
+        starts = np.cumsum(value_counts) - value_counts
+        quantiles = {}
+        for p in percentiles:
+            position = (value_counts - 1).clip(min=0) * (p / 100)
+            low = np.floor(position).astype(np.int64)
+            high = np.ceil(position).astype(np.int64)
+            quantile = np.full(group_count, np.nan)
+            if values.size:
+                low_values = sorted_values[(starts + low)[has_values]]
+                high_values = sorted_values[(starts + high)[has_values]]
+                fraction = (position - low)[has_values]
+                quantile[has_values] = low_values + (high_values - low_values) * fraction
+            quantiles[f"p{p:g}"] = quantile
+
+        # 5. 直方图：全局统一桶边界，便于跨分组比较
+        if bins:
+            edges = np.histogram_bin_edges(values, bins=bins) if values.size else np.linspace(0, 1, bins + 1)
+            bucket = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, bins - 1)
+            histogram = np.bincount(groups * bins + bucket, minlength=group_count * bins).reshape(group_count, bins)
+            result['bins'] = [float(edge) for edge in edges]
+
+        for index, row in enumerate(rows):
+            row['valueCount'] = int(value_counts[index])
+            row['sum'] = CubeService._to_number(sums[index])
+            row['mean'] = CubeService._to_number(means[index])
+            row['percentiles'] = {name: CubeService._to_number(q[index]) for name, q in quantiles.items()}
+            if bins:
+                row['histogram'] = histogram[index].tolist()
+        return result
+
+    @staticmethod
+    def _get_snapshot(resource: str) -> dict:
+        """获取快照 - 不存在、被写操作标记过期或超过 TTL 时重新加载（加载期间的写操作重新标记过期）"""
+        snapshot = CubeService._snapshots.get(resource)
+        if not CubeService._need_reload(resource, snapshot):
+            return snapshot
+        with CubeService._lock:
+            snapshot = CubeService._snapshots.get(resource)
+            if CubeService._need_reload(resource, snapshot):
+                CubeService._stale.discard(resource)
+                snapshot = CubeService.loadSnapshot(resource)
+                CubeService._snapshots[resource] = snapshot
+        return snapshot
+
+    @staticmethod
+    def _need_reload(resource: str, snapshot: dict) -> bool:
+        if snapshot is None:
+            return True
+        if resource in CubeService._stale:
+            return True
+        return time.time() - snapshot['load_time'] > settings.CUBE_SNAPSHOT_TTL
+
+    @staticmethod
+    def loadSnapshot(resource: str) -> dict:
+        """流式读取资源的维度列和数值列，分批转换为紧凑的列式数组（不经过缓存）"""
+        start_time = time.time()
+        config = CubeService.RESOURCES[resource]
+        fields = config['dims'] + config['measures']
+        parts = {field: [] for field in fields}
+
+        def flush(batch):
+            for field, column in zip(fields, zip(*batch)):
+                if field in config['measures']:
+                    parts[field].append(np.array([np.nan if v is None else v for v in column], dtype=np.float64))
+                else:
+                    parts[field].append(np.array([-1 if v is None else v for v in column], dtype=np.int32))
+
+        batch = []
+        queryset = config['model'].objects.order_by().values_list(*fields)
+        for row in queryset.iterator(chunk_size=LOAD_BATCH_SIZE):
+            batch.append(row)
+            if len(batch) >= LOAD_BATCH_SIZE:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+        columns = {}
+        for field in fields:
+            dtype = np.float64 if field in config['measures'] else np.int32
+            columns[field] = np.concatenate(parts[field]) if parts[field] else np.empty(0, dtype=dtype)
+        size = len(columns[fields[0]])
+        logger.info(f"加载统计快照：{resource}, {size} 行, 耗时 {int((time.time() - start_time) * 1000)}ms")
+        return {'columns': columns, 'size': size, 'load_time': time.time()}
+
+    @staticmethod
+    def _to_number(value):
+        """NaN 转为 None，整数值去掉小数部分"""
+        if np.isnan(value):
+            return None
+        value = float(value)
+        return int(value) if value.is_integer() else round(value, 4)
+
+
+@receiver(data_changed, sender=Emp)
+@receiver(data_changed, sender=Student)
+def _on_data_changed(sender, **kwargs):
+    CubeService._stale.add('emp' if sender is Emp else 'student')
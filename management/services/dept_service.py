@@ -6,7 +6,11 @@
 """
 
 from datetime import datetime
+from django.db import transaction
+from common.conditional import queryset_version, row_version
 from ..models import Dept
+from ..signals import notify_change, snapshot
+from .sync_service import SyncService
 
 
 class DeptService:
@@ -21,25 +25,41 @@ class DeptService:
         """根据ID查询部门"""
         return Dept.objects.get(pk=id)
     
+    @staticmethod
+    def getVersion(id: int = None):
+        """
+        数据版本 - 用于条件请求（ETag）
+        传入 id 时为单个部门的版本，部门不存在时返回 None
+        """
+        if id is not None:
+            return row_version(Dept.objects.filter(pk=id))
+        return queryset_version(Dept.objects.all())
+    
     @staticmethod
     def add(data: dict) -> Dept:
         """新增部门"""
         name = data.get('name')
         now = datetime.now()
-        return Dept.objects.create(name=name, create_time=now, update_time=now)
+        dept = Dept.objects.create(name=name, create_time=now, update_time=now)
+        notify_change(Dept, 'create', after=snapshot(Dept.objects.filter(pk=dept.id)))
+        return dept
     
     @staticmethod
+    @transaction.atomic
     def update(data: dict) -> Dept:
         """修改部门"""
         id = data.get('id')
         name = data.get('name')
+        before = snapshot(Dept.objects.select_for_update().filter(pk=id))
         dept = Dept.objects.get(pk=id)
         dept.name = name
         dept.update_time = datetime.now()
         dept.save()
+        notify_change(Dept, 'update', before=before, after=snapshot(Dept.objects.filter(pk=id)))
         return dept
     
     @staticmethod
+    @transaction.atomic
     def deleteById(id: int) -> None:
         """
         删除部门 - 对标 Java DeptServiceImpl.deleteById()
@@ -55,4 +75,7 @@ class DeptService:
             raise BusinessException("部门下有员工，不能删除")
         
         # 2. 删除部门
+        before = snapshot(Dept.objects.select_for_update().filter(pk=id))
         Dept.objects.filter(pk=id).delete()
+        SyncService.recordDeletes(Dept, [row['id'] for row in before])
+        notify_change(Dept, 'delete', before=before)
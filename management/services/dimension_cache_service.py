@@ -0,0 +1,243 @@
+"""
+维度名称缓存服务 - 部门 / 班级 / 员工的 ID → 名称查询
+
+名称被序列化器、日志查询和报表频繁查询，但很少变化，采用两级缓存：
+- L1：进程内 LRU（容量 DIMENSION_CACHE['L1_SIZE']），记录所属的维度版本
+- L2：Django cache（DIMENSION_CACHE['CACHE_ALIAS']），key 中带维度版本，多进程 / 多节点共享
+
+失效：部门、班级、员工的写操作提交后（data_changed 信号），名称有变化时提升维度版本号。
+版本号保存在共享缓存中，各进程每 VERSION_CHECK_INTERVAL 秒检查一次，版本变化时清空 L1；
+L1 条目最长保留 L1_TTL 秒，即使缓存不共享（如本地内存缓存），其他进程最迟 L1_TTL 秒后也能看到变化
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.dispatch import receiver
+from common.conditional import queryset_version
+from ..models import Clazz, Dept, Emp
+from ..signals import data_changed
+
+KEY_PREFIX = 'dimension'
+
+
+class DimensionCacheService:
+
+    # 维度名称 → 模型（都有 name 字段）
+    DIMENSIONS = {
+        'dept': Dept,
+        'clazz': Clazz,
+        'emp': Emp,
+    }
+
+    # 维度名称 → L1 状态 {'version', 'checked', 'loaded', 'items': OrderedDict, 'all': dict, 'options': (数据版本, list)}
+    _local = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def getName(dimension: str, id):
+        """根据 ID 获取名称，不存在时返回 None"""
+        if id is None:
+            return None
+        return DimensionCacheService.getNames(dimension, [id]).get(id)
+
+    @staticmethod
+    def getNames(dimension: str, ids) -> dict:
+        """
+        批量获取名称 - 返回 {ID: 名称}，不存在的 ID 对应 None
+        依次查询 L1、L2，剩余的一次查询数据库
+        """
+        ids = {id for id in ids if id is not None}
+        if not ids:
+            return {}
+
+        # 1. L1
+        names, version = DimensionCacheService._localNames(dimension, ids)
+        missing = ids - names.keys()
+        if not missing:
+            return names
+
+        # 2. L2
+        config = settings.DIMENSION_CACHE
+        cache = caches[config['CACHE_ALIAS']]
+        loaded = {}
+        if config['L2_ENABLED']:
+            keys = {DimensionCacheService._item_key(dimension, version, id): id for id in missing}
+            for key, value in cache.get_many(list(keys)).items():
+                loaded[keys[key]] = value[0]
+            missing -= loaded.keys()
+
+        # 3. 数据库
+        if missing:
+            model = DimensionCacheService.DIMENSIONS[dimension]
+            found = dict(model.objects.filter(id__in=missing).values_list('id', 'name'))
+            fetched = {id: found.get(id) for id in missing}
+            if config['L2_ENABLED']:
+                cache.set_many({DimensionCacheService._item_key(dimension, version, id): (name,)
+                                for id, name in fetched.items()}, timeout=config['L2_TTL'])
+            loaded.update(fetched)
+
+        # 4. 写入 L1（期间版本已变化则不写入，避免缓存失效前读到的旧名称）
+        DimensionCacheService._remember(dimension, version, loaded)
+        names.update(loaded)
+        return names
+
+    @staticmethod
+    async def agetNames(dimension: str, ids) -> dict:
+        """批量获取名称（异步）- L1 全部命中时直接返回，否则在线程中执行 getNames"""
+        ids = {id for id in ids if id is not None}
+        names, _ = DimensionCacheService._localNames(dimension, ids)
+        if len(names) == len(ids):
+            return names
+        return await sync_to_async(DimensionCacheService.getNames)(dimension, ids)
+
+    @staticmethod
+    def getAll(dimension: str) -> dict:
+        """获取维度的全部 {ID: 名称}（整体缓存，用于报表连接名称）"""
+        with DimensionCacheService._lock:
+            state = DimensionCacheService._state(dimension)
+            version = state['version']
+            if state['all'] is not None:
+                return dict(state['all'])
+
+        config = settings.DIMENSION_CACHE
+        cache = caches[config['CACHE_ALIAS']]
+        key = DimensionCacheService._item_key(dimension, version, 'all')
+        names = cache.get(key) if config['L2_ENABLED'] else None
+        if names is None:
+            model = DimensionCacheService.DIMENSIONS[dimension]
+            names = dict(model.objects.values_list('id', 'name'))
+            if config['L2_ENABLED']:
+                cache.set(key, names, timeout=config['L2_TTL'])
+
+        with DimensionCacheService._lock:
+            state = DimensionCacheService._state(dimension)
+            if state['version'] == version:
+                state['all'] = names
+        return dict(names)
+
+    @staticmethod
+    async def agetAll(dimension: str) -> dict:
+        """获取维度的全部 {ID: 名称}（异步）- L1 未命中时在线程中执行 getAll"""
+        with DimensionCacheService._lock:
+            names = DimensionCacheService._state(dimension)['all']
+        if names is not None:
+            return dict(names)
+        return await sync_to_async(DimensionCacheService.getAll)(dimension)
+
+    @staticmethod
+    def getOptions(dimension: str, prefix: str = None, version: str = None) -> list:
+        """
+        下拉选项 - 返回 [[ID, 名称], ...]，按 ID 升序
+        排序结果按数据版本（getOptionsVersion）缓存在 L1，数据库有变化（包括其他进程的写操作）时重新查询，
+        返回的选项与 ETag 对应；prefix 为名称前缀（不区分大小写）
+        version 为调用方已查询的数据版本（如 @conditional_get 计算 ETag 时的 request.data_version），
+        为空时在此查询，保证每个请求只执行一次版本查询；最近刚修改（版本为 None）时直接查询，不缓存
+        """
+        if version is None:
+            version = DimensionCacheService.getOptionsVersion(dimension)
+        with DimensionCacheService._lock:
+            cached = DimensionCacheService._state(dimension)['options']
+        if version is not None and cached is not None and cached[0] == version:
+            options = cached[1]
+        else:
+            model = DimensionCacheService.DIMENSIONS[dimension]
+            options = [list(row) for row in model.objects.order_by('id').values_list('id', 'name')]
+            if version is not None:
+                with DimensionCacheService._lock:
+                    DimensionCacheService._state(dimension)['options'] = (version, options)
+
+        if not prefix:
+            return options
+        prefix = prefix.casefold()
+        return [option for option in options if option[1] and option[1].casefold().startswith(prefix)]
+
+    @staticmethod
+    def getOptionsVersion(dimension: str) -> str:
+        """下拉选项的数据版本（用于 ETag）- 来自数据库（MAX(update_time) + COUNT），各进程一致；最近刚修改时为 None"""
+        return queryset_version(DimensionCacheService.DIMENSIONS[dimension].objects.all())
+
+    @staticmethod
+    def invalidate(dimension: str) -> None:
+        """提升维度版本号 - 本进程立即生效，其他进程在下次版本检查时生效"""
+        config = settings.DIMENSION_CACHE
+        version = uuid.uuid4().hex
+        caches[config['CACHE_ALIAS']].set(DimensionCacheService._version_key(dimension), version, timeout=None)
+        with DimensionCacheService._lock:
+            DimensionCacheService._local[dimension] = DimensionCacheService._new_state(version)
+
+    @staticmethod
+    def _state(dimension: str) -> dict:
+        """获取 L1 状态（调用方持有锁）- 到达检查间隔时与共享版本号比对"""
+        config = settings.DIMENSION_CACHE
+        now = time.time()
+        state = DimensionCacheService._local.get(dimension)
+        if state is not None and now - state['checked'] < config['VERSION_CHECK_INTERVAL']:
+            return state
+
+        cache = caches[config['CACHE_ALIAS']]
+        version_key = DimensionCacheService._version_key(dimension)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(version_key)
+        if state is None or state['version'] != version or now - state['loaded'] > config['L1_TTL']:
+            state = DimensionCacheService._new_state(version)
+            DimensionCacheService._local[dimension] = state
+        state['checked'] = now
+        return state
+
+    @staticmethod
+    def _localNames(dimension: str, ids: set) -> tuple:
+        """查询 L1 - 返回 ({ID: 名称}（只含命中的 ID）, 维度版本)"""
+        names = {}
+        with DimensionCacheService._lock:
+            state = DimensionCacheService._state(dimension)
+            items = state['items']
+            for id in ids:
+                if id in items:
+                    items.move_to_end(id)
+                    names[id] = items[id]
+            return names, state['version']
+
+    @staticmethod
+    def _remember(dimension: str, version: str, names: dict) -> None:
+        with DimensionCacheService._lock:
+            state = DimensionCacheService._local.get(dimension)
+            if state is None or state['version'] != version:
+                return
+            items = state['items']
+            items.update(names)
+            while len(items) > settings.DIMENSION_CACHE['L1_SIZE']:
+                items.popitem(last=False)
+
+    @staticmethod
+    def _new_state(version: str) -> dict:
+        now = time.time()
+        return {'version': version, 'checked': now, 'loaded': now, 'items': OrderedDict(), 'all': None, 'options': None}
+
+    @staticmethod
+    def _version_key(dimension: str) -> str:
+        return f"{KEY_PREFIX}:{dimension}:version"
+
+    @staticmethod
+    def _item_key(dimension: str, version: str, id) -> str:
+        return f"{KEY_PREFIX}:{dimension}:{version}:{id}"
+
+
+@receiver(data_changed, sender=Dept)
+@receiver(data_changed, sender=Clazz)
+@receiver(data_changed, sender=Emp)
+def _on_data_changed(sender, before, after, **kwargs):
+    """新增、删除或名称变化时失效对应维度"""
+    before_names = {row['id']: row['name'] for row in before}
+    after_names = {row['id']: row['name'] for row in after}
+    if before_names == after_names:
+        return
+    for dimension, model in DimensionCacheService.DIMENSIONS.items():
+        if model is sender:
+            DimensionCacheService.invalidate(dimension)
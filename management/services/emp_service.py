@@ -5,11 +5,16 @@
 禁止：接收 request 对象、返回 Result、做序列化
 """
 
+import asyncio
 import hashlib
 from datetime import datetime
 from django.db import transaction
-from ..models import Emp, EmpExpr
+from common.async_support import alist
+from common.conditional import queryset_version, row_version
+from ..models import Dept, Emp, EmpExpr
+from ..signals import notify_change, snapshot
 from .emp_log_service import EmpLogService
+from .sync_service import SyncService
 
 
 class EmpService:
@@ -19,6 +24,29 @@ class EmpService:
         """
         分页条件查询 - 对标 Java PageHelper + 动态 SQL
         """
+        # 1. 查询条件
+        queryset, start, pageSize = EmpService._pageQuery(params)
+        
+        # 2. 分页（对标 PageHelper）
+        total = queryset.count()
+        empList = queryset[start:start + pageSize]
+        
+        return {'total': total, 'rows': empList}
+    
+    @staticmethod
+    async def apage(params: dict, load_rows=None) -> dict:
+        """
+        分页条件查询（异步）- 总数和当前页两个查询并发执行
+        load_rows：读取当前页的协程函数（参数为当前页查询集），默认读取为模型实例列表
+        """
+        queryset, start, pageSize = EmpService._pageQuery(params)
+        total, empList = await asyncio.gather(queryset.acount(),
+                                              (load_rows or alist)(queryset[start:start + pageSize]))
+        return {'total': total, 'rows': empList}
+    
+    @staticmethod
+    def _pageQuery(params: dict) -> tuple:
+        """分页查询条件 - 返回 (排序后的查询集, 起始行, 每页条数)"""
         # 1. 提取查询参数
         name = params.get('name')
         gender = params.get('gender')
@@ -39,12 +67,7 @@ class EmpService:
         # 3. 排序
         queryset = queryset.order_by('-update_time')
         
-        # 4. 分页（对标 PageHelper）
-        total = queryset.count()
-        start = (page - 1) * pageSize
-        empList = queryset[start:start + pageSize]
-        
-        return {'total': total, 'rows': empList}
+        return queryset, (page - 1) * pageSize, pageSize
     
     @staticmethod
     def findAll():
@@ -53,6 +76,17 @@ class EmpService:
         """
         return Emp.objects.all().order_by('-update_time')
     
+    @staticmethod
+    def getVersion(id: int = None):
+        """
+        数据版本 - 用于条件请求（ETag）
+        列表包含部门名称，部门表的变化也会改变版本；
+        传入 id 时为单个员工的版本（工作经历随员工一起修改），员工不存在时返回 None
+        """
+        if id is not None:
+            return row_version(Emp.objects.filter(pk=id))
+        return queryset_version(Emp.objects.all(), Dept.objects.all())
+    
     @staticmethod
     @transaction.atomic  # 对标 @Transactional(rollbackFor = Exception.class)
     def save(data: dict) -> Emp:
@@ -98,6 +132,8 @@ class EmpService:
                 if valid_exprs:
                     EmpExpr.objects.bulk_create(valid_exprs)
             
+            # 3. 通知数据变更（事务提交后）
+            notify_change(Emp, 'create', after=snapshot(Emp.objects.filter(pk=emp.id)))
             return emp
         finally:
             # 3. 记录操作日志（finally 确保日志记录）
@@ -118,18 +154,28 @@ class EmpService:
         包含：员工基本信息、工作经历
         """
         # 1. 批量删除员工基本信息
+        before = snapshot(Emp.objects.select_for_update().filter(pk__in=ids))
         Emp.objects.filter(pk__in=ids).delete()
         # 2. 批量删除员工工作经历信息
         EmpExpr.objects.filter(emp_id__in=ids).delete()
+        # 3. 记录删除（增量同步）
+        SyncService.recordDeletes(Emp, [row['id'] for row in before])
+        # 4. 通知数据变更（事务提交后）
+        notify_change(Emp, 'delete', before=before)
     
     @staticmethod
-    def getInfo(id: int) -> dict:
+    def getInfo(id: int, fields: list = None) -> dict:
         """
         根据ID查询员工详情 - 对标 Java EmpServiceImpl.getInfo()
         返回：员工基本信息 + 工作经历列表
+        fields: 需要的输出字段（None 为全部），只读取对应的列，未请求工作经历时不查询
         """
-        emp = Emp.objects.get(pk=id)
-        exprList = EmpExpr.objects.filter(emp_id=id)
+        queryset = Emp.objects.all()
+        if fields is not None:
+            columns = {field.name for field in Emp._meta.concrete_fields}
+            queryset = queryset.only('id', *[name for name in fields if name in columns])
+        emp = queryset.get(pk=id)
+        exprList = EmpExpr.objects.filter(emp_id=id) if fields is None or 'expr_list' in fields else []
         return {'emp': emp, 'exprList': exprList}
     
     @staticmethod
@@ -143,6 +189,7 @@ class EmpService:
         now = datetime.now()
         
         # 1. 更新员工基本信息
+        before = snapshot(Emp.objects.select_for_update().filter(pk=emp_id))
         Emp.objects.filter(pk=emp_id).update(
             username=data.get('username'),
             name=data.get('name'),
@@ -176,6 +223,9 @@ class EmpService:
             ]
             if valid_exprs:
                 EmpExpr.objects.bulk_create(valid_exprs)
+        
+        # 3. 通知数据变更（事务提交后）
+        notify_change(Emp, 'update', before=before, after=snapshot(Emp.objects.filter(pk=emp_id)))
     
     @staticmethod
     def login(username: str, password: str) -> dict:
@@ -0,0 +1,20 @@
+"""
+变更事件服务 - 把数据变更转换为事件流（common.events）中的 change 事件
+
+写操作提交后（data_changed 信号）发布：{"resource": "emp", "action": "update", "ids": [1, 2]}
+看板收到事件后按需重新拉取报表、列表，不再轮询
+"""
+
+from django.dispatch import receiver
+from common.events import publish
+from ..models import Clazz, Dept, Emp, Student
+from ..signals import data_changed
+
+
+@receiver(data_changed, sender=Emp)
+@receiver(data_changed, sender=Student)
+@receiver(data_changed, sender=Clazz)
+@receiver(data_changed, sender=Dept)
+def _on_data_changed(sender, action, before, after, **kwargs):
+    ids = sorted({row['id'] for row in before} | {row['id'] for row in after})
+    publish('change', {'resource': sender._meta.db_table, 'action': action, 'ids': ids})
@@ -0,0 +1,199 @@
+"""
+图片衍生图服务层 - 头像缩略图后台生成
+
+职责：
+1. 图片上传完成后，将原图交给后台线程池生成缩放后的 WebP/JPEG 衍生图，不阻塞上传请求
+2. 列表序列化时根据原图 URL 返回衍生图 URL，衍生图未就绪时回退为原图
+
+衍生图生成后登记在共享缓存中（IMAGE_VARIANT_CACHE_ALIAS）。登记只是加速：缓存为进程内缓存、被淘汰或重启后，
+未登记的衍生图回退到检查存储后端，检查结果重新登记：
+- 本地存储：序列化时直接检查文件是否存在（一次 stat）
+- 远程存储：每次检查都是一次 HEAD 请求，交给后台线程执行，本次先返回原图，检查到后登记
+
+衍生图与原图放在同一目录，命名规则：<原图名>_<规格>.<webp|jpg>
+例如：/media/2025/12/xxx.png → /media/2025/12/xxx_thumb.webp
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from django.conf import settings
+from django.core.cache import caches
+from common.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# 支持生成衍生图的原图扩展名
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+
+# 衍生图格式：扩展名 → Pillow 格式名
+VARIANT_FORMATS = {'webp': 'WEBP', 'jpg': 'JPEG'}
+
+# 就绪/未就绪缓存的最大条目数，超出后整体清空重建
+READY_CACHE_SIZE = 10000
+
+
+class ImageService:
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    # 已确认就绪的衍生图 key
+    _ready = set()
+    # 确认未登记的衍生图 key → 检查时间（短时间内不重复查询共享缓存）
+    _missing = {}
+
+    @staticmethod
+    def isImage(key: str) -> bool:
+        return os.path.splitext(str(key))[1].lower() in IMAGE_EXTENSIONS
+
+    @staticmethod
+    def submit(source_path, key: str, remove_source: bool = False) -> bool:
+        """
+        提交衍生图生成任务 - 非图片文件直接忽略
+
+        Args:
+            source_path: 原图的本地路径
+            key: 原图的存储 key
+            remove_source: 生成完成后是否删除本地原图（远程存储的暂存文件）
+        Returns:
+            是否已提交
+        """
+        if not ImageService.isImage(key):
+            return False
+        ImageService._get_executor().submit(ImageService.generateVariants, str(source_path), key, remove_source)
+        logger.info(f"提交衍生图任务：{key}")
+        return True
+
+    @staticmethod
+    def generateVariants(source_path: str, key: str, remove_source: bool = False) -> list:
+        """
+        生成所有规格的衍生图并保存到存储后端（在后台线程中执行）
+
+        存储后端保证写入原子性，衍生图存在即代表已完整可用
+        返回：生成的衍生图 key 列表
+        """
+        generated = []
+        try:
+            from PIL import Image, ImageOps
+        except ImportError:
+            logger.warning("未安装 Pillow，跳过衍生图生成")
+            Image = None
+
+        try:
+            if Image is not None:
+                generated = ImageService._render(Image, ImageOps, source_path, key)
+        except Exception as e:
+            logger.error(f"生成衍生图失败：{key}, {e}")
+        finally:
+            if remove_source:
+                os.remove(source_path)
+        return generated
+
+    @staticmethod
+    def getVariantUrl(url: str, variant: str = 'thumb', extension: str = 'webp') -> str:
+        """
+        根据原图 URL 获取衍生图 URL - 衍生图未就绪时返回原图 URL
+
+        只处理当前存储后端下的图片，其他 URL 原样返回
+        """
+        storage = get_storage()
+        key = storage.key_from_url(url)
+        if not key or not ImageService.isImage(key):
+            return url
+        variant_key = ImageService._variant_key(key, variant, extension)
+        if variant_key in ImageService._ready:
+            return storage.url(variant_key)
+
+        # 最近确认过未登记，直接回退原图
+        checked_time = ImageService._missing.get(variant_key)
+        if checked_time and time.time() - checked_time < settings.IMAGE_VARIANT_MISS_TTL:
+            return url
+
+        # 其他进程生成的衍生图（登记在共享缓存中）
+        if caches[settings.IMAGE_VARIANT_CACHE_ALIAS].get(ImageService._ready_key(variant_key)):
+            ImageService._remember(variant_key)
+            return storage.url(variant_key)
+
+        # 未登记（历史图片、缓存被清空或淘汰）：检查存储后端，存在时重新登记
+        local_path = storage.local_path(variant_key)
+        if local_path is not None and os.path.exists(local_path):
+            ImageService._mark_ready(variant_key)
+            return storage.url(variant_key)
+        if local_path is None:
+            ImageService._get_executor().submit(ImageService._probe, variant_key)
+        if len(ImageService._missing) >= READY_CACHE_SIZE:
+            ImageService._missing.clear()
+        ImageService._missing[variant_key] = time.time()
+        return url
+
+    @staticmethod
+    def _probe(variant_key: str) -> None:
+        """检查远程存储中的衍生图（后台线程执行），存在时登记"""
+        try:
+            if get_storage().exists(variant_key):
+                ImageService._mark_ready(variant_key)
+        except Exception as e:
+            logger.warning(f"检查衍生图失败：{variant_key}, {e}")
+
+    @staticmethod
+    def _render(Image, ImageOps, source_path: str, key: str) -> list:
+        """按 IMAGE_VARIANTS 规格缩放，写入暂存文件后发布到存储后端"""
+        storage = get_storage()
+        staging_dir = Path(settings.UPLOAD_STAGING_DIR)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        generated = []
+        with Image.open(source_path) as source:
+            # 按 EXIF 方向摆正，统一转为 RGB（JPEG 不支持透明通道）
+            source = ImageOps.exif_transpose(source)
+            if source.mode != 'RGB':
+                source = source.convert('RGB')
+            for variant, size in settings.IMAGE_VARIANTS.items():
+                image = source.copy()
+                image.thumbnail((size, size), Image.LANCZOS)
+                for extension, image_format in VARIANT_FORMATS.items():
+                    variant_key = ImageService._variant_key(key, variant, extension)
+                    fd, tmp_path = tempfile.mkstemp(dir=staging_dir)
+                    with os.fdopen(fd, 'wb') as destination:
+                        image.save(destination, image_format, quality=settings.IMAGE_VARIANT_QUALITY)
+                    storage.move_file(variant_key, tmp_path)
+                    ImageService._mark_ready(variant_key)
+                    generated.append(variant_key)
+        return generated
+
+    @staticmethod
+    def _variant_key(key: str, variant: str, extension: str) -> str:
+        stem = os.path.splitext(key)[0]
+        return f"{stem}_{variant}.{extension}"
+
+    @staticmethod
+    def _ready_key(variant_key: str) -> str:
+        return f"image_variant:{variant_key}"
+
+    @staticmethod
+    def _mark_ready(variant_key: str) -> None:
+        """登记衍生图已生成（共享缓存 + 本进程）"""
+        caches[settings.IMAGE_VARIANT_CACHE_ALIAS].set(ImageService._ready_key(variant_key), True, timeout=None)
+        ImageService._remember(variant_key)
+
+    @staticmethod
+    def _remember(variant_key: str) -> None:
+        if len(ImageService._ready) >= READY_CACHE_SIZE:
+            ImageService._ready.clear()
+        ImageService._ready.add(variant_key)
+        ImageService._missing.pop(variant_key, None)
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """延迟创建线程池（进程内单例）"""
+        if ImageService._executor is None:
+            with ImageService._executor_lock:
+                if ImageService._executor is None:
+                    ImageService._executor = ThreadPoolExecutor(
+                        max_workers=settings.IMAGE_VARIANT_WORKERS,
+                        thread_name_prefix='image-variant'
+                    )
+        return ImageService._executor
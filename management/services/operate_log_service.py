@@ -5,6 +5,7 @@
 """
 
 from ..models import OperateLog
+from .dimension_cache_service import DimensionCacheService
 
 
 class OperateLogService:
@@ -21,22 +22,15 @@ class OperateLogService:
         start = (page - 1) * pageSize
         logs = queryset[start:start + pageSize]
         
-        # 转换为字典列表（关联查询员工姓名）
-        from ..models import Emp
+        # 转换为字典列表（员工姓名从维度缓存批量获取）
+        logs = list(logs)
+        emp_names = DimensionCacheService.getNames('emp', [log.operate_emp_id for log in logs])
         rows = []
         for log in logs:
-            emp_name = None
-            if log.operate_emp_id:
-                try:
-                    emp = Emp.objects.get(pk=log.operate_emp_id)
-                    emp_name = emp.name
-                except Emp.DoesNotExist:
-                    pass
-            
             rows.append({
                 'id': log.id,
                 'operateEmpId': log.operate_emp_id,
-                'operateEmpName': emp_name,
+                'operateEmpName': emp_names.get(log.operate_emp_id),
                 'operateTime': log.operate_time.strftime('%Y-%m-%d %H:%M:%S') if log.operate_time else None,
                 'className': log.class_name,
                 'methodName': log.method_name,
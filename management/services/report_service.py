@@ -2,10 +2,23 @@
 报表统计服务层 - 业务唯一入口
 
 职责：数据统计、聚合查询
+分组计数由 ReportStatsService 增量维护，读取时只遍历分组，不扫描全表
 """
 
-from django.db.models import Count, Case, When, CharField, Value
-from ..models import Emp, Student, Clazz
+import asyncio
+import threading
+import time
+from datetime import date, datetime
+from django.conf import settings
+from django.dispatch import receiver
+from django.db.models import Q
+from asgiref.sync import sync_to_async
+from common.async_support import alist
+from ..models import Emp, Student
+from ..signals import data_changed
+from .cube_service import CubeService
+from .dimension_cache_service import DimensionCacheService
+from .report_stats_service import ReportStatsService
 
 
 class ReportService:
@@ -35,12 +48,12 @@ class ReportService:
         员工性别统计 - 对标 Java ReportServiceImpl.getEmpGenderData()
         返回格式：[{"name": "男", "value": 10}, {"name": "女", "value": 5}]
         """
-        result = Emp.objects.values('gender').annotate(value=Count('id'))
+        counts = ReportStatsService.getCounts('empGender')
         gender_data = []
-        for item in result:
+        for gender, value in sorted(counts.items()):
             gender_data.append({
-                'name': '男' if item['gender'] == 1 else '女',
-                'value': item['value']
+                'name': '男' if gender == 1 else '女',
+                'value': value
             })
         return gender_data
     
@@ -50,13 +63,13 @@ class ReportService:
         员工职位统计 - 对标 Java ReportServiceImpl.getEmpJobData()
         返回格式：{"jobList": ["班主任", "讲师", ...], "dataList": [10, 20, ...]}
         """
-        result = Emp.objects.exclude(job__isnull=True).values('job').annotate(emp_count=Count('id'))
+        counts = ReportStatsService.getCounts('empJob')
         jobList = []
         dataList = []
-        for item in result:
-            job_name = ReportService.JOB_MAP.get(item['job'], '其他')
+        for job, emp_count in sorted(counts.items()):
+            job_name = ReportService.JOB_MAP.get(job, '其他')
             jobList.append(job_name)
-            dataList.append(item['emp_count'])
+            dataList.append(emp_count)
         return {'jobList': jobList, 'dataList': dataList}
     
     @staticmethod
@@ -65,34 +78,422 @@ class ReportService:
         学生学历统计 - 对标 Java ReportServiceImpl.getStudentDegreeData()
         返回格式：[{"name": "本科", "value": 10}, ...]
         """
-        result = Student.objects.exclude(degree__isnull=True).values('degree').annotate(value=Count('id'))
+        counts = ReportStatsService.getCounts('studentDegree')
         degree_data = []
-        for item in result:
-            degree_name = ReportService.DEGREE_MAP.get(item['degree'], '其他')
+        for degree, value in sorted(counts.items()):
+            degree_name = ReportService.DEGREE_MAP.get(degree, '其他')
             degree_data.append({
                 'name': degree_name,
-                'value': item['value']
+                'value': value
             })
         return degree_data
     
+    # 班级人数统计支持的排序字段
+    STUDENT_COUNT_ORDER_FIELDS = {'id': 0, 'name': 1, 'count': 2}
+    
     @staticmethod
-    def getStudentCountData() -> dict:
+    def getStudentCountData(params: dict = None) -> dict:
         """
         班级学生人数统计 - 对标 Java ReportServiceImpl.getStudentCountData()
         返回格式：{"clazzList": ["Java班", "前端班", ...], "dataList": [30, 25, ...]}
+        
+        支持参数：
+        - orderBy：id（默认）/ name / count
+        - order：asc（默认）/ desc
+        - includeEmpty：true 时包含没有学生的班级
+        
+        人数取自增量维护的计数器，与维度缓存中的班级名称做连接：
+        已删除班级下的学生不再被丢弃，以"已删除班级(id)"展示
         """
-        # 统计每个班级的学生数量
-        result = Student.objects.exclude(clazz_id__isnull=True).values('clazz_id').annotate(
-            student_count=Count('id')
-        )
-        clazzList = []
-        dataList = []
-        # 获取班级名称
-        for item in result:
-            try:
-                clazz = Clazz.objects.get(pk=item['clazz_id'])
-                clazzList.append(clazz.name)
-                dataList.append(item['student_count'])
-            except Clazz.DoesNotExist:
-                pass
-        return {'clazzList': clazzList, 'dataList': dataList}
+        from common.exceptions import BusinessException
+        
+        # 1. 解析参数
+        params = params or {}
+        order_by = params.get('orderBy') or 'id'
+        if order_by not in ReportService.STUDENT_COUNT_ORDER_FIELDS:
+            raise BusinessException(f"不支持的排序字段：{order_by}")
+        descending = params.get('order') == 'desc'
+        include_empty = str(params.get('includeEmpty', '')).lower() in ('true', '1')
+        
+        # 2. 班级人数（计数器）连接班级名称（维度缓存）
+        counts = ReportStatsService.getCounts('studentClazz')
+        rows = []
+        for clazz_id, name in DimensionCacheService.getAll('clazz').items():
+            student_count = counts.pop(clazz_id, 0)
+            if student_count or include_empty:
+                rows.append((clazz_id, name, student_count))
+        # 剩余的是已删除班级下的学生
+        for clazz_id, student_count in counts.items():
+            rows.append((clazz_id, f"已删除班级({clazz_id})", student_count))
+        
+        # 3. 排序（id 升序作为第二排序键，保证结果稳定；倒序时 reverse 保持相等元素的原有顺序）
+        index = ReportService.STUDENT_COUNT_ORDER_FIELDS[order_by]
+        rows.sort(key=lambda row: row[0])
+        rows.sort(key=lambda row: row[index], reverse=descending)
+        
+        return {
+            'clazzList': [row[1] for row in rows],
+            'dataList': [row[2] for row in rows]
+        }
+    
+    # 薪资分布统计的分位数
+    SALARY_PERCENTILES = [25, 50, 90]
+    # 影响薪资分布的员工字段（数据库列名）
+    SALARY_FIELDS = ('salary', 'dept_id', 'job')
+    
+    # 薪资分布缓存：直方图桶数 → (计算时间, 统计结果)；本进程的写操作改动 SALARY_FIELDS 时清空，
+    # 与统计快照相同最长保留 CUBE_SNAPSHOT_TTL 秒（其他进程的写操作在过期后生效）
+    _salary_cache = {}
+    _salary_version = 0
+    _salary_lock = threading.Lock()
+    
+    @staticmethod
+    def getEmpSalaryData(params: dict = None) -> dict:
+        """
+        员工薪资分布统计 - 按部门、按职位统计薪资的分位数、均值和直方图
+        返回格式：{"bins": [...], "deptList": [{"id": 1, "name": "学工部", "p50": 8000, ...}], "jobList": [...]}
+        
+        支持参数：
+        - bins：直方图桶数，默认 10，不超过 100；所有部门和职位共用同一组桶边界
+        
+        一次流式读取 (dept_id, job, salary) 三列，在 NumPy 数组上向量化计算，
+        不按部门逐个查询；结果缓存到员工的薪资、部门或职位发生变更为止，最长 CUBE_SNAPSHOT_TTL 秒
+        """
+        from common.exceptions import BusinessException
+        
+        # 1. 解析参数
+        params = params or {}
+        try:
+            bins = int(params.get('bins') or 10)
+        except ValueError:
+            raise BusinessException("桶数格式错误")
+        if bins < 1 or bins > 100:
+            raise BusinessException("桶数应在 1~100 之间")
+        
+        # 2. 读取缓存，未命中时计算（计算期间有写操作则不写入缓存）
+        cached = ReportService._salary_cache.get(bins)
+        if cached is not None and time.time() - cached[0] <= settings.CUBE_SNAPSHOT_TTL:
+            stats = cached[1]
+        else:
+            version = ReportService._salary_version
+            compute_time = time.time()
+            stats = ReportService._computeSalaryStats(bins)
+            with ReportService._salary_lock:
+                if version == ReportService._salary_version:
+                    ReportService._salary_cache[bins] = (compute_time, stats)
+        
+        # 3. 连接部门名称（部门改名不影响统计结果，不进入缓存）
+        dept_names = DimensionCacheService.getAll('dept')
+        deptList = []
+        for row in stats['deptRows']:
+            dept_id = row['id']
+            if dept_id is None:
+                name = '未分配部门'
+            else:
+                name = dept_names.get(dept_id, f"已删除部门({dept_id})")
+            deptList.append({**row, 'name': name})
+        jobList = []
+        for row in stats['jobRows']:
+            job = row['id']
+            name = '未分配职位' if job is None else ReportService.JOB_MAP.get(job, '其他')
+            jobList.append({**row, 'name': name})
+        
+        return {'bins': stats['bins'], 'deptList': deptList, 'jobList': jobList}
+    
+    @staticmethod
+    def _computeSalaryStats(bins: int) -> dict:
+        """在员工列式快照上分别按部门、按职位计算薪资分布"""
+        snapshot = CubeService.loadSnapshot('emp')
+        stats = {'bins': []}
+        for dim, name in (('dept_id', 'deptRows'), ('job', 'jobRows')):
+            result = CubeService.aggregate(snapshot['columns'], snapshot['size'], [dim], 'salary',
+                                           ReportService.SALARY_PERCENTILES, bins)
+            rows = []
+            for row in result['rows']:
+                rows.append({
+                    'id': row['key'][0],
+                    'count': row['valueCount'],
+                    'mean': row['mean'],
+                    **row['percentiles'],
+                    'histogram': row['histogram'],
+                })
+            stats[name] = rows
+            stats['bins'] = result.get('bins', [])
+        return stats
+
+    
+    # 违纪排行每页最大条数
+    VIOLATION_MAX_PAGE_SIZE = 100
+    
+    @staticmethod
+    def getStudentViolationRank(params: dict = None) -> dict:
+        """
+        学员违纪排行 - 全校或班级内按违纪扣分、违纪次数倒序，同分按 ID 倒序
+        返回格式：{"rows": [{"rank": 1, "id": 1, "name": "张三", ...}], "nextCursor": "12,3,45"}
+        
+        支持参数：
+        - clazzId：班级ID，为空时为全校排行
+        - pageSize：每页条数，默认 10，不超过 100
+        - cursor：上一页返回的 nextCursor，为空时从第一名开始
+        
+        排序与索引 (violation_score, violation_count, id) / (clazz_id, ...) 一致，
+        游标分页（keyset）只扫描索引上的 pageSize 行，不排序全表，也不受并列名次和 OFFSET 影响；
+        名次为竞争排名（并列同名次），由两次索引范围计数得到
+        """
+        # 1. 解析参数
+        clazzId, pageSize, cursor = ReportService._violationParams(params)
+        
+        # 2. 有违纪记录的学员，按索引顺序倒序
+        students = list(ReportService._violationPage(clazzId, pageSize, cursor))
+        if not students:
+            return {'rows': [], 'nextCursor': None}
+        
+        # 3. 计算名次：本页第一行之前的行数 = 分数更高的行数 + 同分但排在前面的行数
+        higher, tied = ReportService._violationAhead(clazzId, students[0])
+        ahead = higher.count()
+        position = ahead + tied.count()
+        
+        # 4. 连接班级名称并组装结果
+        clazzNames = DimensionCacheService.getNames('clazz', [s['clazz_id'] for s in students[:pageSize]])
+        return ReportService._violationResult(students, pageSize, ahead, position, clazzNames)
+    
+    @staticmethod
+    def _violationParams(params: dict) -> tuple:
+        """解析违纪排行参数 - 返回 (班级ID, 每页条数, 游标)"""
+        from common.exceptions import BusinessException
+        
+        params = params or {}
+        try:
+            clazzId = int(params['clazzId']) if params.get('clazzId') else None
+            pageSize = int(params.get('pageSize') or 10)
+            cursor = [int(v) for v in params['cursor'].split(',')] if params.get('cursor') else None
+        except ValueError:
+            raise BusinessException("班级ID、每页条数或游标格式错误")
+        if pageSize < 1 or pageSize > ReportService.VIOLATION_MAX_PAGE_SIZE:
+            raise BusinessException(f"每页条数应在 1~{ReportService.VIOLATION_MAX_PAGE_SIZE} 之间")
+        if cursor is not None and len(cursor) != 3:
+            raise BusinessException("游标格式错误")
+        return clazzId, pageSize, cursor
+    
+    @staticmethod
+    def _violationPage(clazzId, pageSize: int, cursor):
+        """当前页查询（多取一行用于判断是否还有下一页）"""
+        queryset = Student.objects.filter(violation_count__gt=0)
+        if clazzId is not None:
+            queryset = queryset.filter(clazz_id=clazzId)
+        if cursor is not None:
+            queryset = queryset.filter(ReportService._violationAfter(*cursor))
+        fields = ('id', 'name', 'no', 'clazz_id', 'violation_score', 'violation_count')
+        return queryset.order_by('-violation_score', '-violation_count', '-id').values(*fields)[:pageSize + 1]
+    
+    @staticmethod
+    def _violationAhead(clazzId, first: dict) -> tuple:
+        """名次计数查询 - 返回 (分数更高的行, 同分但排在 first 前面的行)"""
+        ranked = Student.objects.filter(violation_count__gt=0)
+        if clazzId is not None:
+            ranked = ranked.filter(clazz_id=clazzId)
+        score, count = first['violation_score'], first['violation_count']
+        higher = ranked.filter(Q(violation_score__gt=score) | Q(violation_score=score, violation_count__gt=count))
+        tied = ranked.filter(violation_score=score, violation_count=count, id__gt=first['id'])
+        return higher, tied
+    
+    @staticmethod
+    def _violationResult(students: list, pageSize: int, ahead: int, position: int, clazzNames: dict) -> dict:
+        """组装违纪排行结果（名次为竞争排名）"""
+        hasMore = len(students) > pageSize
+        students = students[:pageSize]
+        rows = []
+        rank = ahead + 1
+        for index, student in enumerate(students):
+            key = (student['violation_score'], student['violation_count'])
+            if index > 0 and key != (students[index - 1]['violation_score'], students[index - 1]['violation_count']):
+                rank = position + index + 1
+            rows.append({
+                'rank': rank,
+                'id': student['id'],
+                'name': student['name'],
+                'no': student['no'],
+                'clazzId': student['clazz_id'],
+                'clazzName': clazzNames.get(student['clazz_id']),
+                'violationScore': student['violation_score'],
+                'violationCount': student['violation_count'],
+            })
+        
+        last = students[-1]
+        nextCursor = f"{last['violation_score']},{last['violation_count']},{last['id']}" if hasMore else None
+        return {'rows': rows, 'nextCursor': nextCursor}
+    
+    @staticmethod
+    def _violationAfter(score: int, count: int, id: int) -> Q:
+        """游标条件：排序 (扣分, 次数, ID) 倒序中位于游标之后的行"""
+        return (Q(violation_score__lt=score)
+                | Q(violation_score=score, violation_count__lt=count)
+                | Q(violation_score=score, violation_count=count, id__lt=id))
+
+    
+    # 时间序列最多返回的桶数
+    TIME_SERIES_MAX_BUCKETS = 1200
+    
+    @staticmethod
+    def getEmpEntryData(params: dict = None) -> dict:
+        """
+        员工入职人数趋势（按月 / 按年）
+        返回格式：{"dateList": ["2024-01", "2024-02", ...], "dataList": [3, 0, ...]}
+        """
+        dateList, series = ReportService._timeSeries(params, ['empEntryMonth'])
+        return {'dateList': dateList, 'dataList': series[0]}
+    
+    @staticmethod
+    def getStudentGraduationData(params: dict = None) -> dict:
+        """
+        学员毕业人数趋势（按月 / 按年）
+        返回格式：{"dateList": ["2024-01", "2024-02", ...], "dataList": [3, 0, ...]}
+        """
+        dateList, series = ReportService._timeSeries(params, ['studentGraduationMonth'])
+        return {'dateList': dateList, 'dataList': series[0]}
+    
+    @staticmethod
+    def getClazzDateData(params: dict = None) -> dict:
+        """
+        班级开课 / 结课数量趋势（按月 / 按年）
+        返回格式：{"dateList": ["2024-01", ...], "beginList": [2, ...], "endList": [1, ...]}
+        """
+        dateList, series = ReportService._timeSeries(params, ['clazzBeginMonth', 'clazzEndMonth'])
+        return {'dateList': dateList, 'beginList': series[0], 'endList': series[1]}
+    
+    @staticmethod
+    def _timeSeries(params: dict, dimensions: list) -> tuple:
+        """
+        按月度计数器生成时间序列 - 范围内每个桶都有值（没有数据的桶为 0），可直接用于图表
+        
+        支持参数：
+        - begin / end：日期范围（yyyy-MM-dd 或 yyyy-MM），默认最近 12 个月 / 最近 5 年
+        - granularity：month（默认）/ year
+        
+        返回：(桶标签列表, [每个维度的数量列表])
+        """
+        from common.exceptions import BusinessException
+        
+        # 1. 解析参数，范围换算为月序号（年 * 12 + 月 - 1）
+        params = params or {}
+        granularity = params.get('granularity') or 'month'
+        if granularity not in ('month', 'year'):
+            raise BusinessException(f"不支持的统计粒度：{granularity}")
+        try:
+            end = ReportService._parseMonth(params.get('end')) if params.get('end') else None
+            begin = ReportService._parseMonth(params.get('begin')) if params.get('begin') else None
+        except ValueError:
+            raise BusinessException("日期格式错误，应为 yyyy-MM-dd 或 yyyy-MM")
+        if end is None:
+            today = date.today()
+            end = today.year * 12 + today.month - 1
+        if begin is None:
+            begin = end - 11 if granularity == 'month' else (end // 12 - 4) * 12
+        if granularity == 'year':
+            begin, end = begin // 12 * 12, end // 12 * 12 + 11
+        if begin > end:
+            raise BusinessException("开始日期不能晚于结束日期")
+        step = 1 if granularity == 'month' else 12
+        if (end - begin) // step + 1 > ReportService.TIME_SERIES_MAX_BUCKETS:
+            raise BusinessException("日期范围过大")
+        
+        # 2. 生成桶标签
+        if granularity == 'month':
+            dateList = [f"{index // 12:04d}-{index % 12 + 1:02d}" for index in range(begin, end + 1)]
+        else:
+            dateList = [f"{index // 12:04d}" for index in range(begin, end + 1, 12)]
+        
+        # 3. 月度计数累加到对应的桶
+        series = []
+        for dimension in dimensions:
+            dataList = [0] * len(dateList)
+            for month, value in ReportStatsService.getCounts(dimension).items():
+                index = month.year * 12 + month.month - 1
+                if begin <= index <= end:
+                    dataList[(index - begin) // step] += value
+            series.append(dataList)
+        return dateList, series
+    
+    @staticmethod
+    def _parseMonth(value: str) -> int:
+        """解析 yyyy-MM-dd / yyyy-MM 为月序号"""
+        parsed = datetime.strptime(value[:7], '%Y-%m')
+        return parsed.year * 12 + parsed.month - 1
+    
+    # ---------- 异步版本（ASGI 异步视图使用）----------
+    # 计数器类报表先异步建立计数器（仅首次），之后同步版本只做内存计算，可以直接在事件循环中执行
+    
+    @staticmethod
+    async def agetEmpGenderData() -> list:
+        """员工性别统计（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getEmpGenderData()
+    
+    @staticmethod
+    async def agetEmpJobData() -> dict:
+        """员工职位统计（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getEmpJobData()
+    
+    @staticmethod
+    async def agetStudentDegreeData() -> list:
+        """学生学历统计（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getStudentDegreeData()
+    
+    @staticmethod
+    async def agetStudentCountData(params: dict = None) -> dict:
+        """班级学生人数统计（异步）- 先预热班级名称缓存"""
+        await ReportStatsService.aensureBuilt()
+        await DimensionCacheService.agetAll('clazz')
+        return ReportService.getStudentCountData(params)
+    
+    @staticmethod
+    async def agetEmpSalaryData(params: dict = None) -> dict:
+        """员工薪资分布统计（异步）- 未命中缓存时需读取快照并做 NumPy 计算，整体在线程中执行"""
+        return await sync_to_async(ReportService.getEmpSalaryData)(params)
+    
+    @staticmethod
+    async def agetStudentViolationRank(params: dict = None) -> dict:
+        """学员违纪排行（异步）- 当前页查询后，两个名次计数查询并发执行"""
+        clazzId, pageSize, cursor = ReportService._violationParams(params)
+        students = await alist(ReportService._violationPage(clazzId, pageSize, cursor))
+        if not students:
+            return {'rows': [], 'nextCursor': None}
+        higher, tied = ReportService._violationAhead(clazzId, students[0])
+        ahead, behind, clazzNames = await asyncio.gather(
+            higher.acount(), tied.acount(),
+            DimensionCacheService.agetNames('clazz', [s['clazz_id'] for s in students[:pageSize]]))
+        return ReportService._violationResult(students, pageSize, ahead, ahead + behind, clazzNames)
+    
+    @staticmethod
+    async def agetEmpEntryData(params: dict = None) -> dict:
+        """员工入职人数趋势（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getEmpEntryData(params)
+    
+    @staticmethod
+    async def agetStudentGraduationData(params: dict = None) -> dict:
+        """学员毕业人数趋势（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getStudentGraduationData(params)
+    
+    @staticmethod
+    async def agetClazzDateData(params: dict = None) -> dict:
+        """班级开课 / 结课数量趋势（异步）"""
+        await ReportStatsService.aensureBuilt()
+        return ReportService.getClazzDateData(params)
+
+
+@receiver(data_changed, sender=Emp)
+def _on_emp_changed(sender, before, after, **kwargs):
+    """员工的薪资、部门或职位变更时清空薪资分布缓存"""
+    def key(row):
+        return tuple(row.get(field) for field in ReportService.SALARY_FIELDS)
+    before_keys = {row['id']: key(row) for row in before}
+    after_keys = {row['id']: key(row) for row in after}
+    if before_keys == after_keys:
+        return
+    with ReportService._salary_lock:
+        ReportService._salary_version += 1
+        ReportService._salary_cache = {}
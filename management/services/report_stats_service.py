@@ -0,0 +1,228 @@
+"""
+报表统计计数服务 - 增量维护的内存计数器
+
+对标 Java: 统计汇总表 + 定时对账任务
+
+- 启动后首次读取时执行一次 GROUP BY 建立计数器，同时启动本进程的后台对账线程
+- Service 写操作提交后通过 data_changed 信号按行快照增减计数（O(1)）
+- 后台线程每隔 REPORT_STATS_RECONCILE_INTERVAL 秒重新对账一次，修复多进程部署或异常导致的漂移
+- 报表读取只读内存，遍历分组（O(分组数)），不再扫描 emp / student 全表，也不在请求中对账
+- 日期字段按月汇总（键为当月 1 日），年度汇总由月度桶相加得到
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.dispatch import receiver
+from common.async_support import alist
+from ..models import Clazz, Emp, Student
+from ..signals import data_changed
+
+logger = logging.getLogger(__name__)
+
+
+class ReportStatsService:
+
+    # 统计维度：名称 → (模型, 分组字段, 是否按月汇总)
+    DIMENSIONS = {
+        'empGender': (Emp, 'gender', False),
+        'empJob': (Emp, 'job', False),
+        'studentDegree': (Student, 'degree', False),
+        'studentClazz': (Student, 'clazz_id', False),
+        'empEntryMonth': (Emp, 'entry_date', True),
+        'studentGraduationMonth': (Student, 'graduation_date', True),
+        'clazzBeginMonth': (Clazz, 'begin_date', True),
+        'clazzEndMonth': (Clazz, 'end_date', True),
+    }
+
+    _counters = {}
+    _lock = threading.RLock()
+    # 同一时间只有一个对账；对账期间请求继续读取增量维护的计数器
+    _reconcile_lock = threading.Lock()
+    # 后台对账线程（每个进程一个，首次建立计数器后启动）
+    _timer = None
+    # 对账期间收到的增量 [(模型, 变更前, 变更后)]，对账结束后重放到新计数器上；不在对账时为 None
+    _journal = None
+
+    @staticmethod
+    def getCounts(dimension: str) -> dict:
+        """
+        获取某个维度的分组计数 - 返回 {分组值: 数量}，不含空值和 0
+        """
+        ReportStatsService._ensure_built()
+        with ReportStatsService._lock:
+            counter = ReportStatsService._counters[dimension]
+            return {key: value for key, value in counter.items() if key is not None and value > 0}
+
+    @staticmethod
+    def reconcile() -> None:
+        """
+        对账 - 用 GROUP BY 重建所有计数器，记录漂移情况
+
+        对账期间的写操作不会使结果失效：信号在事务提交后发出，维度的查询开始前收到的增量已包含在查询结果中，
+        开始后收到的增量重放到新计数器上（提交与信号之间恰好开始查询时可能重复计数，由下次对账修复）
+        """
+        with ReportStatsService._reconcile_lock:
+            ReportStatsService._reconcile()
+
+    @staticmethod
+    async def areconcile() -> None:
+        """对账（异步）- 各维度的 GROUP BY 通过异步 ORM 并发查询"""
+        await sync_to_async(ReportStatsService._reconcile_lock.acquire, thread_sensitive=False)()
+        try:
+            await ReportStatsService._areconcile()
+        finally:
+            ReportStatsService._reconcile_lock.release()
+
+    @staticmethod
+    async def aensureBuilt() -> None:
+        """首次读取时建立计数器（异步）- 之后的 getCounts 只读内存"""
+        if ReportStatsService._counters:
+            return
+        await sync_to_async(ReportStatsService._reconcile_lock.acquire, thread_sensitive=False)()
+        try:
+            if not ReportStatsService._counters:
+                await ReportStatsService._areconcile()
+        finally:
+            ReportStatsService._reconcile_lock.release()
+        ReportStatsService._start_timer()
+
+    @staticmethod
+    def _reconcile() -> None:
+        """对账（调用方持有对账锁）"""
+        journal = ReportStatsService._begin()
+        try:
+            counters = {}
+            for dimension, queryset, key in ReportStatsService._groupQueries():
+                start = len(journal)
+                counters[dimension] = (Counter({row[key]: row['value'] for row in queryset}), start)
+            ReportStatsService._replace(counters)
+        finally:
+            ReportStatsService._journal = None
+
+    @staticmethod
+    async def _areconcile() -> None:
+        """对账（异步，调用方持有对账锁）"""
+        journal = ReportStatsService._begin()
+        try:
+            queries = list(ReportStatsService._groupQueries())
+            start = len(journal)
+            results = await asyncio.gather(*(alist(queryset) for _, queryset, _ in queries))
+            counters = {}
+            for (dimension, _, key), rows in zip(queries, results):
+                counters[dimension] = (Counter({row[key]: row['value'] for row in rows}), start)
+            ReportStatsService._replace(counters)
+        finally:
+            ReportStatsService._journal = None
+
+    @staticmethod
+    def _groupQueries():
+        """各维度的分组计数查询 - 生成 (维度, 查询集, 分组键)"""
+        for dimension, (model, field, by_month) in ReportStatsService.DIMENSIONS.items():
+            queryset = model.objects.all()
+            if by_month:
+                queryset = queryset.annotate(bucket=TruncMonth(field))
+                yield dimension, queryset.values('bucket').annotate(value=Count('id')).order_by(), 'bucket'
+            else:
+                yield dimension, queryset.values(field).annotate(value=Count('id')).order_by(), field
+
+    @staticmethod
+    def _begin() -> list:
+        """开始记录增量日志"""
+        with ReportStatsService._lock:
+            ReportStatsService._journal = []
+            return ReportStatsService._journal
+
+    @staticmethod
+    def _replace(counters: dict) -> None:
+        """
+        替换计数器 - counters 为 {维度: (查询结果, 查询开始时的日志位置)}，
+        先重放查询开始后的增量，再与旧计数器比较记录漂移
+        """
+        with ReportStatsService._lock:
+            journal = ReportStatsService._journal
+            result = {}
+            for dimension, (counter, start) in counters.items():
+                model, field, by_month = ReportStatsService.DIMENSIONS[dimension]
+                for change_model, before, after in journal[start:]:
+                    if change_model is model:
+                        ReportStatsService._apply(counter, field, by_month, before, after)
+                old = ReportStatsService._counters.get(dimension)
+                if old is not None and +old != +counter:
+                    logger.warning(f"报表计数器漂移，已修复：{dimension}")
+                result[dimension] = counter
+            ReportStatsService._counters = result
+
+    @staticmethod
+    def applyChange(model, before: list, after: list) -> None:
+        """按变更前后的行快照增减计数（对账期间同时记入日志）"""
+        with ReportStatsService._lock:
+            if ReportStatsService._journal is not None:
+                ReportStatsService._journal.append((model, before, after))
+            if not ReportStatsService._counters:
+                return
+            for dimension, (dimension_model, field, by_month) in ReportStatsService.DIMENSIONS.items():
+                if dimension_model is model:
+                    ReportStatsService._apply(ReportStatsService._counters[dimension], field, by_month, before, after)
+
+    @staticmethod
+    def _apply(counter: Counter, field: str, by_month: bool, before: list, after: list) -> None:
+        for row in before:
+            counter[ReportStatsService._key(row[field], by_month)] -= 1
+        for row in after:
+            counter[ReportStatsService._key(row[field], by_month)] += 1
+
+    @staticmethod
+    def _key(value, by_month: bool):
+        """分组键 - 按月汇总的日期取当月 1 日"""
+        if by_month and value is not None:
+            return value.replace(day=1)
+        return value
+
+    @staticmethod
+    def _ensure_built() -> None:
+        """首次读取时建立计数器（等待正在进行的对账），之后的定期对账由后台线程执行"""
+        if ReportStatsService._counters:
+            return
+        with ReportStatsService._reconcile_lock:
+            if not ReportStatsService._counters:
+                ReportStatsService._reconcile()
+        ReportStatsService._start_timer()
+
+    @staticmethod
+    def _start_timer() -> None:
+        """启动后台对账线程（每个进程只启动一次，对账间隔不大于 0 时不启动）"""
+        interval = settings.REPORT_STATS_RECONCILE_INTERVAL
+        with ReportStatsService._lock:
+            if ReportStatsService._timer is not None or interval <= 0:
+                return
+            ReportStatsService._timer = threading.Thread(
+                target=ReportStatsService._run_timer, args=(interval,), name='report-stats-reconcile', daemon=True)
+            ReportStatsService._timer.start()
+
+    @staticmethod
+    def _run_timer(interval: int) -> None:
+        """后台对账 - 每隔 interval 秒对账一次，失败时记录日志，下个周期重试"""
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                ReportStatsService.reconcile()
+            except Exception:
+                logger.exception("报表计数器后台对账失败")
+            finally:
+                close_old_connections()
+
+
+@receiver(data_changed, sender=Emp)
+@receiver(data_changed, sender=Student)
+@receiver(data_changed, sender=Clazz)
+def _on_data_changed(sender, action, before, after, **kwargs):
+    ReportStatsService.applyChange(sender, before, after)
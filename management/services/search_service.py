@@ -0,0 +1,215 @@
+"""
+输入联想服务 - 员工姓名、学员姓名 / 学号、班级名称的前缀搜索
+
+名称选择框每次按键都调用分页接口（name 模糊查询 + COUNT），改为查询进程内前缀索引：
+- 每个资源一个有序数组 [(检索词, ID)]，查询时二分定位前缀起点，顺序取出匹配项
+- 检索词：名称（不区分大小写）、学号，以及姓名的拼音全拼和首字母（如 张三 → zhangsan、zs，需安装 pypinyin）
+
+索引在首次查询时构建（全局锁外执行，同一资源只构建一次，不阻塞其他资源的查询和增量更新）；
+写操作提交后（data_changed 信号）增量更新本进程的索引，构建期间的变更在构建完成后重放，
+其他进程的写入通过定期重建（SEARCH_SUGGEST['REBUILD_INTERVAL'] 秒，后台线程执行）同步
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from django.conf import settings
+from django.db import connections
+from django.dispatch import receiver
+from ..models import Clazz, Emp, Student
+from ..signals import data_changed
+
+logger = logging.getLogger(__name__)
+
+_pinyin = None
+
+
+class SearchService:
+
+    # 资源 → (模型, 输出字段, 检索字段)
+    RESOURCES = {
+        'emp': (Emp, ('name',), ('name',)),
+        'student': (Student, ('name', 'no'), ('name', 'no')),
+        'clazz': (Clazz, ('name',), ('name',)),
+    }
+
+    # 资源 → 索引 {'entries': [(检索词, ID)], 'rows': {ID: 输出字段 dict}, 'terms': {ID: 检索词列表}, 'built': 时间}
+    _indexes = {}
+    _lock = threading.Lock()
+    # 资源 → 首次构建锁：同一资源的并发首次查询等待同一次构建
+    _build_locks = {resource: threading.Lock() for resource in RESOURCES}
+    # 资源 → 构建 / 重建期间收到的变更 [(before, after)]，完成后重放到新索引
+    _pending = {}
+
+    @staticmethod
+    def suggest(params: dict) -> list:
+        """
+        前缀搜索
+        params: q 关键字（必填），type 资源类型（emp/student/clazz，逗号分隔，默认全部），limit 返回条数
+        返回：[{type, id, name, ...}]，按资源类型、检索词排序
+        """
+        config = settings.SEARCH_SUGGEST
+        # 1. 解析参数
+        keyword = (params.get('q') or '').strip().casefold()
+        if not keyword:
+            return []
+        types = [item for item in (params.get('type') or '').split(',') if item] or list(SearchService.RESOURCES)
+        types = [item for item in types if item in SearchService.RESOURCES]
+        try:
+            limit = min(max(int(params.get('limit') or config['LIMIT']), 1), config['MAX_LIMIT'])
+        except ValueError:
+            limit = config['LIMIT']
+
+        # 2. 依次查询各资源的索引
+        result = []
+        for resource in types:
+            index = SearchService._get_index(resource)
+            with SearchService._lock:
+                entries = index['entries']
+                seen = set()
+                position = bisect_left(entries, (keyword,))
+                while position < len(entries) and len(result) < limit:
+                    term, id = entries[position]
+                    if not term.startswith(keyword):
+                        break
+                    if id not in seen:
+                        seen.add(id)
+                        result.append({'type': resource, 'id': id, **index['rows'][id]})
+                    position += 1
+            if len(result) >= limit:
+                break
+        return result
+
+    @staticmethod
+    def _get_index(resource: str) -> dict:
+        """获取索引 - 首次查询时构建，超过重建间隔后在后台重建（期间继续使用旧索引）"""
+        index = SearchService._indexes.get(resource)
+        if index is None:
+            with SearchService._build_locks[resource]:
+                index = SearchService._indexes.get(resource)
+                if index is None:
+                    with SearchService._lock:
+                        SearchService._pending[resource] = []
+                    index = SearchService._rebuild(resource)
+            return index
+
+        if time.time() - index['built'] > settings.SEARCH_SUGGEST['REBUILD_INTERVAL']:
+            with SearchService._lock:
+                if resource in SearchService._pending:
+                    return index
+                SearchService._pending[resource] = []
+            threading.Thread(target=SearchService._rebuild_background, args=(resource,), daemon=True).start()
+        return index
+
+    @staticmethod
+    def _rebuild(resource: str) -> dict:
+        """构建并发布索引（调用方已在 _pending 中登记），重放构建期间收到的变更"""
+        try:
+            index = SearchService._build(resource)
+            with SearchService._lock:
+                for before, after in SearchService._pending.get(resource, ()):
+                    SearchService._apply(index, resource, before, after)
+                SearchService._indexes[resource] = index
+            return index
+        finally:
+            with SearchService._lock:
+                SearchService._pending.pop(resource, None)
+
+    @staticmethod
+    def _rebuild_background(resource: str) -> None:
+        try:
+            SearchService._rebuild(resource)
+        except Exception:
+            logger.exception(f"重建搜索索引失败：{resource}")
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def _build(resource: str) -> dict:
+        """从数据库构建索引"""
+        model, output, searchable = SearchService.RESOURCES[resource]
+        built = time.time()
+        columns = ['id'] + [name for name in dict.fromkeys(output + searchable)]
+        index = {'entries': [], 'rows': {}, 'terms': {}, 'built': built}
+        for row in model.objects.values(*columns):
+            SearchService._add(index, resource, row)
+        index['entries'].sort()
+        logger.info(f"构建搜索索引：{resource}，{len(index['rows'])} 条，耗时 {time.time() - built:.3f}s")
+        return index
+
+    @staticmethod
+    def _add(index: dict, resource: str, row: dict, keep_sorted: bool = False) -> None:
+        """加入一行（调用方持有锁或索引尚未发布）"""
+        _, output, searchable = SearchService.RESOURCES[resource]
+        id = row['id']
+        terms = set()
+        for name in searchable:
+            terms.update(_terms(row[name], pinyin=name == 'name'))
+        index['rows'][id] = {name: row[name] for name in output}
+        index['terms'][id] = list(terms)
+        for term in terms:
+            if keep_sorted:
+                insort(index['entries'], (term, id))
+            else:
+                index['entries'].append((term, id))
+
+    @staticmethod
+    def _apply(index: dict, resource: str, before: list, after: list) -> None:
+        """应用一次数据变更（调用方持有锁）：移除变化前后涉及的行，再加入变化后的行"""
+        for row in before + after:
+            SearchService._remove(index, row['id'])
+        for row in after:
+            SearchService._add(index, resource, row, keep_sorted=True)
+
+    @staticmethod
+    def _remove(index: dict, id) -> None:
+        """移除一行（调用方持有锁）"""
+        entries = index['entries']
+        for term in index['terms'].pop(id, ()):
+            position = bisect_left(entries, (term, id))
+            if position < len(entries) and entries[position] == (term, id):
+                del entries[position]
+        index['rows'].pop(id, None)
+
+
+def _terms(value, pinyin: bool = False) -> list:
+    """检索词 - 原值（不区分大小写），姓名另加拼音全拼和首字母"""
+    if not value:
+        return []
+    terms = [str(value).casefold()]
+    if pinyin:
+        module = _load_pinyin()
+        if module is not None:
+            terms.append(''.join(module.lazy_pinyin(value)).casefold())
+            terms.append(''.join(module.lazy_pinyin(value, style=module.Style.FIRST_LETTER)).casefold())
+    return terms
+
+
+def _load_pinyin():
+    """延迟导入 pypinyin，未安装时只支持按原值检索"""
+    global _pinyin
+    if _pinyin is None:
+        try:
+            import pypinyin
+            _pinyin = pypinyin
+        except ImportError:
+            logger.warning("未安装 pypinyin，输入联想不支持拼音检索")
+            _pinyin = False
+    return _pinyin or None
+
+
+@receiver(data_changed, sender=Emp)
+@receiver(data_changed, sender=Student)
+@receiver(data_changed, sender=Clazz)
+def _on_data_changed(sender, before, after, **kwargs):
+    """增量更新已构建的索引，构建中的索引在构建完成后重放（未构建时忽略，构建时会读到最新数据）"""
+    for resource, (model, _, _) in SearchService.RESOURCES.items():
+        if model is not sender:
+            continue
+        with SearchService._lock:
+            index = SearchService._indexes.get(resource)
+            if index is not None:
+                SearchService._apply(index, resource, before, after)
+            if resource in SearchService._pending:
+                SearchService._pending[resource].append((before, after))
@@ -5,8 +5,14 @@
 禁止：接收 request 对象、返回 Result、做序列化
 """
 
+import asyncio
 from datetime import datetime
-from ..models import Student
+from django.db import transaction
+from common.async_support import alist
+from common.conditional import queryset_version, row_version
+from ..models import Clazz, Student
+from ..signals import notify_change, snapshot
+from .sync_service import SyncService
 
 
 class StudentService:
@@ -18,6 +24,29 @@ class StudentService:
         
         支持条件：name(模糊)、degree、clazzId
         """
+        # 1. 查询条件
+        queryset, start, pageSize = StudentService._pageQuery(params)
+        
+        # 2. 分页
+        total = queryset.count()
+        studentList = queryset[start:start + pageSize]
+        
+        return {'total': total, 'rows': studentList}
+    
+    @staticmethod
+    async def apage(params: dict, load_rows=None) -> dict:
+        """
+        分页条件查询（异步）- 总数和当前页两个查询并发执行
+        load_rows：读取当前页的协程函数（参数为当前页查询集），默认读取为模型实例列表
+        """
+        queryset, start, pageSize = StudentService._pageQuery(params)
+        total, studentList = await asyncio.gather(queryset.acount(),
+                                                  (load_rows or alist)(queryset[start:start + pageSize]))
+        return {'total': total, 'rows': studentList}
+    
+    @staticmethod
+    def _pageQuery(params: dict) -> tuple:
+        """分页查询条件 - 返回 (排序后的查询集, 起始行, 每页条数)"""
         # 1. 提取查询参数
         name = params.get('name')
         degree = params.get('degree')
@@ -37,12 +66,18 @@ class StudentService:
         # 3. 排序
         queryset = queryset.order_by('-update_time')
         
-        # 4. 分页
-        total = queryset.count()
-        start = (page - 1) * pageSize
-        studentList = queryset[start:start + pageSize]
-        
-        return {'total': total, 'rows': studentList}
+        return queryset, (page - 1) * pageSize, pageSize
+    
+    @staticmethod
+    def getVersion(id: int = None):
+        """
+        数据版本 - 用于条件请求（ETag）
+        分页列表包含班级名称，班级表的变化也会改变版本；
+        传入 id 时为单个学生的版本，学生不存在时返回 None
+        """
+        if id is not None:
+            return row_version(Student.objects.filter(pk=id))
+        return queryset_version(Student.objects.all(), Clazz.objects.all())
     
     @staticmethod
     def save(data: dict) -> Student:
@@ -50,7 +85,7 @@ class StudentService:
         添加学生 - 对标 Java StudentServiceImpl.save()
         """
         now = datetime.now()
-        return Student.objects.create(
+        student = Student.objects.create(
             name=data.get('name'),
             no=data.get('no'),
             gender=data.get('gender'),
@@ -66,6 +101,8 @@ class StudentService:
             create_time=now,
             update_time=now
         )
+        notify_change(Student, 'create', after=snapshot(Student.objects.filter(pk=student.id)))
+        return student
     
     @staticmethod
     def _parse_int(value):
@@ -75,12 +112,14 @@ class StudentService:
         return int(value)
     
     @staticmethod
+    @transaction.atomic
     def update(data: dict) -> None:
         """
         修改学生 - 对标 Java StudentServiceImpl.update()
         """
         student_id = data.get('id')
         now = datetime.now()
+        before = snapshot(Student.objects.select_for_update().filter(pk=student_id))
         Student.objects.filter(pk=student_id).update(
             name=data.get('name'),
             no=data.get('no'),
@@ -94,30 +133,43 @@ class StudentService:
             clazz_id=StudentService._parse_int(data.get('clazzId')),
             update_time=now
         )
+        notify_change(Student, 'update', before=before, after=snapshot(Student.objects.filter(pk=student_id)))
     
     @staticmethod
-    def getInfo(id: int) -> Student:
+    def getInfo(id: int, fields: list = None) -> Student:
         """
         根据ID查询学生 - 对标 Java StudentServiceImpl.getInfo()
+        fields: 需要的输出字段（None 为全部），只读取对应的列
         """
-        return Student.objects.get(pk=id)
+        queryset = Student.objects.all()
+        if fields is not None:
+            columns = {field.name for field in Student._meta.concrete_fields}
+            queryset = queryset.only('id', *[name for name in fields if name in columns])
+        return queryset.get(pk=id)
     
     @staticmethod
+    @transaction.atomic
     def delete(ids: list) -> None:
         """
         批量删除学生 - 对标 Java StudentServiceImpl.delete()
         """
+        before = snapshot(Student.objects.select_for_update().filter(pk__in=ids))
         Student.objects.filter(pk__in=ids).delete()
+        SyncService.recordDeletes(Student, [row['id'] for row in before])
+        notify_change(Student, 'delete', before=before)
     
     @staticmethod
+    @transaction.atomic
     def violationHandle(id: int, score: int) -> None:
         """
         违纪处理 - 对标 Java StudentServiceImpl.violationHandle()
         违纪次数 +1，违纪扣分 +score
         """
         from django.db.models import F
+        before = snapshot(Student.objects.select_for_update().filter(pk=id))
         Student.objects.filter(pk=id).update(
             violation_count=F('violation_count') + 1,
             violation_score=F('violation_score') + score,
             update_time=datetime.now()
         )
+        notify_change(Student, 'update', before=before, after=snapshot(Student.objects.filter(pk=id)))
@@ -0,0 +1,153 @@
+"""
+增量同步服务 - 客户端按水位线拉取变更数据
+
+变更流由两部分按 (时间, 类型, ID) 归并排序：
+- 修改 / 新增：数据表中 update_time 晚于水位线的行，按 (update_time, id) 排序（索引 idx_xxx_update_time）；
+  update_time 为空的行（如直接导入的数据）按 create_time 参与同步，两者都为空时视为最早的变更
+- 删除：各 Service 删除数据时在同一事务中写入的删除记录（sync_tombstone），
+  保留 SYNC['TOMBSTONE_RETENTION_DAYS'] 天后由 gc_sync_tombstones 命令清除
+
+游标为上一页最后一条变更的位置 "时间,类型,ID"（类型 0 修改、1 删除），按游标继续翻页不会遗漏或重复；
+最后一页返回的游标回退 SYNC['OVERLAP_SECONDS'] 秒，覆盖提交晚于 update_time 的事务，
+因此下次同步可能重复返回最近几秒的变更，客户端按 ID 覆盖 / 删除即可（幂等）；
+游标或水位线早于删除记录保留期时，删除记录可能已被清除，返回 resyncRequired 要求客户端重新全量同步
+"""
+
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db.models import DateTimeField, F, Q, Value
+from django.db.models.functions import Coalesce
+from common.exceptions import BusinessException
+from ..models import Clazz, Dept, Emp, Student, SyncTombstone
+
+# 变更类型
+CHANGE_UPSERT = 0
+CHANGE_DELETE = 1
+
+# update_time、create_time 都为空的行的变更时间
+EPOCH = datetime(1970, 1, 1)
+
+
+class SyncService:
+
+    # 路由中的资源名 → 模型
+    RESOURCES = {
+        'emps': Emp,
+        'students': Student,
+        'clazzs': Clazz,
+        'depts': Dept,
+    }
+
+    @staticmethod
+    def changes(resource: str, params: dict) -> dict:
+        """
+        查询变更 - 返回 {'rows': 修改的数据（查询集）, 'deleted': 删除的 ID, 'nextCursor', 'hasMore', 'resyncRequired'}
+        params: since 水位线时间（不传为全量同步），cursor 上次返回的游标（优先于 since），pageSize 每页变更数
+        """
+        model = SyncService.RESOURCES.get(resource)
+        if model is None:
+            raise BusinessException(f"不支持同步的资源：{resource}")
+        config = settings.SYNC
+        try:
+            pageSize = min(max(int(params.get('pageSize') or config['PAGE_SIZE']), 1), config['MAX_PAGE_SIZE'])
+        except ValueError:
+            raise BusinessException("pageSize 格式错误")
+
+        # 1. 解析起点：(时间, 类型, ID)，类型 -1 表示包含该时间的全部变更
+        cursor = SyncService._parseCursor(params.get('cursor'), params.get('since'))
+        if cursor is not None and cursor[0] < SyncService._retentionCutoff():
+            # 起点之后的删除记录可能已被清除，增量结果不完整
+            return {'rows': model.objects.none(), 'deleted': [], 'nextCursor': None, 'hasMore': False,
+                    'resyncRequired': True}
+
+        # 2. 三路（update_time 非空、update_time 为空、删除记录）各取 pageSize + 1 条，归并后取前 pageSize 条
+        upserts = model.objects.filter(update_time__isnull=False).annotate(sync_time=F('update_time'))
+        legacy = model.objects.filter(update_time__isnull=True).annotate(
+            sync_time=Coalesce('create_time', Value(EPOCH), output_field=DateTimeField()))
+        tombstones = SyncTombstone.objects.filter(resource=model._meta.db_table).annotate(sync_time=F('delete_time'))
+        if cursor is not None:
+            upserts = SyncService._after(upserts, cursor, CHANGE_UPSERT)
+            legacy = SyncService._after(legacy, cursor, CHANGE_UPSERT)
+            tombstones = SyncService._after(tombstones, cursor, CHANGE_DELETE)
+        else:
+            # 全量同步：客户端没有本地数据，不需要删除记录
+            tombstones = tombstones.none()
+        changes = []
+        for queryset in (upserts, legacy):
+            changes += [(time, CHANGE_UPSERT, id, id) for id, time in
+                        queryset.order_by('sync_time', 'id').values_list('id', 'sync_time')[:pageSize + 1]]
+        changes += [(time, CHANGE_DELETE, id, row_id) for id, row_id, time in
+                    tombstones.order_by('sync_time', 'id').values_list('id', 'row_id', 'sync_time')[:pageSize + 1]]
+        changes.sort()
+        hasMore = len(changes) > pageSize
+        changes = changes[:pageSize]
+
+        # 3. 下一页游标：还有数据时精确到最后一条；已到末尾时回退重叠窗口
+        if hasMore:
+            last = changes[-1]
+            nextCursor = SyncService._formatCursor(last[0], last[1], last[2])
+        elif changes:
+            nextCursor = SyncService._formatCursor(changes[-1][0] - timedelta(seconds=config['OVERLAP_SECONDS']), -1, 0)
+        elif cursor is not None:
+            nextCursor = SyncService._formatCursor(*cursor)
+        else:
+            nextCursor = None
+
+        upsertIds = [change[3] for change in changes if change[1] == CHANGE_UPSERT]
+        return {
+            'rows': model.objects.filter(id__in=upsertIds).order_by('update_time', 'id'),
+            'deleted': [change[3] for change in changes if change[1] == CHANGE_DELETE],
+            'nextCursor': nextCursor,
+            'hasMore': hasMore,
+            'resyncRequired': False,
+        }
+
+    @staticmethod
+    def recordDeletes(model, ids) -> None:
+        """记录删除（由 Service 的删除方法在同一事务中调用）"""
+        now = datetime.now()
+        SyncTombstone.objects.bulk_create([
+            SyncTombstone(resource=model._meta.db_table, row_id=id, delete_time=now) for id in ids
+        ])
+
+    @staticmethod
+    def purgeTombstones(dry_run: bool = False) -> int:
+        """清除超过保留期的删除记录，返回清除（dry_run 时为待清除）的条数"""
+        queryset = SyncTombstone.objects.filter(delete_time__lt=SyncService._retentionCutoff())
+        if dry_run:
+            return queryset.count()
+        return queryset.delete()[0]
+
+    @staticmethod
+    def _retentionCutoff() -> datetime:
+        """删除记录保留期的起点：早于此时间的删除记录会被清除"""
+        return datetime.now() - timedelta(days=settings.SYNC['TOMBSTONE_RETENTION_DAYS'])
+
+    @staticmethod
+    def _after(queryset, cursor: tuple, kind: int):
+        """游标之后的变更 - queryset 的变更时间为 sync_time，kind 为该路变更的类型"""
+        time, cursor_kind, id = cursor
+        if cursor_kind == kind:
+            return queryset.filter(Q(sync_time__gt=time) | Q(sync_time=time, id__gt=id))
+        if cursor_kind > kind:
+            return queryset.filter(sync_time__gt=time)
+        return queryset.filter(sync_time__gte=time)
+
+    @staticmethod
+    def _parseCursor(cursor: str, since: str):
+        if cursor:
+            try:
+                time, kind, id = cursor.split(',')
+                return datetime.fromisoformat(time), int(kind), int(id)
+            except ValueError:
+                raise BusinessException("cursor 格式错误")
+        if since:
+            try:
+                return datetime.fromisoformat(since), -1, 0
+            except ValueError:
+                raise BusinessException("since 格式错误，应为 yyyy-MM-dd HH:mm:ss")
+        return None
+
+    @staticmethod
+    def _formatCursor(time: datetime, kind: int, id: int) -> str:
+        return f"{time.isoformat()},{kind},{id}"
@@ -1,42 +1,170 @@
 """
 文件上传服务层
 
-对标 Java: UploadController.java（本地存储方案）
+对标 Java: UploadController.java（本地存储 / 阿里云 OSS 方案）
+
+存储后端由 settings.STORAGE 配置（common.storage）：
+- 本地存储：直接写入 MEDIA_ROOT/YYYY/MM
+- 远程存储：先暂存到本地，再上传到对象存储；开启 ASYNC_UPLOAD 时由后台线程上传，
+  请求立即返回最终 URL，不等待远程 PUT 完成
 """
 
+import logging
 import os
+import shutil
+import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from django.conf import settings
+from common.storage import get_storage
+from .image_service import ImageService
+
+logger = logging.getLogger(__name__)
 
 
 class UploadService:
-    
+
+    # 批量上传的保存线程池（进程内共享，限制并发写盘数）
+    _executor = None
+    # 远程存储异步上传线程池
+    _async_executor = None
+    _executor_lock = threading.Lock()
+
     @staticmethod
     def upload(file) -> str:
         """
-        上传文件到本地 static/uploads 目录
+        上传文件到存储后端（按年/月目录组织）
         返回：可访问的 URL
         """
-        # 1. 获取原始文件名和扩展名
-        original_name = file.name
-        extension = os.path.splitext(original_name)[1]
-        
-        # 2. 生成新文件名（UUID + 扩展名）- 对标 Java UUID.randomUUID()
-        new_filename = f"{uuid.uuid4()}{extension}"
-        
-        # 3. 创建日期目录（按年/月组织）
+        # 1. 生成存储 key：YYYY/MM/UUID.扩展名 - 对标 Java UUID.randomUUID()
+        key = UploadService.generateKey(file.name)
+        storage = get_storage()
+
+        # 2. 本地存储：直接写入最终位置，图片交给后台线程池生成缩略图
+        if storage.local_path(key) is not None:
+            url = storage.save(key, file)
+            ImageService.submit(storage.local_path(key), key)
+            return url
+
+        # 3. 远程存储：先暂存到本地，再发布到对象存储
+        staging_path = UploadService._spool(file)
+        return UploadService.publishFile(staging_path, key)
+
+    @staticmethod
+    def publishFile(path, key: str) -> str:
+        """
+        发布本地文件到存储后端（本地文件由本方法接管，完成后删除）
+        返回：可访问的 URL
+        """
+        storage = get_storage()
+
+        # 1. 本地存储：移动到最终位置
+        if storage.local_path(key) is not None:
+            url = storage.move_file(key, path)
+            ImageService.submit(storage.local_path(key), key)
+            return url
+
+        # 2. 远程存储：异步模式下请求线程不等待远程 PUT
+        if settings.STORAGE.get('ASYNC_UPLOAD'):
+            UploadService._get_async_executor().submit(UploadService._publishRemote, path, key)
+            return storage.url(key)
+        return UploadService._publishRemote(path, key)
+
+    @staticmethod
+    def generateKey(file_name: str) -> str:
+        """生成存储 key：YYYY/MM/UUID.扩展名"""
+        extension = os.path.splitext(file_name)[1]
         date_path = datetime.now().strftime('%Y/%m')
-        upload_dir = Path(settings.MEDIA_ROOT) / date_path
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 4. 保存文件
-        file_path = upload_dir / new_filename
-        with open(file_path, 'wb+') as destination:
-            for chunk in file.chunks():
-                destination.write(chunk)
-        
-        # 5. 返回可访问的 URL
-        # 格式：http://localhost:8080/media/2025/12/xxx.png
-        return f"{settings.MEDIA_URL}{date_path}/{new_filename}"
+        return f"{date_path}/{uuid.uuid4()}{extension}"
+
+    @staticmethod
+    def uploadBatch(files: list) -> list:
+        """
+        批量上传 - 通过有界线程池并发保存多个文件
+        返回：与 files 顺序一致的 URL 列表；任一文件保存失败时删除本批已保存的文件，整批失败
+        """
+        from common.exceptions import BusinessException
+
+        # 1. 校验文件数量（请求解析时已由上传处理器限制）
+        if len(files) > settings.UPLOAD_BATCH_MAX_FILES:
+            raise BusinessException(f"单次最多上传 {settings.UPLOAD_BATCH_MAX_FILES} 个文件")
+
+        # 2. 并发保存，等待全部完成（结果顺序与上传顺序一致）
+        futures = [UploadService._get_executor().submit(UploadService.upload, file) for file in files]
+        urls = []
+        error = None
+        for future in futures:
+            try:
+                urls.append(future.result())
+            except Exception as e:
+                error = error or e
+
+        # 3. 有文件失败：删除已保存的文件，避免留下无人引用的文件
+        if error is not None:
+            storage = get_storage()
+            for url in urls:
+                key = storage.key_from_url(url)
+                try:
+                    if key:
+                        storage.delete(key)
+                except Exception:
+                    logger.exception(f"删除已保存的文件失败：{key}")
+            logger.warning(f"批量上传失败，已删除本批已保存的 {len(urls)} 个文件：{error}")
+            raise error
+        return urls
+
+    @staticmethod
+    def _publishRemote(path, key: str) -> str:
+        """上传暂存文件到远程存储，图片生成缩略图后再删除暂存文件"""
+        try:
+            url = get_storage().save_file(key, path)
+        except Exception:
+            logger.exception(f"上传到远程存储失败：{key}")
+            os.remove(path)
+            raise
+        if not ImageService.submit(path, key, remove_source=True):
+            os.remove(path)
+        logger.info(f"已上传到远程存储：{key}")
+        return url
+
+    @staticmethod
+    def _spool(file) -> str:
+        """将上传文件分块写入本地暂存目录，返回暂存文件路径"""
+        staging_dir = Path(settings.UPLOAD_STAGING_DIR)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=staging_dir)
+        with os.fdopen(fd, 'wb') as destination:
+            if hasattr(file, 'temporary_file_path'):
+                with open(file.temporary_file_path(), 'rb') as source:
+                    shutil.copyfileobj(source, destination)
+            else:
+                for chunk in file.chunks():
+                    destination.write(chunk)
+        return path
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        """延迟创建批量上传线程池（进程内单例）"""
+        if UploadService._executor is None:
+            with UploadService._executor_lock:
+                if UploadService._executor is None:
+                    UploadService._executor = ThreadPoolExecutor(
+                        max_workers=settings.UPLOAD_BATCH_WORKERS,
+                        thread_name_prefix='upload-batch'
+                    )
+        return UploadService._executor
+
+    @staticmethod
+    def _get_async_executor() -> ThreadPoolExecutor:
+        """延迟创建异步上传线程池（进程内单例）"""
+        if UploadService._async_executor is None:
+            with UploadService._executor_lock:
+                if UploadService._async_executor is None:
+                    UploadService._async_executor = ThreadPoolExecutor(
+                        max_workers=settings.STORAGE.get('ASYNC_WORKERS', 4),
+                        thread_name_prefix='upload-async'
+                    )
+        return UploadService._async_executor
@@ -0,0 +1,48 @@
+"""
+数据变更信号 - Service 写操作提交后发出
+
+Service 层大量使用 filter().update() / filter().delete()，不会触发 Django 的模型信号，
+因此由 Service 在写操作前后读取行快照，显式调用 notify_change() 发送 data_changed。
+信号在事务提交后（transaction.on_commit）才发送，回滚的写操作不会通知。
+
+信号参数：
+- sender: 模型类（Emp / Student / Clazz / Dept）
+- action: create / update / delete
+- before: 变更前的行快照列表（create 时为空）
+- after: 变更后的行快照列表（delete 时为空）
+
+接收者在 ManagementConfig.ready() 中注册。
+"""
+
+import logging
+from django.db import transaction
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+data_changed = Signal()
+
+
+def snapshot(queryset) -> list:
+    """
+    读取行快照（字段名为数据库列名，如 dept_id）
+
+    变更前的快照应在同一事务内用 select_for_update() 读取，保证与随后的写操作一致
+    """
+    return list(queryset.values())
+
+
+def notify_change(model, action: str, before: list = None, after: list = None) -> None:
+    """事务提交后发送 data_changed 信号"""
+    before = before or []
+    after = after or []
+    if not before and not after:
+        return
+
+    def send():
+        for receiver, response in data_changed.send_robust(sender=model, action=action,
+                                                           before=before, after=after):
+            if isinstance(response, Exception):
+                logger.error(f"处理数据变更信号失败：{receiver}, {response}")
+
+    transaction.on_commit(send)
@@ -0,0 +1,68 @@
+"""
+测试基类 - 建表和公共测试数据
+"""
+
+from datetime import date, datetime, timedelta
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from ..models import Clazz, Dept, Emp, Student
+from ..services.dimension_cache_service import DimensionCacheService
+
+
+class ManagementTestCase(TestCase):
+    """
+    模型均为 managed=False，测试库中手动建表；公共测试数据：
+    - 部门：学工部、教研部（时间为空）
+    - 员工：张三（学工部，班主任）、李四（可空字段全部为空，部门不存在）
+    - 班级：JavaEE 就业 100 期（在读）、未开班、已结课
+    - 学员：王五（JavaEE 就业 100 期）、赵六（班级不存在）
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # 模型均为 managed=False，测试库中手动建表（需在 TestCase 开启事务之前）
+        with connection.schema_editor() as schema_editor:
+            for model in apps.get_app_config('management').get_models():
+                schema_editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as schema_editor:
+            for model in apps.get_app_config('management').get_models():
+                schema_editor.delete_model(model)
+
+    @classmethod
+    def setUpTestData(cls):
+        now = datetime(2024, 3, 5, 8, 9, 7, 123456)
+        today = date.today()
+        dept = Dept.objects.create(name='学工部', create_time=now, update_time=now)
+        Dept.objects.create(name='教研部')
+        master = Emp.objects.create(
+            username='zhangsan', name='张三', gender=1, phone='13800000001', job=2, salary=8000,
+            image='https://example.com/a.jpg', entry_date=date(2020, 1, 2), dept_id=dept.id,
+            create_time=now, update_time=now + timedelta(seconds=1)
+        )
+        # 可空字段全部为空，部门不存在
+        Emp.objects.create(username='lisi', name='李四', gender=2, phone='13800000002', dept_id=999)
+        clazz = Clazz.objects.create(
+            name='JavaEE 就业 100 期', room='212', begin_date=today - timedelta(days=30),
+            end_date=today + timedelta(days=30), master_id=master.id, subject=1,
+            create_time=now, update_time=now
+        )
+        Clazz.objects.create(name='未开班', begin_date=today + timedelta(days=1), master_id=999)
+        Clazz.objects.create(name='已结课', begin_date=date(2000, 1, 1), end_date=date(2000, 6, 1))
+        Student.objects.create(
+            name='王五', no='2024000001', gender=1, phone='13900000001', id_card='110101200001011234',
+            is_college=1, address='北京', degree=4, graduation_date=date(2022, 7, 1), clazz_id=clazz.id,
+            violation_count=2, violation_score=5, create_time=now, update_time=now
+        )
+        Student.objects.create(name='赵六', no='2024000002', clazz_id=999)
+
+    def setUp(self):
+        # 名称缓存跨测试共享，避免读到其他测试的数据
+        cache.clear()
+        DimensionCacheService._local.clear()
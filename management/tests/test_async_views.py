@@ -0,0 +1,24 @@
+import json
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from ..serializers import EmpProjection
+from ..services.emp_service import EmpService
+from ..views.async_views import AsyncReportView
+from .base import ManagementTestCase
+
+
+class AsyncViewTest(ManagementTestCase):
+    """异步只读视图（/async/...）"""
+
+    def test_async_page(self):
+        # 异步路径（apage + adata）与同步路径输出一致
+        params = {'page': '1', 'pageSize': '1'}
+        expected = EmpService.page(params)
+        actual = async_to_sync(EmpService.apage)(params, lambda rows: EmpProjection(rows).adata())
+        self.assertEqual(actual['total'], expected['total'])
+        self.assertEqual(actual['rows'], EmpProjection(expected['rows']).data)
+
+    def test_unknown_report(self):
+        # 未知的报表名称返回业务错误，而不是 500
+        response = async_to_sync(AsyncReportView.as_view())(RequestFactory().get('/async/report/x'), name='x')
+        self.assertEqual((200, 0), (response.status_code, json.loads(response.content)['code']))
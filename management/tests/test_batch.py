@@ -0,0 +1,23 @@
+from django.test import RequestFactory, override_settings
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from ..models import Emp
+from ..serializers import EmpProjection
+from ..views.batch_views import BatchView
+from .base import ManagementTestCase
+
+
+class BatchViewTest(ManagementTestCase):
+    """批量请求（POST /batch）"""
+
+    @override_settings(STREAMING_RESPONSE={'THRESHOLD': 0, 'CHUNK_SIZE': 1, 'BUFFER_SIZE': 1})
+    def test_batch_stream(self):
+        # 批量请求中的子请求返回流式响应时，按普通数据返回；外层的条件请求头不传给子请求
+        request = RequestFactory().post('/batch', {'requests': [{'method': 'GET', 'url': '/emps/list'}]},
+                                        content_type='application/json')
+        request.META['HTTP_IF_NONE_MATCH'] = '*'
+        response = BatchView.as_view()(request)
+        self.assertEqual(200, response.status_code)
+        result = response.data['data'][0]
+        self.assertEqual(200, result['status'])
+        self.assertEqual(CamelCaseJSONRenderer().render(EmpProjection(Emp.objects.order_by('-update_time')).data),
+                         CamelCaseJSONRenderer().render(result['body']['data']))
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.test import RequestFactory
+from common import conditional
+from common.response_cache import invalidate_tags
+from ..models import Dept
+from ..services.dept_service import DeptService
+from ..views.dept_views import DeptDetailView, DeptListView
+from .base import ManagementTestCase
+
+
+class ConditionalGetTest(ManagementTestCase):
+    """条件请求（common.conditional）"""
+
+    def get(self, view, path, etag=None, **kwargs):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return view.as_view()(RequestFactory().get(path, **headers), **kwargs)
+
+    def test_not_modified(self):
+        # 数据未变化时返回 304；ETag 只来自数据库，不受进程内缓存影响（其他进程计算出相同的 ETag）
+        response = self.get(DeptListView, '/depts')
+        etag = response['ETag']
+        self.assertEqual('no-cache', response['Cache-Control'])
+        self.assertEqual(304, self.get(DeptListView, '/depts', etag).status_code)
+        invalidate_tags('dept')
+        self.assertEqual(304, self.get(DeptListView, '/depts', etag).status_code)
+        cache.clear()
+        self.assertEqual(304, self.get(DeptListView, '/depts', etag).status_code)
+        self.assertNotEqual(etag, self.get(DeptListView, '/depts?page=2')['ETag'])
+
+    def test_etag_after_write(self):
+        # 写操作后：同一秒窗口内不返回 ETag（直接执行视图），之后返回新的 ETag
+        dept = Dept.objects.get(name='学工部')
+        list_etag = self.get(DeptListView, '/depts')['ETag']
+        detail_etag = self.get(DeptDetailView, f"/depts/{dept.id}", id=dept.id)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            DeptService.update({'id': dept.id, 'name': '学工部一'})
+
+        response = self.get(DeptListView, '/depts', list_etag)
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(self.get(DeptDetailView, f"/depts/{dept.id}", detail_etag, id=dept.id).has_header('ETag'))
+
+        later = datetime.now() + timedelta(seconds=conditional.UNSETTLED_SECONDS + 1)
+        with mock.patch.object(conditional, 'datetime', wraps=datetime) as patched:
+            patched.now.return_value = later
+            response = self.get(DeptListView, '/depts', list_etag)
+            self.assertEqual(200, response.status_code)
+            self.assertNotEqual(list_etag, response['ETag'])
+            self.assertEqual(304, self.get(DeptListView, '/depts', response['ETag']).status_code)
+            response = self.get(DeptDetailView, f"/depts/{dept.id}", detail_etag, id=dept.id)
+            self.assertEqual(200, response.status_code)
+            self.assertNotEqual(detail_etag, response['ETag'])
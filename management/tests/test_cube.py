@@ -0,0 +1,66 @@
+import numpy as np
+from django.test import RequestFactory
+from ..models import Emp
+from ..services.cube_service import CubeService
+from ..services.emp_service import EmpService
+from ..views.report_views import ReportCubeView
+from .base import ManagementTestCase
+
+
+class CubeTest(ManagementTestCase):
+    """统计立方体（CubeService、GET /report/cube）"""
+
+    def setUp(self):
+        super().setUp()
+        CubeService._snapshots.clear()
+        CubeService._stale.clear()
+
+    def test_read_after_write(self):
+        # 写操作后的下次查询重新加载快照，不返回旧快照（也不经过响应缓存）的结果
+        view = ReportCubeView.as_view()
+
+        def salary():
+            return view(RequestFactory().get('/report/cube', {'field': 'salary'})).data['data']['rows'][0]['sum']
+
+        self.assertEqual(8000, salary())
+        emp = Emp.objects.get(username='zhangsan')
+        with self.captureOnCommitCallbacks(execute=True):
+            EmpService.update({'id': emp.id, 'username': emp.username, 'name': emp.name, 'gender': emp.gender,
+                               'phone': emp.phone, 'job': emp.job, 'salary': 9000, 'deptId': emp.dept_id})
+        self.assertEqual(9000, salary())
+
+    def test_percentiles_and_histogram(self):
+        # 向量化分组的分位数与逐组 np.percentile 一致，直方图与按全局桶边界逐组 np.histogram 一致；空值不参与数值统计
+        rng = np.random.default_rng(7)
+        size = 1000
+        columns = {
+            'dept_id': rng.integers(-1, 4, size).astype(np.int32),
+            'job': rng.integers(1, 3, size).astype(np.int32),
+            'salary': rng.normal(8000, 2000, size).round(),
+        }
+        columns['salary'][rng.random(size) < 0.1] = np.nan
+        result = CubeService.aggregate(columns, size, ['dept_id', 'job'], 'salary', [0, 25, 50, 90, 100], 10)
+
+        values = columns['salary'][~np.isnan(columns['salary'])]
+        edges = np.histogram_bin_edges(values, bins=10)
+        np.testing.assert_allclose(edges, result['bins'])
+        self.assertEqual(len(values), sum(row['valueCount'] for row in result['rows']))
+        self.assertEqual(size, sum(row['count'] for row in result['rows']))
+        for row in result['rows']:
+            dept_id = -1 if row['key'][0] is None else row['key'][0]
+            in_group = (columns['dept_id'] == dept_id) & (columns['job'] == row['key'][1])
+            group_values = columns['salary'][in_group & ~np.isnan(columns['salary'])]
+            self.assertEqual(int(in_group.sum()), row['count'])
+            self.assertEqual(len(group_values), row['valueCount'])
+            for name, p in (('p0', 0), ('p25', 25), ('p50', 50), ('p90', 90), ('p100', 100)):
+                self.assertAlmostEqual(np.percentile(group_values, p), row['percentiles'][name], places=3)
+            self.assertEqual(np.histogram(group_values, bins=edges)[0].tolist(), row['histogram'])
+
+    def test_empty_group_values(self):
+        # 分组内数值全为空时均值和分位数为 None，直方图为 0
+        columns = {'job': np.array([1, 1, 2], dtype=np.int32), 'salary': np.array([np.nan, np.nan, 5000.0])}
+        rows = CubeService.aggregate(columns, 3, ['job'], 'salary', [50], 2)['rows']
+        self.assertEqual({'key': [1], 'count': 2, 'valueCount': 0, 'sum': 0, 'mean': None,
+                          'percentiles': {'p50': None}, 'histogram': [0, 0]}, rows[0])
+        self.assertEqual(5000, rows[1]['percentiles']['p50'])
+        self.assertEqual(1, sum(rows[1]['histogram']))
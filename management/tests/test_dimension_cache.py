@@ -0,0 +1,92 @@
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+from ..models import Dept, Emp
+from ..services.dept_service import DeptService
+from ..services.dimension_cache_service import DimensionCacheService
+from ..views.dept_views import DeptOptionsView
+from .base import ManagementTestCase
+
+
+class DimensionOptionsTest(ManagementTestCase):
+    """下拉选项与 ETag（DimensionCacheService）"""
+
+    def test_options_version(self):
+        # 其他进程的写操作（不触发本进程的信号）后 ETag 和选项随数据库变化
+        view = DeptOptionsView.as_view()
+        response = view(RequestFactory().get('/depts/options'))
+        etag = response['ETag']
+        self.assertEqual(304, view(RequestFactory().get('/depts/options', HTTP_IF_NONE_MATCH=etag)).status_code)
+        Dept.objects.filter(name='教研部').update(name='教务部', update_time=datetime(2025, 1, 1))
+        response = view(RequestFactory().get('/depts/options', HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+        self.assertIn('教务部', [name for _, name in response.data['data']])
+
+    def test_options_single_version_query(self):
+        # 每个请求只查询一次数据版本：首次再查询选项，之后选项从 L1 返回
+        view = DeptOptionsView.as_view()
+        with self.assertNumQueries(2):
+            view(RequestFactory().get('/depts/options'))
+        with self.assertNumQueries(1):
+            response = view(RequestFactory().get('/depts/options', {'prefix': '学'}))
+        self.assertEqual(['学工部'], [name for _, name in response.data['data']])
+
+
+class DimensionNameCacheTest(ManagementTestCase):
+    """名称两级缓存（DimensionCacheService L1 / L2）"""
+
+    def setUp(self):
+        super().setUp()
+        self.dept = Dept.objects.get(name='学工部')
+
+    def test_l1_l2(self):
+        # 首次查询数据库；之后 L1 命中；L1 清空后从 L2 读取；不存在的 ID 也缓存（值为 None）
+        with self.assertNumQueries(1):
+            self.assertEqual({self.dept.id: '学工部', 999: None},
+                             DimensionCacheService.getNames('dept', [self.dept.id, 999]))
+        with self.assertNumQueries(0):
+            self.assertEqual('学工部', DimensionCacheService.getName('dept', self.dept.id))
+            self.assertIsNone(DimensionCacheService.getName('dept', 999))
+        DimensionCacheService._local.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual({self.dept.id: '学工部', 999: None},
+                             DimensionCacheService.getNames('dept', [self.dept.id, 999]))
+        cache.clear()
+        DimensionCacheService._local.clear()
+        with self.assertNumQueries(1):
+            DimensionCacheService.getNames('dept', [self.dept.id])
+
+    def test_invalidate_on_rename(self):
+        # 名称变化的写操作提交后失效维度；名称未变化的写操作不失效
+        DimensionCacheService.getName('dept', self.dept.id)
+        version = DimensionCacheService._local['dept']['version']
+        with self.captureOnCommitCallbacks(execute=True):
+            DeptService.update({'id': self.dept.id, 'name': '学工部'})
+        self.assertEqual(version, DimensionCacheService._local['dept']['version'])
+        with self.captureOnCommitCallbacks(execute=True):
+            DeptService.update({'id': self.dept.id, 'name': '学生工作部'})
+        self.assertNotEqual(version, DimensionCacheService._local['dept']['version'])
+        self.assertEqual('学生工作部', DimensionCacheService.getName('dept', self.dept.id))
+        self.assertEqual('学生工作部', DimensionCacheService.getAll('dept')[self.dept.id])
+
+    def test_shared_version(self):
+        # 其他进程提升共享版本号后，本进程在版本检查时清空 L1
+        self.assertEqual('学工部', DimensionCacheService.getName('dept', self.dept.id))
+        Dept.objects.filter(pk=self.dept.id).update(name='教务处')
+        cache.set(DimensionCacheService._version_key('dept'), 'other-process', timeout=None)
+        self.assertEqual('学工部', DimensionCacheService.getName('dept', self.dept.id))
+        with override_settings(DIMENSION_CACHE={**settings.DIMENSION_CACHE, 'VERSION_CHECK_INTERVAL': 0}):
+            self.assertEqual('教务处', DimensionCacheService.getName('dept', self.dept.id))
+
+    def test_l1_bounds(self):
+        # L1 按 LRU 保留 L1_SIZE 个条目；超过 L1_TTL 后整体重建（缓存不共享时其他进程的修改最迟在此时可见）
+        emp_ids = list(Emp.objects.values_list('id', flat=True))
+        config = {**settings.DIMENSION_CACHE, 'L1_SIZE': 1, 'L2_ENABLED': False}
+        with override_settings(DIMENSION_CACHE=config):
+            DimensionCacheService.getNames('emp', emp_ids)
+            self.assertEqual([emp_ids[-1]], list(DimensionCacheService._local['emp']['items']))
+        Emp.objects.filter(pk=emp_ids[-1]).update(name='新名字')
+        with override_settings(DIMENSION_CACHE={**config, 'L1_TTL': 0, 'VERSION_CHECK_INTERVAL': 0}):
+            self.assertEqual('新名字', DimensionCacheService.getName('emp', emp_ids[-1]))
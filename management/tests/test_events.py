@@ -0,0 +1,85 @@
+import asyncio
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from common.events import LocalBroker
+from common.events.base import OVERFLOW
+from common.events.stream import sse_stream
+
+
+class LocalBrokerTest(SimpleTestCase):
+    """事件流的进程内消息代理（common.events）"""
+
+    def setUp(self):
+        self.broker = LocalBroker({'BUFFER_SIZE': 2, 'HISTORY_SIZE': 3})
+
+    def publish(self, count: int) -> list:
+        for _ in range(count):
+            self.broker.publish('change', {'n': self.broker.sequence + 1})
+        return [f"{self.broker.epoch}-{sequence}" for sequence in range(1, self.broker.sequence + 1)]
+
+    def subscribe(self, last_event_id=None, types=None):
+        async def subscribe():
+            return self.broker.subscribe(last_event_id, types)
+
+        return async_to_sync(subscribe)()
+
+    def test_resume(self):
+        # 携带 Last-Event-ID 重连时补发之后的历史事件（按类型过滤），不需要 reset
+        ids = self.publish(3)
+        subscription = self.subscribe(ids[0])
+        self.assertIsNone(subscription.reset)
+        self.assertEqual(ids[1:], [event.id for event in subscription.backlog])
+        self.assertEqual('{"n":2}', subscription.backlog[0].data)
+        self.assertEqual([], self.subscribe(ids[-1]).backlog)
+        self.assertEqual([], self.subscribe(ids[0], types=['log']).backlog)
+
+    def test_reset(self):
+        # 代号不是本进程、序号超前或历史已不完整时无法续传，收到 reset（值为当前最新事件 ID）
+        ids = self.publish(5)
+        for last_event_id in ('other-1', f"{self.broker.epoch}-9", f"{self.broker.epoch}-x", ids[0]):
+            subscription = self.subscribe(last_event_id)
+            self.assertEqual(ids[-1], subscription.reset)
+            self.assertEqual([], subscription.backlog)
+        # 历史保留最近 3 个事件：从第 2 个之后仍可续传
+        subscription = self.subscribe(ids[1])
+        self.assertIsNone(subscription.reset)
+        self.assertEqual(ids[2:], [event.id for event in subscription.backlog])
+
+    def test_overflow(self):
+        # 订阅者缓冲区满时丢弃积压的事件，只留下溢出标记，之后的事件不再投递
+        async def scenario():
+            subscription = self.broker.subscribe()
+            self.publish(3)
+            await asyncio.sleep(0)
+            first = await subscription.get(timeout=1)
+            self.publish(1)
+            await asyncio.sleep(0)
+            return first, subscription.queue.qsize()
+
+        first, remaining = async_to_sync(scenario)()
+        self.assertIs(OVERFLOW, first)
+        self.assertEqual(0, remaining)
+
+    def test_sse_stream(self):
+        # SSE 输出：retry、补发的历史事件、实时事件；溢出时结束连接并取消订阅；无法续传时先输出 reset
+        ids = self.publish(2)
+
+        async def scenario():
+            stream = sse_stream(self.broker, self.broker.subscribe(ids[0]), {'RETRY': 1000, 'HEARTBEAT': 1})
+            messages = [await stream.__anext__() for _ in range(2)]
+            self.publish(1)
+            messages.append(await stream.__anext__())
+            self.publish(3)
+            messages += [message async for message in stream]
+
+            stream = sse_stream(self.broker, self.broker.subscribe('other-1'), {'RETRY': 1000})
+            reset = [await stream.__anext__() for _ in range(2)]
+            await stream.aclose()
+            return messages, reset
+
+        messages, reset = async_to_sync(scenario)()
+        self.assertEqual(['retry: 1000\n\n',
+                          f"id: {ids[1]}\nevent: change\ndata: {{\"n\":2}}\n\n",
+                          f"id: {self.broker.epoch}-3\nevent: change\ndata: {{\"n\":3}}\n\n"], messages)
+        self.assertEqual(f"id: {self.broker.epoch}-6\nevent: reset\ndata: {{}}\n\n", reset[1])
+        self.assertEqual(set(), self.broker.subscribers)
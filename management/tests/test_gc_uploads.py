@@ -0,0 +1,73 @@
+import os
+import tempfile
+import time
+import uuid
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.core.management import call_command
+from django.test import override_settings
+from common.storage import LocalStorage
+from ..models import Emp
+from .base import ManagementTestCase
+
+
+class GcUploadsTest(ManagementTestCase):
+    """孤儿上传文件回收命令（gc_uploads）"""
+
+    def setUp(self):
+        super().setUp()
+        temp_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.media_root = temp_dir / 'media'
+        self.quarantine_dir = temp_dir / 'quarantine'
+        storage = LocalStorage({'LOCATION': self.media_root, 'BASE_URL': '/media/'})
+        self.enterContext(override_settings(MEDIA_ROOT=self.media_root, UPLOAD_GC_QUARANTINE_DIR=self.quarantine_dir))
+        self.enterContext(mock.patch('management.management.commands.gc_uploads.get_storage', return_value=storage))
+
+        # 被引用的原图及其衍生图、宽限期外的孤儿文件及其衍生图、宽限期内的孤儿文件、其他月份的孤儿文件
+        referenced, orphan, recent = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        Emp.objects.filter(username='zhangsan').update(image=f"https://cdn.example.com/media/2025/01/{referenced}.jpg")
+        self.kept = [self.create('2025/01', f"{referenced}.jpg"), self.create('2025/01', f"{referenced}_thumb.webp"),
+                     self.create('2025/01', f"{recent}.png", age_days=1)]
+        self.orphans = [self.create('2025/01', f"{orphan}.png"), self.create('2025/01', f"{orphan}_thumb.webp")]
+        self.other_month = self.create('2025/02', 'legacy.txt')
+
+    def create(self, month: str, name: str, age_days: int = 30) -> Path:
+        path = self.media_root / month / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x')
+        mtime = time.time() - age_days * 24 * 60 * 60
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def gc(self, *args) -> str:
+        stdout = StringIO()
+        call_command('gc_uploads', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_dry_run(self):
+        # 只统计：宽限期外未被引用的文件（含衍生图）为孤儿，不删除任何文件
+        output = self.gc('--dry-run', '--month', '2025/01')
+        self.assertIn('2025/01：扫描 5 个，孤儿 2 个', output)
+        self.assertTrue(all(path.exists() for path in self.kept + self.orphans))
+
+    def test_sweep(self):
+        # 被引用的原图、跟随原图的衍生图和宽限期内的文件保留，其余删除；--month 只处理指定月份
+        self.gc('--month', '2025/01')
+        self.assertTrue(all(path.exists() for path in self.kept))
+        self.assertFalse(any(path.exists() for path in self.orphans))
+        self.assertTrue(self.other_month.exists())
+
+        self.gc('--since', '2025/02')
+        self.assertFalse(self.other_month.exists())
+
+    def test_grace_days_and_quarantine(self):
+        # 宽限期为 0 时刚上传的孤儿文件也回收；--quarantine 移动到隔离目录而不是删除
+        self.gc('--grace-days', '0', '--quarantine')
+        self.assertTrue(all(path.exists() for path in self.kept[:2]))
+        self.assertFalse(self.kept[2].exists())
+        quarantined = sorted(path.relative_to(self.quarantine_dir).as_posix()
+                             for path in self.quarantine_dir.rglob('*') if path.is_file())
+        expected = sorted(path.relative_to(self.media_root).as_posix()
+                          for path in [self.kept[2], self.other_month] + self.orphans)
+        self.assertEqual(expected, quarantined)
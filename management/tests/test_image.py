@@ -0,0 +1,62 @@
+import os
+import tempfile
+from unittest import mock
+from django.conf import settings
+from django.core.cache import caches
+from common.storage import LocalStorage
+from ..services.image_service import ImageService
+from .base import ManagementTestCase
+
+
+class RemoteStorage(LocalStorage):
+    """没有本地路径的存储后端（与远程存储相同）"""
+
+    def local_path(self, key: str):
+        return None
+
+
+class ImageVariantTest(ManagementTestCase):
+    """缩略图衍生图 URL（ImageService）"""
+
+    def setUp(self):
+        super().setUp()
+        ImageService._ready.clear()
+        ImageService._missing.clear()
+
+    def test_variant_url(self):
+        # 登记后直接返回衍生图；登记丢失（重启、缓存淘汰）后检查本地文件并重新登记
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = LocalStorage({'LOCATION': temp_dir, 'BASE_URL': '/media/'})
+            url = storage.url('2025/01/avatar.png')
+            thumb_url = storage.url('2025/01/avatar_thumb.webp')
+            with mock.patch('management.services.image_service.get_storage', return_value=storage), \
+                    mock.patch.object(LocalStorage, 'exists', side_effect=AssertionError):
+                self.assertEqual(url, ImageService.getVariantUrl(url))
+                ImageService._mark_ready('2025/01/avatar_thumb.webp')
+                self.assertEqual(thumb_url, ImageService.getVariantUrl(url))
+
+                # 重启或缓存淘汰：登记丢失
+                ImageService._ready.clear()
+                caches[settings.IMAGE_VARIANT_CACHE_ALIAS].clear()
+                self.assertEqual(url, ImageService.getVariantUrl(url))
+                os.makedirs(f"{temp_dir}/2025/01")
+                open(f"{temp_dir}/2025/01/avatar_thumb.webp", 'wb').close()
+                ImageService._missing.clear()
+                self.assertEqual(thumb_url, ImageService.getVariantUrl(url))
+                ImageService._ready.clear()
+                self.assertEqual(thumb_url, ImageService.getVariantUrl(url))
+
+    def test_remote_variant_url(self):
+        # 远程存储：登记丢失后在后台线程检查，序列化时不访问存储后端
+        storage = RemoteStorage({'LOCATION': '/nonexistent', 'BASE_URL': '/media/'})
+        url = storage.url('2025/01/avatar.png')
+        with mock.patch('management.services.image_service.get_storage', return_value=storage), \
+                mock.patch.object(RemoteStorage, 'exists', return_value=True) as exists, \
+                mock.patch.object(ImageService, '_get_executor') as executor:
+            self.assertEqual(url, ImageService.getVariantUrl(url))
+            exists.assert_not_called()
+            task, *args = executor.return_value.submit.call_args[0]
+            task(*args)
+            exists.assert_called_once_with('2025/01/avatar_thumb.webp')
+            self.assertEqual(storage.url('2025/01/avatar_thumb.webp'), ImageService.getVariantUrl(url))
+
@@ -0,0 +1,96 @@
+import warnings
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from common.exceptions import BusinessException
+from common.result import Result
+from ..models import Clazz, Dept, Emp, Student
+from ..serializers import (
+    ClazzPageProjection, ClazzPageSerializer, ClazzProjection, ClazzSerializer,
+    DeptProjection, DeptSerializer, EmpProjection, EmpSerializer,
+)
+from ..serializers.student import StudentPageProjection, StudentPageSerializer
+from .base import ManagementTestCase
+
+
+class ProjectionParityTest(ManagementTestCase):
+    """列表快速输出路径（ProjectionSerializer）与 ModelSerializer 的一致性测试，两者渲染后的 JSON 必须逐字节一致"""
+
+    def assertParity(self, serializer_class, projection_class, queryset):
+        expected = CamelCaseJSONRenderer().render(serializer_class(queryset, many=True).data)
+        actual = CamelCaseJSONRenderer().render(projection_class(queryset).data)
+        self.assertEqual(expected, actual)
+
+    def test_dept(self):
+        self.assertParity(DeptSerializer, DeptProjection, Dept.objects.order_by('-update_time'))
+
+    def test_emp(self):
+        self.assertParity(EmpSerializer, EmpProjection, Emp.objects.order_by('-update_time'))
+        # 分页切片
+        self.assertParity(EmpSerializer, EmpProjection, Emp.objects.order_by('-update_time')[1:2])
+
+    def test_clazz(self):
+        queryset = Clazz.objects.order_by('-update_time')
+        self.assertParity(ClazzSerializer, ClazzProjection, queryset)
+        self.assertParity(ClazzPageSerializer, ClazzPageProjection, queryset)
+
+    def test_student(self):
+        self.assertParity(StudentPageSerializer, StudentPageProjection, Student.objects.order_by('-update_time'))
+
+    def test_sparse_fields(self):
+        fields = EmpProjection.parse_fields('name,deptName,id,image_thumb')
+        self.assertEqual(fields, ['id', 'name', 'image_thumb', 'dept_name'])
+        expected = CamelCaseJSONRenderer().render(EmpSerializer(Emp.objects.order_by('-update_time'), many=True,
+                                                                fields=fields).data)
+        actual = CamelCaseJSONRenderer().render(EmpProjection(Emp.objects.order_by('-update_time'), fields).data)
+        self.assertEqual(expected, actual)
+        # 只查询请求的列及计算字段依赖的列
+        with self.assertNumQueries(1) as context:
+            EmpProjection(Emp.objects.all(), ['id', 'name']).data
+        self.assertNotIn('dept_id', context.captured_queries[0]['sql'])
+        with self.assertRaises(BusinessException):
+            EmpProjection.parse_fields('id,password')
+
+
+class StreamingResponseTest(ManagementTestCase):
+    """大列表流式输出（common.streaming）"""
+
+    @override_settings(STREAMING_RESPONSE={'THRESHOLD': 0, 'CHUNK_SIZE': 1, 'BUFFER_SIZE': 1})
+    def test_stream(self):
+        # 流式输出与普通响应逐字节一致（逐行分块查询）
+        queryset = Emp.objects.order_by('-update_time')
+        for total in (None, 2):
+            data = EmpProjection(queryset).data
+            expected = CamelCaseJSONRenderer().render(
+                {'code': 1, 'msg': 'success', 'data': data if total is None else {'total': total, 'rows': data}})
+            response = Result.stream(EmpProjection(queryset).stream(), total=total)
+            self.assertTrue(response.streaming)
+            self.assertEqual(expected, b''.join(response.streaming_content))
+        # ASGI 下逐块输出，不先读完整个响应体（Django 对同步迭代器会告警并整体读入）
+        response = Result.stream(EmpProjection(queryset).stream())
+
+        async def consume():
+            return [part async for part in response]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            parts = async_to_sync(consume)()
+        self.assertGreater(len(parts), 1)
+        self.assertEqual(CamelCaseJSONRenderer().render({'code': 1, 'msg': 'success', 'data': data}), b''.join(parts))
+
+    def test_keyset_batches(self):
+        # 按键集分批查询（每批一条 LIMIT 查询），相同或为空的 update_time 也不重复、不遗漏，顺序与原查询集一致
+        same = Emp.objects.get(username='zhangsan').update_time
+        for index in range(5):
+            Emp.objects.create(username=f"emp{index}", name=f"员工{index}", gender=1, phone=f"1390000000{index}",
+                               update_time=None if index % 2 else same)
+        for queryset in (Emp.objects.order_by('-update_time', '-id'), Emp.objects.order_by('update_time', 'id'),
+                         Emp.objects.order_by('-update_time', 'id')[1:6], Emp.objects.order_by('name')[5:]):
+            expected = EmpProjection(queryset, ['id', 'name']).data
+            with self.assertNumQueries(len(expected) // 2 + 1) as context:
+                rows = list(EmpProjection(queryset, ['id', 'name']).stream(chunk_size=2))
+            self.assertEqual(expected, rows)
+            self.assertTrue(all('LIMIT' in query['sql'] for query in context.captured_queries))
+        # 排序列有重复值时末尾补 id，每行只输出一次
+        rows = list(EmpProjection(Emp.objects.order_by('-update_time'), ['id']).stream(chunk_size=2))
+        self.assertEqual(sorted(Emp.objects.values_list('id', flat=True)), sorted(row['id'] for row in rows))
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from decimal import Decimal
+from io import BytesIO
+from django.test import override_settings
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.exceptions import ParseError
+from common import parsers, renderers
+from .base import ManagementTestCase
+
+
+class RendererTest(ManagementTestCase):
+    """驼峰 JSON 渲染器 / 解析器（common.renderers、common.parsers）"""
+
+    def test_renderer(self):
+        # 与原驼峰渲染器逐字节一致（json / orjson 两种引擎），date / datetime 按配置格式输出
+        data = {'code': 1, 'data': [{'user_name': '张三', 'image_2x': None, 'salary': Decimal('1.50'),
+                                     'tags': ('a\u2028b', 2.5, True), 'nested': {1: 'x', 'is_ok': False}}]}
+        expected = CamelCaseJSONRenderer().render(data)
+        for engine in ('json', 'auto'):
+            with override_settings(JSON_RENDERER={'ENGINE': engine, 'KEY_CACHE_SIZE': 2}):
+                self.assertEqual(expected, renderers.CamelCaseJSONRenderer().render(data))
+                content = renderers.CamelCaseJSONRenderer().render(
+                    {'update_time': datetime(2024, 3, 5, 8, 9, 7), 'entry_date': date(2024, 3, 5)})
+                self.assertEqual(b'{"updateTime":"2024-03-05 08:09:07","entryDate":"2024-03-05"}', content)
+                parser = parsers.JSONParser()
+                self.assertEqual({'idCard': '1'}, parser.parse(BytesIO('{"idCard": "1"}'.encode())))
+                with self.assertRaises(ParseError):
+                    parser.parse(BytesIO(b'{"idCard":'))
+                # NaN / Infinity 与标准库一致报错，不输出 null
+                for value in (float('nan'), float('inf'), Decimal('NaN'), [float('-inf')]):
+                    with self.assertRaises(ValueError):
+                        renderers.CamelCaseJSONRenderer().render({'value': value})
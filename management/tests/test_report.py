@@ -0,0 +1,190 @@
+from datetime import date
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError
+from django.test import override_settings
+from common.exceptions import BusinessException
+from ..models import Clazz, Emp, Student
+from ..services.report_service import ReportService
+from ..services.report_stats_service import ReportStatsService
+from .base import ManagementTestCase
+
+
+class SalaryReportTest(ManagementTestCase):
+    """员工薪资分布统计"""
+
+    def test_salary_cache_ttl(self):
+        # 其他进程的薪资变更（不触发本进程的信号）在缓存过期后生效
+        ReportService._salary_cache = {}
+        expected = ReportService.getEmpSalaryData()
+        Emp.objects.filter(username='zhangsan').update(salary=9000)
+        self.assertEqual(expected, ReportService.getEmpSalaryData())
+        with override_settings(CUBE_SNAPSHOT_TTL=-1):
+            self.assertNotEqual(expected, ReportService.getEmpSalaryData())
+
+
+class ReportStatsTest(ManagementTestCase):
+    """报表计数器的增量维护与对账（ReportStatsService）"""
+
+    def test_reconcile_with_changes(self):
+        # 对账期间的写操作：查询开始前提交的已在结果中（不重放），之后提交的重放
+        group_queries = ReportStatsService._groupQueries
+
+        def create(username, gender):
+            Emp.objects.create(username=username, name=username, gender=gender, phone=username)
+            ReportStatsService.applyChange(Emp, [], [{'gender': gender, 'job': None, 'entry_date': None}])
+
+        def interleaved():
+            for dimension, queryset, key in group_queries():
+                if dimension == 'empGender':
+                    create('before', 2)
+                yield dimension, queryset, key
+                if dimension == 'empGender':
+                    create('after', 1)
+
+        with mock.patch.object(ReportStatsService, '_groupQueries', interleaved):
+            ReportStatsService.reconcile()
+        counts = {dimension: ReportStatsService.getCounts(dimension) for dimension in ReportStatsService.DIMENSIONS}
+        ReportStatsService.reconcile()
+        self.assertEqual(counts, {dimension: ReportStatsService.getCounts(dimension)
+                                  for dimension in ReportStatsService.DIMENSIONS})
+
+    def test_read_only(self):
+        # 首次读取时建立计数器并启动后台对账线程，之后的读取不查询数据库
+        with mock.patch.object(ReportStatsService, '_counters', {}), \
+                mock.patch.object(ReportStatsService, '_timer', None), \
+                mock.patch.object(ReportStatsService, '_run_timer') as run_timer:
+            counts = ReportStatsService.getCounts('empGender')
+            ReportStatsService._timer.join()
+            run_timer.assert_called_once_with(300)
+            with self.assertNumQueries(0):
+                self.assertEqual(counts, ReportStatsService.getCounts('empGender'))
+                ReportStatsService._start_timer()
+            run_timer.assert_called_once()
+
+    def test_background_reconcile(self):
+        # 后台线程每个周期对账一次，对账失败不退出
+        class Stop(BaseException):
+            pass
+
+        with mock.patch('management.services.report_stats_service.time.sleep', side_effect=[None, None, Stop]), \
+                mock.patch('management.services.report_stats_service.close_old_connections'), \
+                mock.patch.object(ReportStatsService, 'reconcile', side_effect=[DatabaseError, None]) as reconcile:
+            with self.assertRaises(Stop):
+                ReportStatsService._run_timer(300)
+        self.assertEqual(2, reconcile.call_count)
+
+
+class StudentCountReportTest(ManagementTestCase):
+    """班级人数统计"""
+
+    def test_student_count_order(self):
+        # 倒序时同人数的班级仍按 ID 升序（已删除班级 999 排在最后）
+        ids = Clazz.objects.order_by('id').values_list('id', flat=True)
+        Student.objects.bulk_create([Student(name=f"学生{id}", no=f"no{id}", phone=f"phone{id}", clazz_id=id)
+                                     for id in ids])
+        ReportStatsService.reconcile()
+        result = ReportService.getStudentCountData({'orderBy': 'count', 'order': 'desc', 'includeEmpty': 'true'})
+        self.assertEqual(['JavaEE 就业 100 期', '未开班', '已结课', '已删除班级(999)'], result['clazzList'])
+        self.assertEqual([2, 1, 1, 1], result['dataList'])
+
+
+class ViolationRankTest(ManagementTestCase):
+    """学员违纪排行（竞争排名 + 游标分页）"""
+
+    def setUp(self):
+        super().setUp()
+        clazz_id = Clazz.objects.get(name='JavaEE 就业 100 期').id
+        rows = [('A', 9, 3, clazz_id), ('B', 5, 2, clazz_id), ('C', 5, 2, clazz_id), ('D', 5, 1, clazz_id),
+                ('E', 2, 1, clazz_id), ('F', 5, 2, 999), ('G', 0, 0, clazz_id)]
+        Student.objects.bulk_create([Student(name=name, no=f"no{name}", phone=f"phone{name}", clazz_id=clazz,
+                                             violation_score=score, violation_count=count)
+                                     for name, score, count, clazz in rows])
+        self.clazz_id = clazz_id
+
+    def expected(self, clazz_id=None) -> list:
+        """按 (扣分, 次数, ID) 倒序逐行计算竞争排名 - [(名次, 姓名), ...]"""
+        students = Student.objects.filter(violation_count__gt=0)
+        if clazz_id is not None:
+            students = students.filter(clazz_id=clazz_id)
+        students = sorted(students, key=lambda s: (s.violation_score, s.violation_count, s.id), reverse=True)
+        result, previous = [], None
+        for index, student in enumerate(students):
+            key = (student.violation_score, student.violation_count)
+            rank = result[-1][0] if key == previous else index + 1
+            result.append((rank, student.name))
+            previous = key
+        return result
+
+    def pages(self, rank, **params) -> list:
+        """按 nextCursor 翻完所有页 - 返回 [(名次, 姓名), ...]"""
+        rows, cursor = [], None
+        while True:
+            page = rank({**params, 'pageSize': 2, **({'cursor': cursor} if cursor else {})})
+            self.assertLessEqual(len(page['rows']), 2)
+            rows += [(row['rank'], row['name']) for row in page['rows']]
+            cursor = page['nextCursor']
+            if cursor is None:
+                return rows
+
+    def test_rank_across_pages(self):
+        # 并列名次跨页时仍为同一名次，下一个分数的名次跳过并列人数；没有违纪记录的学员不参与排行
+        expected = self.expected()
+        self.assertEqual([1, 2, 2, 2, 2, 6, 7], [rank for rank, _ in expected])
+        self.assertEqual(expected, self.pages(ReportService.getStudentViolationRank))
+        self.assertEqual(expected, self.pages(async_to_sync(ReportService.agetStudentViolationRank)))
+
+    def test_rank_in_clazz(self):
+        # 班级内排行只统计本班学员
+        expected = self.expected(self.clazz_id)
+        self.assertEqual([1, 2, 2, 2, 5, 6], [rank for rank, _ in expected])
+        self.assertEqual(expected, self.pages(ReportService.getStudentViolationRank, clazzId=str(self.clazz_id)))
+
+    def test_invalid_params(self):
+        for params in ({'pageSize': '0'}, {'pageSize': '101'}, {'cursor': '5,2'}, {'clazzId': 'x'}):
+            with self.assertRaises(BusinessException):
+                ReportService.getStudentViolationRank(params)
+        self.assertEqual({'rows': [], 'nextCursor': None}, ReportService.getStudentViolationRank({'clazzId': '999999'}))
+
+
+class TimeSeriesReportTest(ManagementTestCase):
+    """按月度计数器生成的时间序列（入职人数趋势）"""
+
+    def setUp(self):
+        super().setUp()
+        Emp.objects.bulk_create([Emp(username=f"entry{index}", name=f"entry{index}", gender=1, phone=f"entry{index}",
+                                     entry_date=entry_date)
+                                 for index, entry_date in enumerate([date(2019, 12, 31), date(2020, 1, 31),
+                                                                     date(2020, 12, 1), date(2021, 6, 15)])])
+        ReportStatsService.reconcile()
+
+    def test_month_buckets(self):
+        # 按月：首尾月份都包含，没有数据的月份为 0；日期可带日
+        result = ReportService.getEmpEntryData({'begin': '2019-12-31', 'end': '2020-02'})
+        self.assertEqual({'dateList': ['2019-12', '2020-01', '2020-02'], 'dataList': [1, 2, 0]}, result)
+        result = ReportService.getEmpEntryData({'begin': '2020-01', 'end': '2020-01-01'})
+        self.assertEqual({'dateList': ['2020-01'], 'dataList': [2]}, result)
+
+    def test_year_buckets(self):
+        # 按年：范围扩展为整年，月度计数累加到所在年份
+        result = ReportService.getEmpEntryData({'begin': '2019-06', 'end': '2021-02', 'granularity': 'year'})
+        self.assertEqual({'dateList': ['2019', '2020', '2021'], 'dataList': [1, 3, 1]}, result)
+        result = ReportService.getEmpEntryData({'begin': '2020-12', 'end': '2020-01', 'granularity': 'year'})
+        self.assertEqual({'dateList': ['2020'], 'dataList': [3]}, result)
+
+    def test_default_range(self):
+        # 默认最近 12 个月（按月）/ 最近 5 年（按年），到当月 / 当年为止
+        today = date.today()
+        dateList = ReportService.getEmpEntryData()['dateList']
+        self.assertEqual(12, len(dateList))
+        self.assertEqual(f"{today.year:04d}-{today.month:02d}", dateList[-1])
+        dateList = ReportService.getEmpEntryData({'granularity': 'year'})['dateList']
+        self.assertEqual([str(year) for year in range(today.year - 4, today.year + 1)], dateList)
+        dateList = ReportService.getEmpEntryData({'end': '2020-03'})['dateList']
+        self.assertEqual(['2019-04', '2020-03'], [dateList[0], dateList[-1]])
+
+    def test_invalid_range(self):
+        for params in ({'begin': '2020-02', 'end': '2020-01'}, {'begin': '2020/01'}, {'granularity': 'week'},
+                       {'begin': '1000-01', 'end': '2200-01'}):
+            with self.assertRaises(BusinessException):
+                ReportService.getEmpEntryData(params)
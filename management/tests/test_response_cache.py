@@ -0,0 +1,40 @@
+from unittest import mock
+from django.test import RequestFactory
+from rest_framework.views import APIView
+from common import response_cache
+from common.result import Result
+from .base import ManagementTestCase
+
+
+class ResponseCacheTest(ManagementTestCase):
+    """响应缓存（common.response_cache）"""
+
+    def test_response_cache_refresh(self):
+        # 过期后返回旧数据并后台刷新（使用新构造的请求，沿用路径、查询参数和认证信息），标签失效后同步重新计算
+        calls, sent = [], []
+
+        class View(APIView):
+            @response_cache.cache_response(ttl=0, tags=('test',), stale_ttl=60)
+            def get(self, request):
+                calls.append(request._request)
+                return Result.success({'call': len(calls), 'q': request.query_params['q'], 'empId': request.emp_id})
+
+        def get():
+            request = RequestFactory().get('/cached', {'q': '张'})
+            request.emp_id = 1
+            sent.append(request)
+            return View.as_view()(request).data['data']
+
+        with mock.patch.object(response_cache, '_get_executor') as executor:
+            self.assertEqual({'call': 1, 'q': '张', 'empId': 1}, get())
+            executor.return_value.submit.assert_not_called()
+            self.assertEqual(1, get()['call'])
+            refresh = executor.return_value.submit.call_args[0][0]
+            with mock.patch.object(response_cache, 'connections'):
+                refresh()
+            self.assertEqual({'call': 2, 'q': '张', 'empId': 1}, get())
+            self.assertIsNot(sent[1], calls[1])
+            self.assertEqual(sent[1].get_full_path(), calls[1].get_full_path())
+            self.assertEqual(2, executor.return_value.submit.call_count)
+            response_cache.invalidate_tags('test')
+            self.assertEqual(3, get()['call'])
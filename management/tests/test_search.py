@@ -0,0 +1,35 @@
+from unittest import mock
+from ..models import Emp
+from ..services.search_service import SearchService
+from ..signals import notify_change, snapshot
+from .base import ManagementTestCase
+
+
+class SearchSuggestTest(ManagementTestCase):
+    """输入联想（SearchService）"""
+
+    def test_search_suggest(self):
+        # 前缀、学号、拼音全拼 / 首字母检索；首次构建在全局锁外执行，构建期间的变更在构建完成后重放
+        build = SearchService._build
+
+        def building(resource):
+            self.assertFalse(SearchService._lock.locked())
+            index = build(resource)
+            if resource == 'emp':
+                emp = Emp.objects.create(username='wangxiaowu', name='王小五', gender=1, phone='13800000003')
+                with self.captureOnCommitCallbacks(execute=True):
+                    notify_change(Emp, 'create', after=snapshot(Emp.objects.filter(id=emp.id)))
+            return index
+
+        SearchService._indexes.clear()
+        with mock.patch.object(SearchService, '_build', building):
+            self.assertEqual(['张三'], [row['name'] for row in SearchService.suggest({'q': 'zs', 'type': 'emp'})])
+        self.assertEqual({}, SearchService._pending)
+        suggest = lambda q, **params: [(row['type'], row['name']) for row in SearchService.suggest({'q': q, **params})]
+        self.assertEqual([('emp', '张三')], suggest('zhang'))
+        self.assertEqual([('emp', '王小五'), ('student', '王五')], suggest('wang'))
+        self.assertEqual([('emp', '王小五')], suggest('wxw'))
+        self.assertEqual([('student', '王五'), ('student', '赵六')], suggest('2024', type='student'))
+        self.assertEqual([('student', '王五')], suggest('2024', type='student', limit='1'))
+        self.assertEqual([('clazz', 'JavaEE 就业 100 期')], suggest('JAVA'))
+        self.assertEqual([], suggest('java', type='emp'))
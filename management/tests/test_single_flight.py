@@ -0,0 +1,133 @@
+import threading
+import time
+from unittest import mock
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.response import Response
+from common import single_flight as single_flight_module
+from common.exceptions import BusinessException
+from common.single_flight import SingleFlight, single_flight
+
+
+class SingleFlightTest(SimpleTestCase):
+    """请求合并（common.single_flight）"""
+
+    def run_with_waiter(self, group, name, leader_fn, waiter_fn):
+        """leader 在线程中执行 leader_fn（等待 release 后返回），waiter 进入等待后放行，返回 (leader 结果, waiter 结果)"""
+        release = threading.Event()
+        results = {}
+
+        def leader():
+            try:
+                results['leader'] = leader_fn(release)
+            except Exception as e:
+                results['leader'] = e
+
+        thread = threading.Thread(target=leader)
+        thread.start()
+        while group.stats().get(name, {}).get('executions') != 1:
+            time.sleep(0.001)
+
+        def waiter():
+            try:
+                results['waiter'] = waiter_fn()
+            except Exception as e:
+                results['waiter'] = e
+
+        waiter_thread = threading.Thread(target=waiter)
+        waiter_thread.start()
+        while group.stats()[name]['waiting'] != 1:
+            time.sleep(0.001)
+        release.set()
+        thread.join()
+        waiter_thread.join()
+        return results['leader'], results['waiter']
+
+    def test_merge(self):
+        # 相同 key 的并发执行只执行一次，waiter 共享 leader 的结果；执行结束后的新请求重新执行
+        group = SingleFlight()
+        calls = []
+
+        def work(release):
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        leader, waiter = self.run_with_waiter(
+            group, 'k', lambda release: group.do('k', lambda: work(release)), lambda: group.do('k', None))
+        self.assertEqual(('result', False), leader)
+        self.assertEqual(('result', True), waiter)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(('again', False), group.do('k', lambda: 'again'))
+        self.assertEqual({'calls': 3, 'executions': 2, 'waiters': 1, 'waiting': 0, 'maxWaiters': 1, 'timeouts': 0},
+                         group.stats()['k'])
+
+    def test_wait_timeout(self):
+        # 等待超时的 waiter 自行执行，不共享结果
+        group = SingleFlight()
+        release = threading.Event()
+        thread = threading.Thread(target=group.do, args=('k', release.wait))
+        thread.start()
+        while group.stats().get('k', {}).get('executions') != 1:
+            time.sleep(0.001)
+        self.assertEqual(('self', False), group.do('k', lambda: 'self', timeout=0.01))
+        release.set()
+        thread.join()
+        self.assertEqual(1, group.stats()['k']['timeouts'])
+        self.assertEqual(0, group.stats()['k']['waiting'])
+
+    def test_merge_key(self):
+        # 查询参数顺序不影响合并，参数值或权限范围不同的请求分别执行
+        group = SingleFlight()
+        keys = []
+
+        class View:
+            @single_flight(scope=lambda request: request.query_params.get('scope', ''))
+            def get(self, request):
+                return Response({})
+
+        def record(key, fn, **kwargs):
+            keys.append(key)
+            return group.do(key, fn, **kwargs)
+
+        with mock.patch.object(single_flight_module._group, 'do', side_effect=record):
+            for query in ({'a': 1, 'b': 2}, {'b': 2, 'a': 1}, {'a': 2, 'b': 2}, {'a': 1, 'b': 2, 'scope': 'x'}):
+                View().get(Request(RequestFactory().get('/report/x', query)))
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(3, len(set(keys)))
+
+    def test_error_copy(self):
+        # waiter 收到异常的副本（类型和消息相同，__cause__ 为 leader 的异常），不与 leader 共享同一个异常对象
+        group = SingleFlight()
+
+        def fail(release):
+            release.wait()
+            raise BusinessException("报表不存在")
+
+        leader_error, waiter_error = self.run_with_waiter(
+            group, 'k', lambda release: group.do('k', lambda: fail(release)), lambda: group.do('k', None))
+        self.assertIsInstance(waiter_error, BusinessException)
+        self.assertIsNot(leader_error, waiter_error)
+        self.assertEqual(leader_error.message, waiter_error.message)
+        self.assertIs(leader_error, waiter_error.__cause__)
+
+    def test_shared_response_headers(self):
+        # waiter 重建的响应保留 leader 的响应头（如 ETag、Cache-Control）
+        group = SingleFlight()
+
+        class View:
+            @single_flight
+            def get(self, request, release=None):
+                release.wait()
+                return Response({'value': 1}, headers={'ETag': '"v1"', 'Cache-Control': 'no-cache'})
+
+        def request():
+            return Request(RequestFactory().get('/report/x', {'b': 2, 'a': 1}))
+
+        with mock.patch.object(single_flight_module, '_group', group):
+            leader, waiter = self.run_with_waiter(group, '/report/x', lambda release: View().get(request(), release),
+                                                  lambda: View().get(request()))
+        self.assertIsNot(leader, waiter)
+        self.assertEqual({'value': 1}, waiter.data)
+        self.assertEqual('"v1"', waiter['ETag'])
+        self.assertEqual('no-cache', waiter['Cache-Control'])
@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from common.storage.s3 import S3Storage
+from ..services.upload_service import UploadService
+from .base import ManagementTestCase
+
+S3_OPTIONS = {
+    'ENDPOINT_URL': 'http://minio:9000', 'BUCKET': 'tlias', 'ACCESS_KEY': 'minioadmin', 'SECRET_KEY': 'minioadmin',
+}
+
+
+class S3StorageTest(ManagementTestCase):
+    """S3 兼容对象存储（common.storage.s3），S3 接口由 botocore Stubber 模拟"""
+
+    def setUp(self):
+        super().setUp()
+        self.storage = S3Storage(S3_OPTIONS)
+        self.stubber = Stubber(self.storage.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+        # 记录 PutObject 的请求参数（Body 以外）
+        self.puts = []
+        self.storage.client.meta.events.register(
+            'before-parameter-build.s3.PutObject',
+            lambda params, **kwargs: self.puts.append({k: v for k, v in params.items() if k != 'Body'}))
+
+    def test_storage(self):
+        # save / save_file 按扩展名设置 Content-Type；exists 区分 404 和其他错误；url 为 PUBLIC_URL + key
+        self.stubber.add_response('put_object', {})
+        self.stubber.add_response('put_object', {})
+        self.stubber.add_response('head_object', {}, {'Bucket': 'tlias', 'Key': '2025/01/a.png'})
+        self.stubber.add_client_error('head_object', service_error_code='404', http_status_code=404)
+        self.stubber.add_client_error('head_object', service_error_code='403', http_status_code=403)
+        self.stubber.add_response('delete_object', {}, {'Bucket': 'tlias', 'Key': '2025/01/a.png'})
+
+        url = self.storage.save('2025/01/a.png', io.BytesIO(b'png'))
+        self.assertEqual('http://minio:9000/tlias/2025/01/a.png', url)
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(b'txt')
+            file.flush()
+            self.assertEqual('http://minio:9000/tlias/2025/01/b.txt', self.storage.save_file('2025/01/b.txt', file.name))
+        self.assertEqual([('2025/01/a.png', 'image/png'), ('2025/01/b.txt', 'text/plain')],
+                         [(put['Key'], put['ContentType']) for put in self.puts])
+        self.assertTrue(all(put['Bucket'] == 'tlias' for put in self.puts))
+        self.assertTrue(self.storage.exists('2025/01/a.png'))
+        self.assertFalse(self.storage.exists('2025/01/c.png'))
+        with self.assertRaises(ClientError):
+            self.storage.exists('2025/01/d.png')
+        self.storage.delete('2025/01/a.png')
+        self.stubber.assert_no_pending_responses()
+
+        self.assertEqual('2025/01/a.png', self.storage.key_from_url(url))
+        self.assertIsNone(self.storage.key_from_url('https://example.com/a.png'))
+        self.assertIsNone(self.storage.local_path('2025/01/a.png'))
+        storage = S3Storage({**S3_OPTIONS, 'PUBLIC_URL': 'https://cdn.example.com/'})
+        self.assertEqual('https://cdn.example.com/2025/01/a.png', storage.url('2025/01/a.png'))
+
+    def test_async_upload(self):
+        # 异步上传：请求立即返回最终 URL，后台线程上传暂存文件后删除
+        self.stubber.add_response('put_object', {})
+        executor = ThreadPoolExecutor(max_workers=1)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                override_settings(UPLOAD_STAGING_DIR=temp_dir, STORAGE={'BACKEND': 's3', 'ASYNC_UPLOAD': True}), \
+                mock.patch('management.services.upload_service.get_storage', return_value=self.storage), \
+                mock.patch.object(UploadService, '_get_async_executor', return_value=executor):
+            url = UploadService.upload(SimpleUploadedFile('a.txt', b'abc'))
+            executor.shutdown(wait=True)
+            self.assertEqual([], os.listdir(temp_dir))
+        key = self.storage.key_from_url(url)
+        self.assertRegex(key, r'^\d{4}/\d{2}/[0-9a-f-]{36}\.txt$')
+        self.assertEqual([key], [put['Key'] for put in self.puts])
+        self.stubber.assert_no_pending_responses()
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.test import override_settings
+from ..models import Dept, SyncTombstone
+from ..services.sync_service import SyncService
+from .base import ManagementTestCase
+
+
+class SyncTest(ManagementTestCase):
+    """增量同步（SyncService）"""
+
+    def test_sync(self):
+        # 逐条翻页不遗漏：update_time 为空的行按 create_time（都为空时最早）、同一时间的修改和删除按类型、ID 排序
+        def sync(cursor, pageSize=1):
+            rows, deleted = [], []
+            while True:
+                result = SyncService.changes('depts', {'cursor': cursor, 'pageSize': pageSize})
+                rows += [dept.id for dept in result['rows']]
+                deleted += result['deleted']
+                cursor = result['nextCursor']
+                if not result['hasMore']:
+                    return rows, deleted, cursor
+
+        first, second = Dept.objects.order_by('id')
+        with override_settings(SYNC={**settings.SYNC, 'TOMBSTONE_RETENTION_DAYS': 36500}):
+            rows, deleted, cursor = sync(None)
+            self.assertEqual(([second.id, first.id], []), (rows, deleted))
+            self.assertEqual(first.update_time - timedelta(seconds=5), datetime.fromisoformat(cursor.split(',')[0]))
+
+            now = datetime.now().replace(microsecond=0)
+            Dept.objects.filter(id=first.id).update(update_time=now)
+            SyncTombstone.objects.bulk_create([SyncTombstone(resource='dept', row_id=row_id, delete_time=now)
+                                               for row_id in (second.id, 999)])
+            self.assertEqual(([first.id], [second.id, 999]), sync(cursor)[:2])
+            # 最后一页的游标回退重叠窗口，重复返回最近的变更
+            self.assertEqual(([first.id], [second.id, 999]), sync(sync(cursor, pageSize=100)[2])[:2])
+
+        # 游标早于删除记录保留期：要求重新全量同步；清除过期的删除记录
+        result = SyncService.changes('depts', {'cursor': cursor})
+        self.assertTrue(result['resyncRequired'])
+        self.assertEqual([], result['deleted'])
+        self.assertFalse(SyncService.changes('depts', {'since': str(now)})['resyncRequired'])
+        SyncTombstone.objects.filter(row_id=999).update(delete_time=datetime(2000, 1, 1))
+        self.assertEqual(1, SyncService.purgeTombstones(dry_run=True))
+        self.assertEqual(1, SyncService.purgeTombstones())
+        self.assertEqual([second.id], list(SyncTombstone.objects.values_list('row_id', flat=True)))
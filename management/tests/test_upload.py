@@ -0,0 +1,93 @@
+import hashlib
+import tempfile
+import uuid
+from io import BytesIO
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, override_settings
+from common.exceptions import BusinessException
+from common.storage import get_storage
+from ..services.chunk_upload_service import ChunkUploadService
+from ..services.upload_service import UploadService
+from ..views.upload_views import BatchUploadView
+from .base import ManagementTestCase
+
+
+class ChunkUploadTest(ManagementTestCase):
+    """分片上传（ChunkUploadService）"""
+
+    def test_chunk_upload(self):
+        # 续传、分片校验、整体校验失败和发布失败都保留已上传的数据
+        content = b'0123456789'
+        with tempfile.TemporaryDirectory() as temp_dir, override_settings(
+                UPLOAD_CHUNK_TEMP_DIR=f"{temp_dir}/chunks", UPLOAD_STAGING_DIR=f"{temp_dir}/staging"):
+            upload_id = ChunkUploadService.init({'fileName': 'a.txt', 'fileSize': 10, 'chunkSize': 4,
+                                                 'fileMd5': hashlib.md5(content).hexdigest()})['uploadId']
+            ChunkUploadService.uploadChunk(upload_id, 0, BytesIO(content[:4]), 4)
+            self.assertEqual(4, ChunkUploadService.uploadChunk(upload_id, 0, BytesIO(content[:4]), 4)['offset'])
+            with self.assertRaises(BusinessException):
+                ChunkUploadService.uploadChunk(upload_id, 1, BytesIO(content[4:8]), 4, md5='0' * 32)
+            self.assertEqual(4, ChunkUploadService.status(upload_id)['offset'])
+            ChunkUploadService.uploadChunk(upload_id, 1, BytesIO(content[4:8]), 4)
+            ChunkUploadService.uploadChunk(upload_id, 2, BytesIO(content[8:]), 2)
+
+            with mock.patch.object(UploadService, 'publishFile', side_effect=OSError):
+                with self.assertRaises(OSError):
+                    ChunkUploadService.complete(upload_id)
+            self.assertEqual(10, ChunkUploadService.status(upload_id)['offset'])
+            with mock.patch.object(UploadService, 'publishFile', return_value='/media/a.txt') as publish:
+                self.assertEqual('/media/a.txt', ChunkUploadService.complete(upload_id))
+            with open(publish.call_args[0][0], 'rb') as published:
+                self.assertEqual(content, published.read())
+            with self.assertRaises(BusinessException):
+                ChunkUploadService.status(upload_id)
+
+            upload_id = ChunkUploadService.init({'fileName': 'b.txt', 'fileSize': 2, 'fileMd5': '0' * 32})['uploadId']
+            ChunkUploadService.uploadChunk(upload_id, 0, BytesIO(b'ab'), 2)
+            with self.assertRaises(BusinessException):
+                ChunkUploadService.complete(upload_id)
+            self.assertEqual(2, ChunkUploadService.status(upload_id)['offset'])
+
+    def test_session_lock(self):
+        # 不同写法的 uploadId 共用同一把锁；会话不存在、取消和过期回收时都释放锁
+        ChunkUploadService._locks.clear()
+        with tempfile.TemporaryDirectory() as temp_dir, override_settings(
+                UPLOAD_CHUNK_TEMP_DIR=f"{temp_dir}/chunks", UPLOAD_STAGING_DIR=f"{temp_dir}/staging"):
+            upload_id = ChunkUploadService.init({'fileName': 'a.txt', 'fileSize': 4, 'chunkSize': 2})['uploadId']
+            dashed = str(uuid.UUID(upload_id)).upper()
+            self.assertIs(ChunkUploadService._lock_for(ChunkUploadService._session_dir(upload_id)),
+                          ChunkUploadService._lock_for(ChunkUploadService._session_dir(dashed)))
+            self.assertEqual(2, ChunkUploadService.uploadChunk(dashed, 0, BytesIO(b'ab'), 2)['offset'])
+
+            ChunkUploadService.abort(dashed)
+            with self.assertRaises(BusinessException):
+                ChunkUploadService.uploadChunk(upload_id, 0, BytesIO(b'ab'), 2)
+            self.assertEqual({}, ChunkUploadService._locks)
+
+            upload_id = ChunkUploadService.init({'fileName': 'b.txt', 'fileSize': 4, 'chunkSize': 2})['uploadId']
+            ChunkUploadService.uploadChunk(upload_id, 0, BytesIO(b'ab'), 2)
+            with override_settings(UPLOAD_CHUNK_SESSION_TTL=-1):
+                self.assertEqual(1, ChunkUploadService.cleanExpired())
+            self.assertEqual({}, ChunkUploadService._locks)
+            with self.assertRaises(BusinessException):
+                ChunkUploadService.status(upload_id)
+
+
+class BatchUploadTest(ManagementTestCase):
+    """批量上传（POST /upload/batch）"""
+
+    def test_batch_upload(self):
+        # 文件数量在解析请求时限制；部分文件保存失败时删除已保存的文件
+        files = [SimpleUploadedFile(f"{index}.txt", b'x') for index in range(3)]
+        with override_settings(UPLOAD_BATCH_MAX_FILES=2), mock.patch.object(UploadService, 'uploadBatch') as batch:
+            response = BatchUploadView.as_view()(RequestFactory().post('/upload/batch', {'files': files}))
+        batch.assert_not_called()
+        self.assertEqual(0, response.data['code'])
+
+        storage = get_storage()
+        saved = storage.url('2025/01/saved.txt')
+        with mock.patch.object(UploadService, 'upload', side_effect=[saved, OSError()]), \
+                mock.patch.object(type(storage), 'delete') as delete:
+            with self.assertRaises(OSError):
+                UploadService.uploadBatch(files[:2])
+        delete.assert_called_once_with('2025/01/saved.txt')
@@ -9,5 +9,11 @@ from .clazz import urlpatterns as clazz_urls
 from .student import urlpatterns as student_urls
 from .report import urlpatterns as report_urls
 from .login import urlpatterns as login_urls
+from .metrics import urlpatterns as metrics_urls
+from .batch import urlpatterns as batch_urls
+from .search import urlpatterns as search_urls
+from .sync import urlpatterns as sync_urls
+from .event import urlpatterns as event_urls
+from .async_api import urlpatterns as async_urls
 
-urlpatterns = login_urls + dept_urls + emp_urls + upload_urls + clazz_urls + student_urls + report_urls
+urlpatterns = login_urls + dept_urls + emp_urls + upload_urls + clazz_urls + student_urls + report_urls + metrics_urls + batch_urls + search_urls + sync_urls + event_urls + async_urls
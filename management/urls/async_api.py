@@ -0,0 +1,14 @@
+"""
+异步只读路由 - ASGI 部署下的原生异步路径
+"""
+
+from django.urls import path
+from ..views.async_views import AsyncEmpPageView, AsyncStudentPageView, AsyncClazzPageView, AsyncReportView
+
+urlpatterns = [
+    path('async/emps', AsyncEmpPageView.as_view()),
+    path('async/students', AsyncStudentPageView.as_view()),
+    path('async/clazzs', AsyncClazzPageView.as_view()),
+] + [
+    path(f'async/report/{name}', AsyncReportView.as_view(), {'name': name}) for name in AsyncReportView.REPORTS
+]
@@ -0,0 +1,10 @@
+"""
+批量请求路由
+"""
+
+from django.urls import path
+from ..views.batch_views import BatchView
+
+urlpatterns = [
+    path('batch', BatchView.as_view()),
+]
@@ -4,10 +4,11 @@
 
 from django.urls import path
 from ..views import ClazzListView
-from ..views.clazz_views import ClazzAllView, ClazzDetailView
+from ..views.clazz_views import ClazzAllView, ClazzDetailView, ClazzOptionsView
 
 urlpatterns = [
     path('clazzs', ClazzListView.as_view()),
     path('clazzs/list', ClazzAllView.as_view()),
+    path('clazzs/options', ClazzOptionsView.as_view()),
     path('clazzs/<int:id>', ClazzDetailView.as_view()),
 ]
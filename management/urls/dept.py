@@ -4,8 +4,10 @@
 
 from django.urls import path
 from ..views import DeptListView, DeptDetailView
+from ..views.dept_views import DeptOptionsView
 
 urlpatterns = [
     path('depts', DeptListView.as_view(), name='dept-list'),
+    path('depts/options', DeptOptionsView.as_view(), name='dept-options'),
     path('depts/<int:id>', DeptDetailView.as_view(), name='dept-detail'),
 ]
@@ -4,10 +4,11 @@
 
 from django.urls import path
 from ..views import EmpListView, EmpDetailView
-from ..views.emp_views import EmpAllView
+from ..views.emp_views import EmpAllView, EmpOptionsView
 
 urlpatterns = [
     path('emps', EmpListView.as_view(), name='emp-list'),
     path('emps/list', EmpAllView.as_view(), name='emp-all'),
+    path('emps/options', EmpOptionsView.as_view(), name='emp-options'),
     path('emps/<int:id>', EmpDetailView.as_view(), name='emp-detail'),
 ]
@@ -0,0 +1,10 @@
+"""
+事件流路由
+"""
+
+from django.urls import path
+from ..views.event_views import EventStreamView
+
+urlpatterns = [
+    path('events/stream', EventStreamView.as_view()),
+]
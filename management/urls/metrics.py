@@ -0,0 +1,10 @@
+"""
+运行指标路由
+"""
+
+from django.urls import path
+from ..views.metrics_views import SingleFlightMetricsView
+
+urlpatterns = [
+    path('metrics/singleFlight', SingleFlightMetricsView.as_view()),
+]
@@ -3,12 +3,20 @@
 """
 
 from django.urls import path
-from ..views.report_views import EmpGenderView, EmpJobView, StudentDegreeView, StudentCountView, OperateLogPageView
+from ..views.report_views import (EmpGenderView, EmpJobView, StudentDegreeView, StudentCountView,
+                                  EmpEntryView, StudentGraduationView, ClazzDateView,
+                                  StudentViolationRankView, EmpSalaryView, ReportCubeView, OperateLogPageView)
 
 urlpatterns = [
     path('report/empGenderData', EmpGenderView.as_view()),
     path('report/empJobData', EmpJobView.as_view()),
     path('report/studentDegreeData', StudentDegreeView.as_view()),
     path('report/studentCountData', StudentCountView.as_view()),
+    path('report/empEntryData', EmpEntryView.as_view()),
+    path('report/studentGraduationData', StudentGraduationView.as_view()),
+    path('report/clazzDateData', ClazzDateView.as_view()),
+    path('report/studentViolationRank', StudentViolationRankView.as_view()),
+    path('report/empSalaryData', EmpSalaryView.as_view()),
+    path('report/cube', ReportCubeView.as_view()),
     path('log/page', OperateLogPageView.as_view()),
 ]
@@ -0,0 +1,10 @@
+"""
+搜索路由
+"""
+
+from django.urls import path
+from ..views.search_views import SearchSuggestView
+
+urlpatterns = [
+    path('search/suggest', SearchSuggestView.as_view()),
+]
@@ -0,0 +1,10 @@
+"""
+增量同步路由
+"""
+
+from django.urls import path
+from ..views.sync_views import SyncView
+
+urlpatterns = [
+    path('sync/<str:resource>', SyncView.as_view()),
+]
@@ -4,7 +4,15 @@
 
 from django.urls import path
 from ..views import UploadView
+from ..views.upload_views import (BatchUploadView, ChunkUploadInitView, ChunkUploadView,
+                                  ChunkUploadPartView, ChunkUploadCompleteView)
 
 urlpatterns = [
     path('upload', UploadView.as_view(), name='upload'),
+    path('upload/batch', BatchUploadView.as_view(), name='upload-batch'),
+    # 分片上传（断点续传）
+    path('upload/chunks', ChunkUploadInitView.as_view()),
+    path('upload/chunks/<str:uploadId>', ChunkUploadView.as_view()),
+    path('upload/chunks/<str:uploadId>/complete', ChunkUploadCompleteView.as_view()),
+    path('upload/chunks/<str:uploadId>/<int:index>', ChunkUploadPartView.as_view()),
 ]
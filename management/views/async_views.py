@@ -0,0 +1,94 @@
+"""
+异步只读视图 - ASGI 部署下的原生异步路径（/async/...）
+
+与同名同步接口的参数和响应完全一致，区别：
+- 处理方法为协程，通过异步 ORM 查询，不占用工作线程
+- 分页接口的总数查询和当前页查询并发执行
+- 不经过条件请求（ETag）和响应缓存，每次都查询
+
+同步与异步路径的对比见 python manage.py bench_async
+"""
+
+import logging
+from common.async_support import AsyncAPIView
+from common.exceptions import BusinessException
+from common.result import Result
+from ..serializers.clazz import ClazzPageProjection
+from ..serializers.emp import EmpProjection
+from ..serializers.student import StudentPageProjection
+from ..services.clazz_service import ClazzService
+from ..services.emp_service import EmpService
+from ..services.report_service import ReportService
+from ..services.student_service import StudentService
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEmpPageView(AsyncAPIView):
+    """
+    GET /async/emps - 分页条件查询员工
+    """
+    
+    async def get(self, request):
+        """分页查询"""
+        params = {k: v for k, v in request.GET.items()}
+        logger.info(f"分页查询员工（异步）：{params}")
+        fields = EmpProjection.parse_fields(params.get('fields'))
+        pageResult = await EmpService.apage(params, lambda rows: EmpProjection(rows, fields).adata())
+        return Result.success(pageResult)
+
+
+class AsyncStudentPageView(AsyncAPIView):
+    """
+    GET /async/students - 分页查询学生
+    """
+    
+    async def get(self, request):
+        """分页查询学生"""
+        params = {k: v for k, v in request.GET.items()}
+        logger.info(f"分页查询学生（异步）：{params}")
+        fields = StudentPageProjection.parse_fields(params.get('fields'))
+        pageResult = await StudentService.apage(params, lambda rows: StudentPageProjection(rows, fields).adata())
+        return Result.success(pageResult)
+
+
+class AsyncClazzPageView(AsyncAPIView):
+    """
+    GET /async/clazzs - 分页查询班级
+    """
+    
+    async def get(self, request):
+        """分页查询班级"""
+        params = {k: v for k, v in request.GET.items()}
+        logger.info(f"分页查询班级（异步）：{params}")
+        pageResult = await ClazzService.apage(params, lambda rows: ClazzPageProjection(rows).adata())
+        return Result.success(pageResult)
+
+
+class AsyncReportView(AsyncAPIView):
+    """
+    GET /async/report/<name> - 报表统计（与 /report/<name> 一致）
+    """
+    
+    # 报表名称 → (异步统计方法, 是否接收查询参数)
+    REPORTS = {
+        'empGenderData': (ReportService.agetEmpGenderData, False),
+        'empJobData': (ReportService.agetEmpJobData, False),
+        'studentDegreeData': (ReportService.agetStudentDegreeData, False),
+        'studentCountData': (ReportService.agetStudentCountData, True),
+        'empEntryData': (ReportService.agetEmpEntryData, True),
+        'studentGraduationData': (ReportService.agetStudentGraduationData, True),
+        'clazzDateData': (ReportService.agetClazzDateData, True),
+        'studentViolationRank': (ReportService.agetStudentViolationRank, True),
+        'empSalaryData': (ReportService.agetEmpSalaryData, True),
+    }
+    
+    async def get(self, request, name):
+        """报表统计"""
+        params = {k: v for k, v in request.GET.items()}
+        logger.info(f"报表统计（异步）：{name} {params}")
+        if name not in self.REPORTS:
+            raise BusinessException(f"报表不存在：{name}")
+        method, with_params = self.REPORTS[name]
+        data = await (method(params) if with_params else method())
+        return Result.success(data)
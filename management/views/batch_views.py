@@ -0,0 +1,150 @@
+"""
+批量请求视图 - 一次请求执行多个接口调用
+
+职责：把子请求分发给现有视图执行，汇总结果后统一返回
+外层请求已通过认证中间件，子请求沿用外层请求的认证信息，不再重复认证
+
+执行顺序：
+- 连续的 GET 子请求（只读、互不依赖）在线程池中并发执行
+- POST / PUT / DELETE 子请求按顺序逐个执行，并作为分隔：之后的子请求能读到它的写入结果
+"""
+
+import io
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import close_old_connections
+from django.urls import Resolver404, resolve
+from rest_framework.views import APIView
+from common.exceptions import BusinessException
+from common.result import Result
+
+logger = logging.getLogger(__name__)
+
+# 支持的子请求方法
+BATCH_METHODS = {'GET', 'POST', 'PUT', 'DELETE'}
+
+# 不传给子请求的外层请求头：条件请求头针对的是 /batch 本身，传给子请求会使子请求返回 304
+EXCLUDED_HEADERS = {
+    'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE',
+    'HTTP_IF_RANGE', 'HTTP_RANGE',
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class BatchView(APIView):
+    """
+    POST /batch - 批量执行接口调用
+
+    请求体：{"requests": [{"method": "GET", "url": "/depts"}, {"method": "PUT", "url": "/depts", "body": {...}}]}
+    响应：data 为与 requests 顺序一致的 [{"status": 200, "body": {...}}]
+    """
+    
+    def post(self, request):
+        """批量执行接口调用"""
+        items = request.data.get('requests') if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            raise BusinessException("requests 不能为空")
+        if len(items) > settings.BATCH_MAX_REQUESTS:
+            raise BusinessException(f"单次最多执行 {settings.BATCH_MAX_REQUESTS} 个请求")
+        logger.info(f"批量请求：{[(item.get('method'), item.get('url')) for item in items if isinstance(item, dict)]}")
+        
+        # 1. 按写请求分段：连续的 GET 并发执行，写请求单独顺序执行
+        results = [None] * len(items)
+        reads = []
+        for index, item in enumerate(items):
+            method = str(item.get('method') or 'GET').upper() if isinstance(item, dict) else None
+            if method == 'GET':
+                reads.append(index)
+                continue
+            _run_reads(request, items, reads, results)
+            reads = []
+            results[index] = _dispatch(request, item)
+        _run_reads(request, items, reads, results)
+        
+        return Result.success(results)
+
+
+def _run_reads(request, items: list, indexes: list, results: list) -> None:
+    """并发执行一组 GET 子请求"""
+    if not indexes:
+        return
+    if len(indexes) == 1:
+        results[indexes[0]] = _dispatch(request, items[indexes[0]])
+        return
+
+    def task(index):
+        try:
+            return _dispatch(request, items[index])
+        finally:
+            close_old_connections()
+
+    for index, result in zip(indexes, _get_executor().map(task, indexes)):
+        results[index] = result
+
+
+def _dispatch(request, item) -> dict:
+    """执行单个子请求，返回 {"status": HTTP 状态码, "body": 响应数据}"""
+    # 1. 校验子请求
+    if not isinstance(item, dict) or not isinstance(item.get('url'), str):
+        return _error(400, "子请求格式错误")
+    method = str(item.get('method') or 'GET').upper()
+    url = urlsplit(item['url'])
+    if method not in BATCH_METHODS:
+        return _error(405, f"不支持的请求方法：{method}")
+    try:
+        match = resolve(url.path)
+    except Resolver404:
+        return _error(404, f"接口不存在：{url.path}")
+    view_class = getattr(match.func, 'view_class', None)
+    if view_class is None or not issubclass(view_class, APIView) or view_class is BatchView:
+        return _error(400, f"不支持批量调用的接口：{url.path}")
+
+    # 2. 构造子请求，沿用外层请求的请求头（条件请求头除外）和认证信息
+    body = b''
+    if item.get('body') is not None:
+        body = json.dumps(item['body'], ensure_ascii=False).encode('utf-8')
+    environ = {key: value for key, value in request.META.items() if key.isupper() and key not in EXCLUDED_HEADERS}
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': url.path,
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': url.query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.url_scheme': request.scheme,
+    })
+    sub_request = WSGIRequest(environ)
+    sub_request.emp_id = getattr(request, 'emp_id', None)
+    sub_request.emp_username = getattr(request, 'emp_username', None)
+
+    # 3. 交给原视图执行（视图内的异常已由全局异常处理器转换为响应）
+    response = match.func(sub_request, *match.args, **match.kwargs)
+    if response.streaming:
+        # 大列表为流式响应（见 common.streaming），读完响应体后解析
+        return {'status': response.status_code, 'body': json.loads(b''.join(response.streaming_content))}
+    return {'status': response.status_code, 'body': response.data}
+
+
+def _error(status: int, msg: str) -> dict:
+    return {'status': status, 'body': Result.error_data(msg)}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """延迟创建子请求线程池（进程内单例）"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BATCH_WORKERS,
+                    thread_name_prefix='batch'
+                )
+    return _executor
@@ -8,9 +8,12 @@
 import logging
 from rest_framework.views import APIView
 from ..services import ClazzService
-from ..serializers import ClazzPageSerializer
+from ..services.dimension_cache_service import DimensionCacheService
+from ..serializers import ClazzPageProjection, ClazzProjection
 from common.result import Result
 from common.log_decorator import log_operation
+from common.conditional import conditional_get
+from common.response_cache import cache_response
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +24,15 @@ class ClazzListView(APIView):
     POST /clazzs - 添加班级
     PUT /clazzs - 修改班级
     """
+    cache_tags = ('clazz',)
     
+    @conditional_get(lambda request: ClazzService.getVersion())
     def get(self, request):
         """分页查询班级"""
         params = {k: v for k, v in request.query_params.items()}
         logger.info(f"分页查询班级：{params}")
         pageResult = ClazzService.page(params)
-        return Result.success({
-            'total': pageResult['total'],
-            'rows': ClazzPageSerializer(pageResult['rows'], many=True).data
-        })
+        return Result.stream(ClazzPageProjection(pageResult['rows']).stream(), total=pageResult['total'])
     
     @log_operation
     def post(self, request):
@@ -52,12 +54,13 @@ class ClazzAllView(APIView):
     GET /clazzs/list - 查询所有班级
     """
     
+    @conditional_get(lambda request: ClazzService.getVersion())
+    @cache_response(tags=('clazz',))
     def get(self, request):
         """查询所有班级"""
         logger.info("查询所有班级")
-        from ..serializers import ClazzSerializer
         clazzList = ClazzService.findAll()
-        return Result.success(ClazzSerializer(clazzList, many=True).data)
+        return Result.stream(ClazzProjection(clazzList).stream())
 
 
 class ClazzDetailView(APIView):
@@ -65,7 +68,9 @@ class ClazzDetailView(APIView):
     GET /clazzs/{id} - 根据ID查询班级
     DELETE /clazzs/{id} - 删除班级
     """
+    cache_tags = ('clazz',)
     
+    @conditional_get(lambda request, id: ClazzService.getVersion(id))
     def get(self, request, id):
         """根据ID查询班级"""
         logger.info(f"根据ID查询班级：{id}")
@@ -79,3 +84,16 @@ class ClazzDetailView(APIView):
         logger.info(f"删除班级：{id}")
         ClazzService.delete(id)
         return Result.success()
+
+
+class ClazzOptionsView(APIView):
+    """
+    GET /clazzs/options?prefix=x - 班级下拉选项 [[id, name], ...]
+    """
+    
+    @conditional_get(lambda request: DimensionCacheService.getOptionsVersion('clazz'))
+    def get(self, request):
+        """查询班级下拉选项"""
+        prefix = request.query_params.get('prefix')
+        logger.info(f"查询班级下拉选项：{prefix}")
+        return Result.success(DimensionCacheService.getOptions('clazz', prefix, request.data_version))
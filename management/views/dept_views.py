@@ -8,9 +8,12 @@
 import logging
 from rest_framework.views import APIView
 from ..services import DeptService
-from ..serializers import DeptSerializer
+from ..services.dimension_cache_service import DimensionCacheService
+from ..serializers import DeptSerializer, DeptProjection
 from common.result import Result
 from common.log_decorator import log_operation
+from common.conditional import conditional_get
+from common.response_cache import cache_response
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +25,15 @@ class DeptListView(APIView):
     PUT /depts - 修改部门（id 在 body）
     DELETE /depts?id=x - 删除部门（id 在 query）
     """
+    cache_tags = ('dept',)
     
+    @conditional_get(lambda request: DeptService.getVersion())
+    @cache_response(tags=('dept',))
     def get(self, request):
         """查询所有部门"""
         logger.info("查询所有部门")
         deptList = DeptService.findAll()
-        return Result.success(DeptSerializer(deptList, many=True).data)
+        return Result.success(DeptProjection(deptList).data)
     
     @log_operation
     def post(self, request):
@@ -57,8 +63,22 @@ class DeptDetailView(APIView):
     GET /depts/{id} - 查询部门详情
     """
     
+    @conditional_get(lambda request, id: DeptService.getVersion(id))
     def get(self, request, id):
         """根据ID查询部门"""
         logger.info(f"根据ID查询部门：{id}")
         dept = DeptService.getById(id)
         return Result.success(DeptSerializer(dept).data)
+
+
+class DeptOptionsView(APIView):
+    """
+    GET /depts/options?prefix=x - 部门下拉选项 [[id, name], ...]
+    """
+    
+    @conditional_get(lambda request: DimensionCacheService.getOptionsVersion('dept'))
+    def get(self, request):
+        """查询部门下拉选项"""
+        prefix = request.query_params.get('prefix')
+        logger.info(f"查询部门下拉选项：{prefix}")
+        return Result.success(DimensionCacheService.getOptions('dept', prefix, request.data_version))
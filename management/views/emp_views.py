@@ -8,9 +8,12 @@
 import logging
 from rest_framework.views import APIView
 from ..services import EmpService
-from ..serializers import EmpSerializer, EmpDetailSerializer
+from ..services.dimension_cache_service import DimensionCacheService
+from ..serializers import EmpDetailSerializer, EmpProjection
 from common.result import Result
 from common.log_decorator import log_operation
+from common.conditional import conditional_get
+from common.response_cache import cache_response
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +25,17 @@ class EmpListView(APIView):
     PUT /emps - 更新员工
     DELETE /emps?ids=1,2,3 - 批量删除员工
     """
+    cache_tags = ('emp',)
     
+    @conditional_get(lambda request: EmpService.getVersion())
     def get(self, request):
         """分页查询"""
         # QueryDict 转普通 dict，每个值取单值而非列表
         params = {k: v for k, v in request.query_params.items()}
         logger.info(f"分页查询员工：{params}")
+        fields = EmpProjection.parse_fields(params.get('fields'))
         pageResult = EmpService.page(params)
-        return Result.success({
-            'total': pageResult['total'],
-            'rows': EmpSerializer(pageResult['rows'], many=True).data
-        })
+        return Result.stream(EmpProjection(pageResult['rows'], fields).stream(), total=pageResult['total'])
     
     @log_operation
     def post(self, request):
@@ -63,13 +66,16 @@ class EmpDetailView(APIView):
     GET /emps/{id} - 根据ID查询员工详情
     """
     
+    @conditional_get(lambda request, id: EmpService.getVersion(id))
     def get(self, request, id):
         """根据ID查询员工"""
         logger.info(f"查询员工详情：{id}")
-        result = EmpService.getInfo(id)
+        fields = EmpDetailSerializer.parse_fields(request.query_params.get('fields'))
+        result = EmpService.getInfo(id, fields)
         serializer = EmpDetailSerializer(
             result['emp'], 
-            context={'expr_list': result['exprList']}
+            context={'expr_list': result['exprList']},
+            fields=fields
         )
         return Result.success(serializer.data)
 
@@ -79,8 +85,24 @@ class EmpAllView(APIView):
     GET /emps/list - 查询所有员工
     """
     
+    @conditional_get(lambda request: EmpService.getVersion())
+    @cache_response(tags=('emp', 'dept'))
     def get(self, request):
         """查询所有员工"""
         logger.info("查询所有员工")
+        fields = EmpProjection.parse_fields(request.query_params.get('fields'))
         empList = EmpService.findAll()
-        return Result.success(EmpSerializer(empList, many=True).data)
+        return Result.stream(EmpProjection(empList, fields).stream())
+
+
+class EmpOptionsView(APIView):
+    """
+    GET /emps/options?prefix=x - 员工下拉选项 [[id, name], ...]
+    """
+    
+    @conditional_get(lambda request: DimensionCacheService.getOptionsVersion('emp'))
+    def get(self, request):
+        """查询员工下拉选项"""
+        prefix = request.query_params.get('prefix')
+        logger.info(f"查询员工下拉选项：{prefix}")
+        return Result.success(DimensionCacheService.getOptions('emp', prefix, request.data_version))
@@ -0,0 +1,41 @@
+"""
+事件流视图 - 服务端推送（SSE）
+
+需通过 ASGI 部署（django_tlias/asgi.py），长连接只占用协程，不占用工作线程；
+WSGI 部署时返回错误，避免长连接占满工作线程
+"""
+
+import logging
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from common.events import get_broker
+from common.events.stream import sse_stream
+
+logger = logging.getLogger(__name__)
+
+
+class EventStreamView(View):
+    """
+    GET /events/stream?types=change,log - 订阅变更事件（text/event-stream）
+
+    EventSource 无法设置请求头，令牌可通过查询参数 token 传递；断线重连时自动携带 Last-Event-ID 续传
+    """
+    
+    async def get(self, request):
+        """订阅事件流"""
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({'code': 0, 'msg': '事件流需要通过 ASGI 部署', 'data': None})
+        types = [item for item in request.GET.get('types', '').split(',') if item] or None
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('lastEventId')
+        logger.info(f"订阅事件流：{types}, Last-Event-ID: {last_event_id}")
+        
+        broker = get_broker()
+        subscription = broker.subscribe(last_event_id, types)
+        response = StreamingHttpResponse(sse_stream(broker, subscription, settings.EVENT_STREAM),
+                                         content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # 禁用反向代理（Nginx）缓冲，事件立即送达
+        response['X-Accel-Buffering'] = 'no'
+        return response
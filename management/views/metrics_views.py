@@ -0,0 +1,23 @@
+"""
+运行指标视图 - 极薄 Controller 层
+
+职责：返回进程内的运行统计，供监控和排查使用
+"""
+
+import logging
+from rest_framework.views import APIView
+from common.result import Result
+from common.single_flight import get_stats
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightMetricsView(APIView):
+    """
+    GET /metrics/singleFlight - 请求合并统计（按路由）
+    """
+    
+    def get(self, request):
+        """请求合并统计"""
+        logger.info("查询请求合并统计")
+        return Result.success(get_stats())
@@ -7,16 +7,24 @@
 import logging
 from rest_framework.views import APIView
 from ..services.report_service import ReportService
+from ..services.cube_service import CubeService
 from common.result import Result
+from common.response_cache import cache_response
+from common.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
+# 报表接口响应缓存的新鲜期（秒）- 相关资源的写操作会通过缓存标签立即失效
+REPORT_CACHE_TTL = 300
+
 
 class EmpGenderView(APIView):
     """
     GET /report/empGenderData - 员工性别统计
     """
     
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('emp',))
+    @single_flight
     def get(self, request):
         """员工性别统计"""
         logger.info("员工性别统计")
@@ -29,6 +37,8 @@ class EmpJobView(APIView):
     GET /report/empJobData - 员工职位统计
     """
     
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('emp',))
+    @single_flight
     def get(self, request):
         """员工职位统计"""
         logger.info("员工职位统计")
@@ -41,6 +51,8 @@ class StudentDegreeView(APIView):
     GET /report/studentDegreeData - 学生学历统计
     """
     
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('student',))
+    @single_flight
     def get(self, request):
         """学生学历统计"""
         logger.info("学生学历统计")
@@ -53,10 +65,103 @@ class StudentCountView(APIView):
     GET /report/studentCountData - 班级人数统计
     """
     
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('student', 'clazz'))
+    @single_flight
     def get(self, request):
         """班级人数统计"""
-        logger.info("班级人数统计")
-        data = ReportService.getStudentCountData()
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"班级人数统计：{params}")
+        data = ReportService.getStudentCountData(params)
+        return Result.success(data)
+
+
+class EmpEntryView(APIView):
+    """
+    GET /report/empEntryData - 员工入职人数趋势
+    """
+    
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('emp',))
+    @single_flight
+    def get(self, request):
+        """员工入职人数趋势"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"员工入职人数趋势：{params}")
+        data = ReportService.getEmpEntryData(params)
+        return Result.success(data)
+
+
+class StudentGraduationView(APIView):
+    """
+    GET /report/studentGraduationData - 学员毕业人数趋势
+    """
+    
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('student',))
+    @single_flight
+    def get(self, request):
+        """学员毕业人数趋势"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"学员毕业人数趋势：{params}")
+        data = ReportService.getStudentGraduationData(params)
+        return Result.success(data)
+
+
+class ClazzDateView(APIView):
+    """
+    GET /report/clazzDateData - 班级开课 / 结课数量趋势
+    """
+    
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('clazz',))
+    @single_flight
+    def get(self, request):
+        """班级开课 / 结课数量趋势"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"班级开课/结课数量趋势：{params}")
+        data = ReportService.getClazzDateData(params)
+        return Result.success(data)
+
+
+class StudentViolationRankView(APIView):
+    """
+    GET /report/studentViolationRank - 学员违纪排行（全校 / 班级内，游标分页）
+    """
+    
+    @cache_response(ttl=30, tags=('student', 'clazz'))
+    @single_flight
+    def get(self, request):
+        """学员违纪排行"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"学员违纪排行：{params}")
+        data = ReportService.getStudentViolationRank(params)
+        return Result.success(data)
+
+
+class EmpSalaryView(APIView):
+    """
+    GET /report/empSalaryData - 员工薪资分布统计（按部门、按职位）
+    """
+    
+    @cache_response(ttl=REPORT_CACHE_TTL, tags=('emp', 'dept'))
+    @single_flight
+    def get(self, request):
+        """员工薪资分布统计"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"员工薪资分布统计：{params}")
+        data = ReportService.getEmpSalaryData(params)
+        return Result.success(data)
+
+
+class ReportCubeView(APIView):
+    """
+    GET /report/cube - 即席统计（任意维度组合的计数、求和、分位数、直方图）
+    """
+    
+    # 不使用响应缓存：写操作后快照才重新加载，响应缓存会把旧快照的结果按新标签版本缓存
+    @single_flight
+    def get(self, request):
+        """即席统计"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"即席统计：{params}")
+        data = CubeService.query(params)
         return Result.success(data)
 
 
@@ -65,6 +170,7 @@ class OperateLogPageView(APIView):
     GET /log/page - 操作日志分页查询
     """
     
+    @single_flight
     def get(self, request):
         """操作日志分页查询"""
         page = int(request.query_params.get('page', 1))
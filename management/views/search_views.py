@@ -0,0 +1,24 @@
+"""
+搜索视图 - 极薄 Controller 层
+
+职责：解析 HTTP 输入 → 调用 Service → 返回统一 Result
+"""
+
+import logging
+from rest_framework.views import APIView
+from ..services.search_service import SearchService
+from common.result import Result
+
+logger = logging.getLogger(__name__)
+
+
+class SearchSuggestView(APIView):
+    """
+    GET /search/suggest?q=zs&type=emp,student&limit=10 - 输入联想（姓名 / 学号 / 班级名称前缀，支持拼音）
+    """
+    
+    def get(self, request):
+        """输入联想"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.debug(f"输入联想：{params}")
+        return Result.success(SearchService.suggest(params))
@@ -8,9 +8,10 @@
 import logging
 from rest_framework.views import APIView
 from ..services.student_service import StudentService
-from ..serializers.student import StudentPageSerializer
+from ..serializers.student import StudentPageProjection
 from common.result import Result
 from common.log_decorator import log_operation
+from common.conditional import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -22,16 +23,16 @@ class StudentListView(APIView):
     PUT /students - 修改学生
     DELETE /students?ids=1,2,3 - 批量删除学生
     """
+    cache_tags = ('student',)
     
+    @conditional_get(lambda request: StudentService.getVersion())
     def get(self, request):
         """分页查询学生"""
         params = {k: v for k, v in request.query_params.items()}
         logger.info(f"分页查询学生：{params}")
+        fields = StudentPageProjection.parse_fields(params.get('fields'))
         pageResult = StudentService.page(params)
-        return Result.success({
-            'total': pageResult['total'],
-            'rows': StudentPageSerializer(pageResult['rows'], many=True).data
-        })
+        return Result.stream(StudentPageProjection(pageResult['rows'], fields).stream(), total=pageResult['total'])
     
     @log_operation
     def post(self, request):
@@ -53,18 +54,21 @@ class StudentDetailView(APIView):
     GET /students/{id} - 根据ID查询学生
     """
     
+    @conditional_get(lambda request, id: StudentService.getVersion(id))
     def get(self, request, id):
         """根据ID查询学生"""
         logger.info(f"根据ID查询学生：{id}")
         from ..serializers.student import StudentSerializer
-        student = StudentService.getInfo(id)
-        return Result.success(StudentSerializer(student).data)
+        fields = StudentSerializer.parse_fields(request.query_params.get('fields'))
+        student = StudentService.getInfo(id, fields)
+        return Result.success(StudentSerializer(student, fields=fields).data)
 
 
 class StudentDeleteView(APIView):
     """
     DELETE /students/{ids} - 批量删除学生
     """
+    cache_tags = ('student',)
     
     @log_operation
     def delete(self, request, ids):
@@ -79,6 +83,7 @@ class StudentViolationView(APIView):
     """
     PUT /students/violation/{id}/{score} - 违纪处理
     """
+    cache_tags = ('student',)
     
     @log_operation
     def put(self, request, id, score):
@@ -0,0 +1,41 @@
+"""
+增量同步视图 - 极薄 Controller 层
+
+职责：解析 HTTP 输入 → 调用 Service → 返回统一 Result
+"""
+
+import logging
+from rest_framework.views import APIView
+from ..services.sync_service import SyncService
+from ..serializers import ClazzPageProjection, DeptProjection, EmpProjection
+from ..serializers.student import StudentPageProjection
+from common.result import Result
+
+logger = logging.getLogger(__name__)
+
+# 资源 → 输出序列化器（与对应列表接口的行结构一致）
+SYNC_SERIALIZERS = {
+    'emps': EmpProjection,
+    'students': StudentPageProjection,
+    'clazzs': ClazzPageProjection,
+    'depts': DeptProjection,
+}
+
+
+class SyncView(APIView):
+    """
+    GET /sync/{resource}?since=2024-01-01 00:00:00&cursor=&pageSize=100 - 增量同步（emps、students、clazzs、depts）
+    """
+    
+    def get(self, request, resource):
+        """查询变更数据"""
+        params = {k: v for k, v in request.query_params.items()}
+        logger.info(f"增量同步：{resource}, {params}")
+        result = SyncService.changes(resource, params)
+        return Result.success({
+            'rows': SYNC_SERIALIZERS[resource](result['rows']).data,
+            'deleted': result['deleted'],
+            'nextCursor': result['nextCursor'],
+            'hasMore': result['hasMore'],
+            'resyncRequired': result['resyncRequired'],
+        })
@@ -6,9 +6,12 @@
 
 import logging
 from rest_framework.views import APIView
+from django.conf import settings
 from rest_framework.parsers import MultiPartParser
-from ..services import UploadService
+from ..services import UploadService, ChunkUploadService
 from common.result import Result
+from common.exceptions import BusinessException
+from common.upload_handlers import LimitedTemporaryFileUploadHandler
 
 logger = logging.getLogger(__name__)
 
@@ -29,3 +32,93 @@ class UploadView(APIView):
         url = UploadService.upload(file)
         logger.info(f"文件上传成功, url:{url}")
         return Result.success(url)
+
+
+class BatchUploadView(APIView):
+    """
+    POST /upload/batch - 批量上传文件（表单字段 files，可重复）
+    """
+    parser_classes = [MultiPartParser]
+    
+    def post(self, request):
+        """批量上传文件"""
+        # 1. 替换上传处理器：每个文件边接收边写入临时文件，大小或数量超限立即中止
+        handler = LimitedTemporaryFileUploadHandler(request, settings.UPLOAD_BATCH_MAX_FILE_SIZE,
+                                                    settings.UPLOAD_BATCH_MAX_FILES)
+        request.upload_handlers = [handler]
+        files = request.FILES.getlist('files')
+        if handler.rejected_file:
+            raise BusinessException(f"文件超出大小限制：{handler.rejected_file}")
+        if handler.too_many_files:
+            raise BusinessException(f"单次最多上传 {settings.UPLOAD_BATCH_MAX_FILES} 个文件")
+        if not files:
+            return Result.error("请选择要上传的文件")
+        
+        # 2. 并发保存
+        logger.info(f"批量上传文件：{[file.name for file in files]}")
+        urlList = UploadService.uploadBatch(files)
+        logger.info(f"批量上传成功, urls:{urlList}")
+        return Result.success(urlList)
+
+
+class ChunkUploadInitView(APIView):
+    """
+    POST /upload/chunks - 初始化分片上传会话
+    """
+    
+    def post(self, request):
+        """初始化分片上传"""
+        logger.info(f"初始化分片上传：{request.data}")
+        status = ChunkUploadService.init(request.data)
+        return Result.success(status)
+
+
+class ChunkUploadView(APIView):
+    """
+    GET /upload/chunks/{uploadId} - 查询上传进度（断点续传）
+    DELETE /upload/chunks/{uploadId} - 取消上传
+    """
+    
+    def get(self, request, uploadId):
+        """查询上传进度"""
+        logger.info(f"查询分片上传进度：{uploadId}")
+        return Result.success(ChunkUploadService.status(uploadId))
+    
+    def delete(self, request, uploadId):
+        """取消上传"""
+        logger.info(f"取消分片上传：{uploadId}")
+        ChunkUploadService.abort(uploadId)
+        return Result.success()
+
+
+class ChunkUploadPartView(APIView):
+    """
+    PUT /upload/chunks/{uploadId}/{index} - 上传第 index 个分片
+
+    请求体为分片的原始字节（application/octet-stream），不经过 Parser，
+    直接从请求流按块读取写入临时文件；请求头 X-Chunk-Md5 可选，用于分片校验
+    """
+    
+    def put(self, request, uploadId, index):
+        """上传分片"""
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            raise BusinessException("请求头 Content-Length 不合法")
+        md5 = request.headers.get('X-Chunk-Md5')
+        logger.info(f"上传分片：{uploadId}, 分片：{index}, 大小：{length}")
+        status = ChunkUploadService.uploadChunk(uploadId, index, request.stream, length, md5)
+        return Result.success(status)
+
+
+class ChunkUploadCompleteView(APIView):
+    """
+    POST /upload/chunks/{uploadId}/complete - 合并完成，返回文件 URL
+    """
+    
+    def post(self, request, uploadId):
+        """完成分片上传"""
+        logger.info(f"完成分片上传：{uploadId}")
+        url = ChunkUploadService.complete(uploadId)
+        logger.info(f"文件上传成功, url:{url}")
+        return Result.success(url)
@@ -12,6 +12,7 @@ drop table if exists clazz;
 drop table if exists student;
 drop table if exists operate_log;
 drop table if exists emp_login_log;
+drop table if exists sync_tombstone;
 
 -- 部门表
 create table dept (
@@ -87,6 +88,16 @@ create table student(
                         update_time  datetime  comment '修改时间'
 ) comment '学员表';
 
+-- 违纪排行索引：全校 / 班级内按 (扣分, 次数, ID) 倒序扫描取前 K 名，无需排序全表
+create index idx_student_violation on student (violation_score, violation_count, id);
+create index idx_student_clazz_violation on student (clazz_id, violation_score, violation_count, id);
+
+-- 增量同步索引：按 (修改时间, ID) 顺序扫描变更数据
+create index idx_dept_update_time on dept (update_time, id);
+create index idx_emp_update_time on emp (update_time, id);
+create index idx_clazz_update_time on clazz (update_time, id);
+create index idx_student_update_time on student (update_time, id);
+
 -- 操作日志表
 create table operate_log(
                             id int unsigned primary key auto_increment comment 'ID',
@@ -109,3 +120,12 @@ create table emp_login_log(
                               jwt varchar(1000) comment 'JWT令牌',
                               cost_time bigint unsigned comment '耗时, 单位:ms'
 ) comment '登录日志表';
+
+-- 同步删除记录表：增量同步时通知客户端已删除的数据
+create table sync_tombstone(
+                               id bigint unsigned primary key auto_increment comment 'ID',
+                               resource varchar(20) not null comment '资源（表名）',
+                               row_id int unsigned not null comment '被删除数据的ID',
+                               delete_time datetime(6) not null comment '删除时间',
+                               index idx_sync_tombstone (resource, delete_time, id)
+) comment '同步删除记录表';
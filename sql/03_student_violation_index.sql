@@ -0,0 +1,5 @@
+-- 已有数据库升级：违纪排行索引（新建库已包含在 01_schema.sql 中）
+use tlias;
+
+create index idx_student_violation on student (violation_score, violation_count, id);
+create index idx_student_clazz_violation on student (clazz_id, violation_score, violation_count, id);
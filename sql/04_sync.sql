@@ -0,0 +1,15 @@
+-- 已有数据库升级：增量同步（新建库已包含在 01_schema.sql 中）
+use tlias;
+
+create index idx_dept_update_time on dept (update_time, id);
+create index idx_emp_update_time on emp (update_time, id);
+create index idx_clazz_update_time on clazz (update_time, id);
+create index idx_student_update_time on student (update_time, id);
+
+create table if not exists sync_tombstone(
+                               id bigint unsigned primary key auto_increment comment 'ID',
+                               resource varchar(20) not null comment '资源（表名）',
+                               row_id int unsigned not null comment '被删除数据的ID',
+                               delete_time datetime(6) not null comment '删除时间',
+                               index idx_sync_tombstone (resource, delete_time, id)
+) comment '同步删除记录表';